@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+
+"""Performance benchmarks, run with `python -m benchmarks.<name>`."""
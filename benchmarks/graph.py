@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure modification tracking on payments with many refunds.
+
+A payment is hydrated with its card, its customer and its refunds, every
+refund pointing back to the payment, and left unmodified like an API
+response. Modification checks and JSON representations are then asked on the
+payment and on every refund, like bulk updates do before sending objects,
+before and after a single change in the graph.
+
+Usage:
+    python -m benchmarks.graph [--refunds 10 100 1000] [--rounds 5]
+"""
+
+import argparse
+
+from statistics import median
+from time import perf_counter
+
+from stancer import Payment
+
+from .payments import CARD
+from .payments import CUSTOMER
+from .payments import PAYMENT
+
+API_PAYMENT = {
+    **PAYMENT,
+    'amount': 100000,
+    'card': CARD,
+    'customer': CUSTOMER,
+    'status': 'captured',
+}
+
+
+def build(refunds: int) -> Payment:
+    """Return an unmodified payment with its refunds."""
+    payment = Payment().hydrate(**API_PAYMENT)
+
+    payment.hydrate(
+        refunds=[
+            {
+                'amount': 50,
+                'created': 1538492150,
+                'currency': 'eur',
+                'id': f'refd_{idx:024d}',
+                'payment': payment,
+                'status': 'refunded',
+            }
+            for idx in range(refunds)
+        ]
+    )
+
+    del payment._modified
+
+    for refund in payment.refunds:
+        del refund._modified
+
+    return payment
+
+
+def check(payment: Payment) -> bool:
+    """Tell if the payment or any of its refunds was modified."""
+    modified = payment.is_modified
+
+    for refund in payment.refunds:
+        modified = refund.is_modified or modified
+
+    return modified
+
+
+def run(payment: Payment) -> tuple[float, float, float]:
+    """Return time spent checking, representing and changing the graph."""
+    card = payment.card
+    refunds = payment.refunds
+
+    assert card is not None
+
+    started = perf_counter()
+
+    for _ in range(10):
+        assert not check(payment)
+
+    checking = (perf_counter() - started) / 10
+    started = perf_counter()
+
+    payment.to_json()
+
+    for refund in refunds:
+        refund.to_json()
+
+    representing = perf_counter() - started
+    started = perf_counter()
+
+    # One change, then every object is checked again
+    card.name = 'Jane Doe'
+
+    assert check(payment)
+
+    del card._modified
+
+    changing = perf_counter() - started
+
+    return checking, representing, changing
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--refunds', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'median of {args.rounds} rounds')
+    print(
+        f'{"refunds":<10}{"check all (us)":>18}{"to_json all (us)":>20}{"one change (us)":>18}'
+    )
+
+    for count in args.refunds:
+        payment = build(count)
+        results = [run(payment) for _ in range(args.rounds)]
+
+        print(
+            f'{count:<10}'
+            f'{median(result[0] for result in results) * 1e6:>18.0f}'
+            f'{median(result[1] for result in results) * 1e6:>20.0f}'
+            f'{median(result[2] for result in results) * 1e6:>18.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare JSON codecs on list pages.
+
+Every installed codec decodes the raw bytes of a page of 100 payments, like
+`list()` does, then encodes a payment body, like `send()` does.
+
+Usage:
+    python -m benchmarks.json_codec [--pages 2000] [--rounds 5]
+"""
+
+import argparse
+
+from statistics import median
+from time import perf_counter
+
+from stancer.core import JsonCodec
+from stancer.core import MsgspecCodec
+from stancer.core import OrjsonCodec
+
+from .payments import CARD
+from .payments import PAYMENT
+
+BODY = {**PAYMENT, 'card': CARD}
+
+PAGE = (
+    JsonCodec()
+    .dumps(
+        {
+            'live_mode': False,
+            'payments': [BODY] * 100,
+            'range': {'has_more': True, 'limit': 100, 'start': 0},
+        }
+    )
+    .encode('utf-8')
+)
+
+
+def run(codec: JsonCodec, pages: int) -> tuple[float, float]:
+    """Return time spent decoding pages and encoding bodies."""
+    started = perf_counter()
+
+    for _ in range(pages):
+        codec.loads(PAGE)
+
+    decoding = perf_counter() - started
+    started = perf_counter()
+
+    for _ in range(pages):
+        codec.dumps(BODY)
+
+    return decoding, perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f'{args.pages} pages of 100 payments ({len(PAGE)} bytes), median of {args.rounds} rounds'
+    )
+    print(f'{"codec":<10}{"decode page (us)":>20}{"encode body (us)":>20}')
+
+    for cls in (JsonCodec, MsgspecCodec, OrjsonCodec):
+        try:
+            codec = cls()
+        except ImportError:
+            print(f'{cls.name:<10}{"not installed":>20}')
+            continue
+
+        results = [run(codec, args.pages) for _ in range(args.rounds)]
+        decoding = median(result[0] for result in results) / args.pages * 1e6
+        encoding = median(result[1] for result in results) / args.pages * 1e6
+
+        print(f'{codec.name:<10}{decoding:>20.1f}{encoding:>20.1f}')
+
+
+if __name__ == '__main__':
+    main()
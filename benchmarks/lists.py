@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure hydration of nested object lists.
+
+A payment is hydrated with its refunds, then hydrated again with partial
+refunds, like a payment populated again after a refund, every refund being
+merged in the object already known.
+
+Usage:
+    python -m benchmarks.lists [--refunds 10 100 1000] [--rounds 5]
+"""
+
+import argparse
+
+from statistics import median
+from time import perf_counter
+
+from stancer import Payment
+
+
+def refunds(count: int, status: str) -> list[dict]:
+    """Return refunds as given by the API."""
+    return [
+        {
+            'amount': 50,
+            'created': 1538492150,
+            'currency': 'eur',
+            'id': f'refd_{idx:024d}',
+            'status': status,
+        }
+        for idx in range(count)
+    ]
+
+
+def run(count: int) -> tuple[float, float]:
+    """Return time spent hydrating new refunds, then merging known ones."""
+    payment = Payment('paym_KIVaaHi7G8QAYMQpQOYBrUQE')
+    created = refunds(count, 'to_refund')
+    merged = [
+        {'id': refund['id'], 'status': 'refunded'}
+        for refund in refunds(count, 'refunded')
+    ]
+
+    started = perf_counter()
+    payment.hydrate(refunds=created)
+    creating = perf_counter() - started
+
+    started = perf_counter()
+    payment.hydrate(refunds=merged)
+    merging = perf_counter() - started
+
+    return creating, merging
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--refunds', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'median of {args.rounds} rounds')
+    print(f'{"refunds":<10}{"new (us)":>14}{"merged (us)":>14}')
+
+    for count in args.refunds:
+        results = [run(count) for _ in range(args.rounds)]
+
+        print(
+            f'{count:<10}'
+            f'{median(result[0] for result in results) * 1e6:>14.0f}'
+            f'{median(result[1] for result in results) * 1e6:>14.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure memory held by hydrated payments.
+
+Payments are hydrated from an API response, with their card and customer,
+like `list()` does, and kept in memory, like a reconciliation job does.
+Allocations are traced with `tracemalloc`.
+
+Usage:
+    python -m benchmarks.memory [--payments 10000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from stancer import Payment
+
+from .payments import CARD
+from .payments import CUSTOMER
+from .payments import PAYMENT
+
+ITEM = {**PAYMENT, 'card': CARD, 'customer': CUSTOMER}
+
+
+def run(payments: int) -> tuple[float, float]:
+    """Return bytes held per payment and per object."""
+    items = [
+        {
+            **ITEM,
+            'card': dict(ITEM['card']),
+            'customer': dict(ITEM['customer']),
+        }
+        for _ in range(payments)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [Payment().hydrate(**item) for item in items]
+
+    gc.collect()
+
+    held = tracemalloc.get_traced_memory()[0] - before
+
+    tracemalloc.stop()
+
+    # A payment, its card and its customer
+    objects = len(kept) * 3
+
+    return held / len(kept), held / objects
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--payments', type=int, default=10000)
+    args = parser.parse_args()
+
+    (per_payment, per_object) = run(args.payments)
+
+    print(f'{args.payments} hydrated payments, with their card and customer')
+    print(f'{"bytes per payment":<24}{per_payment:>12.0f}')
+    print(f'{"bytes per object":<24}{per_object:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
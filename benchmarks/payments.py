@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""Objects as given by the API, shared by benchmarks."""
+
+from typing import Any
+
+CARD: dict[str, Any] = {
+    'brand': 'visa',
+    'country': 'FR',
+    'exp_month': 12,
+    'exp_year': 2030,
+    'id': 'card_xH6bRbTnWSVjDBTq0GbtWqWi',
+    'last4': '4242',
+}
+
+CUSTOMER: dict[str, Any] = {
+    'email': 'john.doe@example.org',
+    'id': 'cust_3yE0XX5Lrw3ZkM6qjzzvDvrF',
+    'name': 'John Doe',
+}
+
+PAYMENT: dict[str, Any] = {
+    'amount': 1000,
+    'created': 1538492150,
+    'currency': 'eur',
+    'description': 'Benchmark payment',
+    'id': 'paym_KIVaaHi7G8QAYMQpQOYBrUQE',
+    'method': 'card',
+    'order_id': '815730837',
+    'response': '00',
+    'status': 'to_capture',
+}
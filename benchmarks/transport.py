@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare transports against a local stub API.
+
+Every transport sends the same prepared API call (basic auth, JSON body
+headers, query parameters and timeout, like `Request` does) to a keep-alive
+HTTP server running in a background thread, and decodes the JSON response.
+
+Usage:
+    python -m benchmarks.transport [--calls 2000] [--rounds 5]
+"""
+
+import argparse
+import json
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from statistics import median
+from threading import Thread
+from time import perf_counter
+
+from stancer.core import ConnectionPool
+from stancer.core import Urllib3ConnectionPool
+
+from .payments import PAYMENT
+
+BODY = json.dumps(PAYMENT).encode()
+
+
+RESPONSE = (
+    b'HTTP/1.1 200 OK\r\n'
+    b'Content-Type: application/json\r\n'
+    b'Content-Length: %d\r\n'
+    b'\r\n' % len(BODY)
+) + BODY
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        # One write per response, headers and body sent separately would hit
+        # the delayed ACK timer and measure it instead of the transports.
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(transport, url: str, calls: int) -> float:
+    """Send `calls` requests and return the elapsed time in seconds."""
+    pool = transport()
+    options = {
+        'auth': ('stest_' + 'x' * 24, ''),
+        'data': None,
+        'headers': {'Content-Type': 'application/json'},
+        'params': {'limit': 10},
+        'timeout': 5,
+    }
+
+    pool.request('get', url, **options).json()  # warm up the connection
+
+    started = perf_counter()
+
+    for _ in range(calls):
+        pool.request('get', url, **options).json()
+
+    elapsed = perf_counter() - started
+    pool.close()
+
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{httpd.server_address[1]}/v1/checkout/paym_KIVaaHi7G8QAYMQpQOYBrUQE'
+
+    print(f'{args.calls} calls, median of {args.rounds} rounds')
+    print(f'{"transport":<24}{"total (s)":>12}{"per call (us)":>16}')
+
+    for transport in (ConnectionPool, Urllib3ConnectionPool):
+        elapsed = median(run(transport, url, args.calls) for _ in range(args.rounds))
+
+        print(
+            f'{transport.__name__:<24}{elapsed:>12.3f}{elapsed / args.calls * 1e6:>16.1f}'
+        )
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure validated setters of API objects.
+
+Every public setter of `Payment`, `Card`, `Sepa`, `Customer` and `Device` is
+called with a valid value, like a bulk import does, then with an invalid one
+when the setter refuses some values.
+
+Usage:
+    python -m benchmarks.validators [--calls 20000] [--rounds 5]
+"""
+
+import argparse
+import uuid
+
+from statistics import median
+from time import perf_counter
+from typing import Any
+
+from stancer import Card
+from stancer import Customer
+from stancer import Device
+from stancer import Payment
+from stancer import Sepa
+from stancer.core import AbstractObject
+
+VALUES: dict[type[AbstractObject], dict[str, tuple[Any, Any]]] = {
+    Card: {
+        'cvc': ('123', '12'),
+        'exp_month': (12, 13),
+        'exp_year': (2040, '2040'),
+        'name': ('John Doe', 'J'),
+        'number': ('4242424242424242', '4242424242424241'),
+        'tokenize': (True, 'yes'),
+        'zip_code': ('75001', '1'),
+    },
+    Customer: {
+        'email': ('john.doe@example.org', 'j@o'),
+        'external_id': (str(uuid.uuid4()), 'x' * 40),
+        'mobile': ('+33639980102', '06'),
+        'name': ('John Doe', 'J'),
+    },
+    Device: {
+        'city': ('Paris', None),
+        'country': ('France', None),
+        'http_accept': ('text/html', None),
+        'ip': ('212.27.48.10', '212.27.48'),
+        'languages': ('fr-FR', None),
+        'port': (443, 70000),
+        'user_agent': ('Mozilla/5.0', None),
+    },
+    Payment: {
+        'amount': (1000, 10),
+        'auth': (True, 'yes'),
+        'capture': (False, 'no'),
+        'card': (Card(), 'card'),
+        'currency': ('EUR', 'xxx'),
+        'customer': (Customer(), 'customer'),
+        'description': ('Benchmark payment', 'ab'),
+        'device': (Device(ip='212.27.48.10', port=443), 'device'),
+        'order_id': ('815730837', 'x' * 40),
+        'return_url': ('https://www.example.org/return', 'http://example.org'),
+        'sepa': (Sepa(), 'sepa'),
+        'status': ('capture', 1),
+        'unique_id': (str(uuid.uuid4()), 'x' * 40),
+    },
+    Sepa: {
+        'bic': ('DEUTDEFF', 'DEUT'),
+        'date_mandate': (1541586569, 'today'),
+        'iban': ('FR1420041010050500013M02606', 'FR14'),
+        'mandate': ('mandate-1', 'ab'),
+        'name': ('John Doe', 'J'),
+    },
+}
+
+
+def run(obj: AbstractObject, name: str, value: Any, calls: int) -> float:
+    """Return time spent setting a value, errors included."""
+    started = perf_counter()
+
+    for _ in range(calls):
+        try:
+            setattr(obj, name, value)
+        except (TypeError, ValueError):
+            pass
+
+    return perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{args.calls} calls per setter, median of {args.rounds} rounds')
+    print(f'{"setter":<24}{"valid (ns)":>14}{"invalid (ns)":>14}')
+
+    totals = [0.0, 0.0]
+
+    for cls, setters in VALUES.items():
+        for name, values in setters.items():
+            obj = cls()
+            row = f'{cls.__name__ + "." + name:<24}'
+
+            for idx, value in enumerate(values):
+                if idx and value is None:
+                    row += f'{"-":>14}'
+                    continue
+
+                spent = median(
+                    run(obj, name, value, args.calls) for _ in range(args.rounds)
+                )
+                totals[idx] += spent
+                row += f'{spent / args.calls * 1e9:>14.0f}'
+
+            print(row)
+
+    print(f'{"total (ms)":<24}{totals[0] * 1e3:>14.1f}{totals[1] * 1e3:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
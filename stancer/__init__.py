@@ -4,7 +4,17 @@
 
 from .auth import Auth
 from .card import Card
+from .client import Client
 from .config import Config
+from .core.circuit_breaker import CircuitBreaker
+from .core.hedging import HedgingPolicy
+from .core.prefetch import aprefetch
+from .core.prefetch import prefetch
+from .core.rate_limit import RateLimiter
+from .core.rate_limit import priority
+from .core.retry import RetryPolicy
+from .core.timeout import Timeout
+from .core.timeout import deadline
 from .customer import Customer
 from .device import Device
 from .dispute import Dispute
@@ -19,15 +29,25 @@ from .version import __version__
 __all__ = (
     'Auth',
     'Card',
+    'CircuitBreaker',
+    'Client',
     'Config',
     'Customer',
     'Device',
     'Dispute',
+    'HedgingPolicy',
     'Payment',
+    'RateLimiter',
     'Refund',
+    'RetryPolicy',
     'Sepa',
+    'Timeout',
     'AuthStatus',
     'PaymentStatus',
     'RefundStatus',
     '__version__',
+    'aprefetch',
+    'deadline',
+    'prefetch',
+    'priority',
 )
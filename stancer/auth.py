@@ -2,7 +2,7 @@
 
 
 from .core import AbstractObject
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .core.decorators import validate_type
 from .exceptions import InvalidUrlError
 from .status import AuthStatus
@@ -11,6 +11,8 @@ from .status import AuthStatus
 class Auth(AbstractObject):
     """Representation of an authentication object."""
 
+    __slots__ = ()
+
     _allowed_attributes = [
         'return_url',
         'status',
@@ -19,8 +21,7 @@ class Auth(AbstractObject):
         'status': AuthStatus.REQUEST,
     }
 
-    @property
-    @populate_on_call
+    @field
     def redirect_url(self) -> str | None:
         """
         Redirect URL.
@@ -30,8 +31,7 @@ class Auth(AbstractObject):
         """
         return self._data.get('redirect_url')
 
-    @property
-    @populate_on_call
+    @field
     def return_url(self) -> str | None:
         """
         Return URL.
@@ -47,16 +47,15 @@ class Auth(AbstractObject):
     @return_url.setter
     @validate_type(
         str,
-        validation=lambda v: None
-        if v.startswith('https://')
-        else 'Must be an HTTPS URL',
+        validation=lambda v: (
+            None if v.startswith('https://') else 'Must be an HTTPS URL'
+        ),
         throws=InvalidUrlError,
     )
     def return_url(self, value: str) -> None:
         self._data['return_url'] = value
 
-    @property
-    @populate_on_call
+    @field
     def status(self) -> str | None:
         """
         Current status.
@@ -6,7 +6,7 @@ from .core import AbstractCountry
 from .core import AbstractLast4
 from .core import AbstractName
 from .core import AbstractObject
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .core.decorators import validate_type
 from .exceptions import InvalidCardExpirationMonthError
 from .exceptions import InvalidCardExpirationYearError
@@ -28,6 +28,8 @@ except ImportError:
 class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     """Representation of a card."""
 
+    __slots__ = ()
+
     _ENDPOINT = 'cards'
 
     _allowed_attributes = [
@@ -40,8 +42,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     ]
     _repr_ignore = {'number'}
 
-    @property
-    @populate_on_call
+    @field
     def brand(self) -> str | None:
         """
         Card brand.
@@ -80,8 +81,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
 
         return brand
 
-    @property
-    @populate_on_call
+    @field
     def cvc(self) -> str | None:
         """
         Card Verification Code.
@@ -109,8 +109,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     def cvc(self, value: str) -> None:
         self._data['cvc'] = value
 
-    @property
-    @populate_on_call
+    @field
     def exp_month(self) -> int | None:
         """
         Expiration month.
@@ -137,8 +136,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     def exp_month(self, value: int) -> None:
         self._data['exp_month'] = value
 
-    @property
-    @populate_on_call
+    @field
     def exp_year(self) -> int | None:
         """
         Expiration year.
@@ -163,8 +161,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     def exp_year(self, value: int) -> None:
         self._data['exp_year'] = value
 
-    @property
-    @populate_on_call
+    @field
     def funding(self) -> str | None:
         """
         Type of funding.
@@ -202,8 +199,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
 
         return True
 
-    @property
-    @populate_on_call
+    @field
     def nature(self) -> str | None:
         """
         Nature of the card.
@@ -216,8 +212,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
         """
         return self._data.get('nature')
 
-    @property
-    @populate_on_call
+    @field
     def network(self) -> str | None:
         """
         Card network.
@@ -230,8 +225,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
         """
         return self._data.get('network')
 
-    @property
-    @populate_on_call
+    @field
     def number(self) -> str | None:
         """
         Card number.
@@ -276,8 +270,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
         self._data['number'] = number
         self._data['last4'] = number[-4:]
 
-    @property
-    @populate_on_call
+    @field
     def tokenize(self: Self) -> Self | None:
         """
         Indicate if the card can be reuse later.
@@ -298,8 +291,7 @@ class Card(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     def tokenize(self, value: bool) -> None:
         self._data['tokenize'] = value
 
-    @property
-    @populate_on_call
+    @field
     def zip_code(self) -> str | None:
         """
         City zip code.
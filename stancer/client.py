@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from typing import TypeVar
+
+from .config import Config
+from .core.abstract_object import AbstractObject
+
+ObjectT = TypeVar('ObjectT', bound=AbstractObject)
+
+
+class Client:
+    """
+    API client, with its own credentials, settings and connection pools.
+
+    `Config` is shared by the whole process, a client lets you talk to the API
+    with many accounts at the same time, like a marketplace working for
+    many merchants.
+
+    A client starts with every setting of the current configuration but API
+    keys, and opens its own connection pools.
+
+    Objects use a client in two ways:
+    - bound classes, every object created, listed or populated with
+      `client.bind(Payment)` uses the client, and so do its inner objects;
+    - a scope, every API call made inside `with client.use():` uses the
+      client. The scope only applies to the current thread or asynchronous
+      task, concurrent tasks can use different clients.
+
+    Example:
+        client = Client(['stest_...', 'ptest_...'], timeout=10)
+
+        payment = client.bind(Payment)('paym_...')
+
+        with client.use():
+            customer = Customer('cust_...').populate()
+    """
+
+    def __init__(self, keys: list[str] | str | None = None, **options: Any) -> None:
+        """
+        Create a new client.
+
+        Args:
+            keys: API keys, see `Config.keys`.
+            **options: Any `Config` setting, like `host`, `mode` or `timeout`.
+
+        Raises:
+            StancerValueError: When a key or a setting value is not valid.
+            TypeError: When a setting does not exist.
+        """
+        self._bound: dict[type, Any] = {}
+        self._config = Config().copy()
+
+        if keys is not None:
+            self._config.keys = keys
+
+        for name, value in options.items():
+            prop = getattr(Config, name, None)
+
+            if not isinstance(prop, property) or prop.fset is None:
+                raise TypeError(f'"{name}" is not a configuration setting.')
+
+            setattr(self._config, name, value)
+
+    @property
+    def config(self) -> Config:
+        """
+        Client configuration.
+
+        Returns:
+            Configuration used by the client.
+        """
+        return self._config
+
+    async def aclose(self) -> None:
+        """Close every connection opened by the client, asynchronous ones included."""
+        await self._config.aclose()
+
+    def bind(self, cls: type[ObjectT]) -> type[ObjectT]:
+        """
+        Bind an API object class to the client.
+
+        Args:
+            cls: API object class, like `Payment` or `Customer`.
+
+        Returns:
+            A subclass of `cls` using the client.
+        """
+        bound = self._bound.get(cls)
+
+        if bound is None:
+            namespace: dict[str, Any] = {
+                '__module__': cls.__module__,
+                '__qualname__': cls.__qualname__,
+                '__slots__': (),
+                '_client_config': self._config,
+                # Hydration uses setters of the class itself, the bound one has none
+                '_schema': cls._schema,  # pylint: disable=protected-access
+            }
+
+            bound = self._bound[cls] = type(cls.__name__, (cls,), namespace)
+
+        return bound
+
+    def close(self) -> None:
+        """Close every connection opened by the client."""
+        del self._config.pool
+
+    @contextmanager
+    def use(self) -> Iterator['Client']:
+        """
+        Use the client for every API call made in the context.
+
+        Yields:
+            Current client.
+        """
+        with self._config.scope():
+            yield self
@@ -1,11 +1,40 @@
 # -*- coding: utf-8 -*-
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import timezone
 
+from .core.async_pool import AsyncConnectionPool
+from .core.circuit_breaker import CircuitBreaker
+from .core.hedging import HedgingPolicy
+from .core.json_codec import JsonCodec
+from .core.json_codec import default_codec
+from .core.pool import ConnectionPool
+from .core.rate_limit import RateLimiter
+from .core.retry import RetryPolicy
 from .core.singleton import Singleton
+from .core.timeout import Timeout
+from .core.transport import AbstractTransport
 from .exceptions import StancerValueError
 
+_scoped: ContextVar['Config | None'] = ContextVar('stancer_config', default=None)
 
-class Config(Singleton):
+
+class _ScopedSingleton(type(Singleton)):  # type: ignore
+    """Singleton metaclass giving the configuration scoped to the current context first."""
+
+    def __call__(cls, *args, **kwargs):
+        config = _scoped.get()
+
+        if config is not None:
+            return config
+
+        return super().__call__(*args, **kwargs)
+
+
+# Every setting is a property, kept in its own attribute
+# pylint: disable-next=too-many-instance-attributes, too-many-public-methods
+class Config(Singleton, metaclass=_ScopedSingleton):
     """
     Handle configuration, connection and credential to API.
 
@@ -13,6 +42,9 @@ class Config(Singleton):
     You can instanciate it anywhere and modify your configuration,
     it will be directly applying into the module.
 
+    Inside `Config.scope()`, like while using a `Client`, `Config()` gives
+    the scoped configuration instead, for the current thread or task only.
+
     Constants:
         LIVE_MODE: Used with `Config.mode()` to set live or test API mode.
         TEST_MODE: Used with `Config.mode()` to set live or test API mode.
@@ -23,21 +55,145 @@ class Config(Singleton):
 
     def __init__(self) -> None:
         """Initialize configuration instance."""
+        self._async_pool: AsyncConnectionPool | None = None
+        self._circuit_breaker: CircuitBreaker | None = None
+        self._coalesce = True
+        self._compression_threshold: int | None = None
         self._default_timezone = timezone.utc
+        self._hedging: HedgingPolicy | None = None
         self._host: str | None = None
+        self._json_codec: JsonCodec = JsonCodec()
         self._keys: dict[str, str | None] = {}
+        self._keep_alive: float | None = None
         self._mode: str | None = None
+        self._pool: AbstractTransport | None = None
+        self._pool_connections = 10
+        self._pool_maxsize = 10
         self._port: int | None = None
-        self._timeout: int | None = None
+        self._rate_limiter: RateLimiter | None = None
+        self._retry: RetryPolicy | None = None
+        self._timeout: float | Timeout | None = None
+        self._transport: type[AbstractTransport] = ConnectionPool
         self._version: int | None = None
 
+        del self.circuit_breaker
+        del self.coalesce
+        del self.compression_threshold
+        del self.hedging
         del self.host
+        del self.json_codec
+        del self.keep_alive
         del self.keys
         del self.mode
+        del self.pool_connections
+        del self.pool_maxsize
         del self.port
+        del self.rate_limiter
+        del self.retry
         del self.timeout
+        del self.transport
         del self.version
 
+    @property
+    def async_pool(self) -> AsyncConnectionPool:
+        """
+        Asynchronous HTTP connection pool shared by every asynchronous API call.
+
+        Same as `Config.pool` for `AsyncRequest`, it needs the optional
+        `httpx` dependency.
+
+        Returns:
+            Asynchronous connection pool.
+
+        Raises:
+            ImportError: When `httpx` is not installed.
+        """
+        if self._async_pool is None:
+            self._async_pool = AsyncConnectionPool(
+                connections=self.pool_connections,
+                keep_alive=self.keep_alive,
+                maxsize=self.pool_maxsize,
+            )
+
+        return self._async_pool
+
+    @async_pool.deleter
+    def async_pool(self) -> None:
+        if self._async_pool is not None:
+            self._async_pool.close_later()
+
+        self._async_pool = None
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """
+        Circuit breaker applied to every API call.
+
+        Args:
+            value: New breaker, default `None`, calls are always sent.
+
+        Returns:
+            Circuit breaker.
+        """
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: CircuitBreaker | None) -> None:
+        self._circuit_breaker = value
+
+    @circuit_breaker.deleter
+    def circuit_breaker(self) -> None:
+        self._circuit_breaker = None
+
+    @property
+    def coalesce(self) -> bool:
+        """
+        Share identical GET requests sent at the same time.
+
+        When enabled, concurrent GET requests for the same location, query
+        and API key (like many threads populating the same payment) are sent
+        once, and every caller gets the response.
+
+        Args:
+            value: Enable or disable coalescing, default `True`.
+
+        Returns:
+            Is coalescing enabled ?
+        """
+        return self._coalesce
+
+    @coalesce.setter
+    def coalesce(self, value: bool) -> None:
+        self._coalesce = value
+
+    @coalesce.deleter
+    def coalesce(self) -> None:
+        self._coalesce = True
+
+    @property
+    def compression_threshold(self) -> int | None:
+        """
+        Minimum size, in bytes, of request bodies compressed with gzip.
+
+        Responses are always negotiated compressed, request bodies are only
+        compressed when this is set, the API must accept compressed bodies.
+
+        Args:
+            value: New threshold, default `None`, bodies are sent uncompressed.
+
+        Returns:
+            Compression threshold.
+        """
+        return self._compression_threshold
+
+    @compression_threshold.setter
+    def compression_threshold(self, value: int | None) -> None:
+        self._compression_threshold = value
+
+    @compression_threshold.deleter
+    def compression_threshold(self) -> None:
+        self._compression_threshold = None
+
     @property
     def default_timezone(self) -> timezone:
         """
@@ -59,6 +215,27 @@ class Config(Singleton):
     def default_timezone(self) -> None:
         self._default_timezone = timezone.utc
 
+    @property
+    def hedging(self) -> HedgingPolicy | None:
+        """
+        Hedging policy applied to every GET request.
+
+        Args:
+            value: New policy, default `None`, requests are never duplicated.
+
+        Returns:
+            Hedging policy.
+        """
+        return self._hedging
+
+    @hedging.setter
+    def hedging(self, value: HedgingPolicy | None) -> None:
+        self._hedging = value
+
+    @hedging.deleter
+    def hedging(self) -> None:
+        self._hedging = None
+
     @property
     def host(self) -> str | None:
         """
@@ -80,6 +257,54 @@ class Config(Singleton):
     def host(self) -> None:
         self._host = 'api.stancer.com'
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        """
+        JSON codec used to encode request bodies and decode responses.
+
+        Args:
+            value: New codec, default to the fastest one installed,
+                see `default_codec()`.
+
+        Returns:
+            JSON codec.
+        """
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: JsonCodec) -> None:
+        self._json_codec = value
+
+    @json_codec.deleter
+    def json_codec(self) -> None:
+        self._json_codec = default_codec()
+
+    @property
+    def keep_alive(self) -> float | None:
+        """
+        Idle time, in seconds, before pooled connections are closed.
+
+        Changing it will close the current connection pool.
+
+        Args:
+            value: New idle timeout, default 60 seconds, `None` to keep
+                connections open forever.
+
+        Returns:
+            Keep-alive idle timeout.
+        """
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: float | None) -> None:
+        self._keep_alive = value
+        del self.pool
+
+    @keep_alive.deleter
+    def keep_alive(self) -> None:
+        self._keep_alive = 60
+        del self.pool
+
     @property
     def keys(self) -> dict[str, str | None]:
         """
@@ -179,6 +404,89 @@ class Config(Singleton):
         """
         return self.keys['pprod']
 
+    @property
+    def pool(self) -> AbstractTransport:
+        """
+        HTTP connection pool shared by every API call.
+
+        It is created on first use with `Config.transport`, `Config.pool_connections`,
+        `Config.pool_maxsize` and `Config.keep_alive` settings.
+        Deleting it closes every opened connection and drops the
+        asynchronous pool too.
+
+        Returns:
+            Connection pool.
+        """
+        if self._pool is None:
+            self._pool = self.transport(
+                connections=self.pool_connections,
+                keep_alive=self.keep_alive,
+                maxsize=self.pool_maxsize,
+            )
+
+        return self._pool
+
+    @pool.deleter
+    def pool(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+
+        if self._async_pool is not None:
+            self._async_pool.close_later()
+
+        self._pool = None
+        self._async_pool = None
+
+    @property
+    def pool_connections(self) -> int:
+        """
+        Number of hosts kept in the connection pool.
+
+        Changing it will close the current connection pool.
+
+        Args:
+            value: New pool size, default 10.
+
+        Returns:
+            Pool size.
+        """
+        return self._pool_connections
+
+    @pool_connections.setter
+    def pool_connections(self, value: int) -> None:
+        self._pool_connections = value
+        del self.pool
+
+    @pool_connections.deleter
+    def pool_connections(self) -> None:
+        self._pool_connections = 10
+        del self.pool
+
+    @property
+    def pool_maxsize(self) -> int:
+        """
+        Maximum number of connections kept open per host.
+
+        Changing it will close the current connection pool.
+
+        Args:
+            value: New maximum, default 10.
+
+        Returns:
+            Maximum connections per host.
+        """
+        return self._pool_maxsize
+
+    @pool_maxsize.setter
+    def pool_maxsize(self, value: int) -> None:
+        self._pool_maxsize = value
+        del self.pool
+
+    @pool_maxsize.deleter
+    def pool_maxsize(self) -> None:
+        self._pool_maxsize = 10
+        del self.pool
+
     @property
     def port(self) -> int | None:
         """
@@ -225,6 +533,48 @@ class Config(Singleton):
 
         return self.ptest
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """
+        Rate limiter pacing every API call.
+
+        Args:
+            value: New limiter, default `None`, calls are sent right away.
+
+        Returns:
+            Rate limiter.
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: RateLimiter | None) -> None:
+        self._rate_limiter = value
+
+    @rate_limiter.deleter
+    def rate_limiter(self) -> None:
+        self._rate_limiter = None
+
+    @property
+    def retry(self) -> RetryPolicy | None:
+        """
+        Retry policy applied to every API call.
+
+        Args:
+            value: New policy, default `None`, failed calls are never retried.
+
+        Returns:
+            Retry policy.
+        """
+        return self._retry
+
+    @retry.setter
+    def retry(self, value: RetryPolicy | None) -> None:
+        self._retry = value
+
+    @retry.deleter
+    def retry(self) -> None:
+        self._retry = None
+
     @property
     def secret_key(self) -> str | None:
         """
@@ -259,10 +609,14 @@ class Config(Singleton):
         return self.keys['stest']
 
     @property
-    def timeout(self) -> int | None:
+    def timeout(self) -> float | Timeout | None:
         """
         API timeout.
 
+        A number of seconds limits both the connection and the response, use
+        `Timeout` to split them or to override them on some endpoints.
+        Inside `deadline()`, timeouts are shortened to the time left.
+
         Args:
             value: New timeout, default taken from the requests lib.
 
@@ -272,13 +626,39 @@ class Config(Singleton):
         return self._timeout
 
     @timeout.setter
-    def timeout(self, value: int) -> None:
+    def timeout(self, value: float | Timeout | None) -> None:
         self._timeout = value
 
     @timeout.deleter
     def timeout(self) -> None:
         self._timeout = None
 
+    @property
+    def transport(self) -> type[AbstractTransport]:
+        """
+        Transport class used to create `Config.pool`.
+
+        Changing it will close the current connection pool.
+
+        Args:
+            value: New transport class, default `ConnectionPool`,
+                `Urllib3ConnectionPool` has a lower overhead per call.
+
+        Returns:
+            Transport class.
+        """
+        return self._transport
+
+    @transport.setter
+    def transport(self, value: type[AbstractTransport]) -> None:
+        self._transport = value
+        del self.pool
+
+    @transport.deleter
+    def transport(self) -> None:
+        self._transport = ConnectionPool
+        del self.pool
+
     @property
     def version(self) -> int | None:
         """
@@ -301,3 +681,47 @@ class Config(Singleton):
     @version.deleter
     def version(self) -> None:
         self._version = 1
+
+    async def aclose(self) -> None:
+        """Close every connection pool, asynchronous ones included."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+
+        del self.pool
+
+    def copy(self) -> 'Config':
+        """
+        Create an independent configuration from the current one.
+
+        Every setting is copied but API keys, and the copy will open its own
+        connection pools.
+
+        Returns:
+            New configuration, it is not the singleton.
+        """
+        config = object.__new__(type(self))
+        # Pools are not shared, the copy opens its own
+        config.__dict__.update(self.__dict__, _async_pool=None, _pool=None)
+
+        del config.keys
+
+        return config
+
+    @contextmanager
+    def scope(self) -> Iterator['Config']:
+        """
+        Use this configuration for every API call made in the context.
+
+        The scope is bound to the current thread or asynchronous task, so
+        concurrent tasks can each use a different configuration. Objects
+        bound to a `Client` keep using their own configuration.
+
+        Yields:
+            Current configuration.
+        """
+        token = _scoped.set(self)
+
+        try:
+            yield self
+        finally:
+            _scoped.reset(token)
@@ -4,18 +4,62 @@
 
 from .abstract_amount import AbstractAmount
 from .abstract_country import AbstractCountry
+from .abstract_data import AbstractData
 from .abstract_last4 import AbstractLast4
 from .abstract_name import AbstractName
 from .abstract_object import AbstractObject
 from .abstract_search import AbstractSearch
+from .async_pool import AsyncConnectionPool
+from .async_request import AsyncRequest
+from .circuit_breaker import CircuitBreaker
+from .compression import TransferStats
+from .hedging import HedgingPolicy
+from .json_codec import JsonCodec
+from .json_codec import MsgspecCodec
+from .json_codec import OrjsonCodec
+from .json_codec import default_codec
+from .pool import ConnectionPool
+from .prefetch import aprefetch
+from .prefetch import prefetch
+from .rate_limit import RateLimiter
+from .rate_limit import priority
 from .request import Request
+from .retry import RetryPolicy
+from .single_flight import AsyncSingleFlight
+from .single_flight import SingleFlight
+from .timeout import Timeout
+from .timeout import deadline
+from .transport import AbstractTransport
+from .urllib3_pool import Urllib3ConnectionPool
 
 __all__ = (
     'AbstractAmount',
     'AbstractCountry',
+    'AbstractData',
     'AbstractLast4',
     'AbstractName',
     'AbstractObject',
     'AbstractSearch',
+    'AbstractTransport',
+    'AsyncConnectionPool',
+    'AsyncRequest',
+    'AsyncSingleFlight',
+    'CircuitBreaker',
+    'ConnectionPool',
+    'HedgingPolicy',
+    'JsonCodec',
+    'MsgspecCodec',
+    'OrjsonCodec',
+    'RateLimiter',
     'Request',
+    'RetryPolicy',
+    'SingleFlight',
+    'Timeout',
+    'TransferStats',
+    'Urllib3ConnectionPool',
+    'aprefetch',
+    'deadline',
+    'default_codec',
+    'prefetch',
+    'priority',
 )
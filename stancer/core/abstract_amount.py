@@ -3,13 +3,16 @@ from typing import Any
 
 from ..exceptions import InvalidAmountError
 from ..exceptions import InvalidCurrencyError
-from .decorators import populate_on_call
+from .abstract_data import AbstractData
+from .decorators import field
 from .decorators import validate_type
 
 
-class AbstractAmount:
+class AbstractAmount(AbstractData):
     """Common amount management."""
 
+    __slots__ = ()
+
     _allowed_attributes = [
         'amount',
         'currency',
@@ -19,8 +22,7 @@ class AbstractAmount:
         """Init internal data."""
         self._data: dict[str, Any] = {}
 
-    @property
-    @populate_on_call
+    @field
     def amount(self) -> int | None:
         """
         Payment or refund amount.
@@ -43,8 +45,7 @@ class AbstractAmount:
     def amount(self, value: int) -> None:
         self._data['amount'] = value
 
-    @property
-    @populate_on_call
+    @field
     def currency(self) -> str | None:
         """
         Payment or refund currency.
@@ -1,17 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from .decorators import populate_on_call
+from .abstract_data import AbstractData
+from .decorators import field
 
 
-class AbstractCountry:
+class AbstractCountry(AbstractData):
     """Common country management."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Init internal data."""
         self._data: dict = {}
 
-    @property
-    @populate_on_call
+    @field
     def country(self) -> str | None:
         """
         Card, SEPA, customer, payment country.
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any
+
+
+class AbstractData:  # pylint: disable=too-few-public-methods
+    """
+    Common data storage of API objects and their mixins.
+
+    API objects are kept by hundreds of thousands, by reconciliation jobs
+    for instance, they use slots instead of a dictionary for their
+    attributes. Classes of the library declare `__slots__`, the ones of
+    mixins being empty, the data being stored here. Subclasses without slots
+    get an instance dictionary, and still show the `__dict__` representation
+    of objects.
+    """
+
+    __slots__ = ('_data',)
+
+    _data: dict[str, Any]
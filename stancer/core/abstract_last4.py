@@ -2,18 +2,20 @@
 
 from typing import Any
 
-from .decorators import populate_on_call
+from .abstract_data import AbstractData
+from .decorators import field
 
 
-class AbstractLast4:
+class AbstractLast4(AbstractData):
     """Common country management."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Init internal data."""
         self._data: dict[str, Any] = {}
 
-    @property
-    @populate_on_call
+    @field
     def last4(self) -> str | None:
         """
         Card/Iban number's last 4 digits.
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 
 from ..exceptions import InvalidNameError
-from .decorators import populate_on_call
+from .abstract_data import AbstractData
+from .decorators import field
 from .decorators import validate_type
 
 
-class AbstractName:  # pylint: disable=too-few-public-methods
+class AbstractName(AbstractData):  # pylint: disable=too-few-public-methods
     """Commun name management."""
 
+    __slots__ = ()
+
     _allowed_attributes = [
         'name',
     ]
@@ -16,9 +19,8 @@ class AbstractName:  # pylint: disable=too-few-public-methods
         """Init internal data."""
         self._data = {}
 
-    @property
-    @populate_on_call
-    def name(self) -> str:
+    @field
+    def name(self) -> str | None:
         """
         Customer, card holder or account name.
 
@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 
-import json
+import asyncio
+import gc
+import sys
+import weakref
 
+from collections.abc import Iterator
 from datetime import datetime
+from threading import Lock
+from threading import RLock
 from typing import Any
+from typing import ClassVar
 
 from ..config import Config
-from .decorators import populate_on_call
+from .abstract_data import AbstractData
+from .async_request import AsyncRequest
+from .decorators import field
 from .request import Request
+from .schema import Schema
+from .tracking import Flags
+from .tracking import Items
+from .tracking import add_flag
 
 # This code is a Hack to let us use Self from typing if available, else we use TypeVar
 try:
@@ -18,19 +31,56 @@ except ImportError:
 
     Self = TypeVar('Self', bound='AbstractObject')  # type: ignore
 
-# pylint: disable=too-many-branches
+# pylint: disable=too-many-branches,too-many-statements
 
+_populate_guard = Lock()
+_UNSEEN = sys.maxsize
 
-class AbstractObject:
+
+class AbstractObject(AbstractData):  # pylint: disable=too-many-instance-attributes
     """Manage common code between API object."""
 
+    __slots__ = (
+        '__bypass',
+        '__dependents',
+        '__modified',
+        '__nested',
+        '__populated',
+        '__weakref__',
+        '_bound_config',
+        '_id',
+        '_populate_lock',
+        '_populating',
+        '_raw',
+    )
+
     _ENDPOINT: str | None = None  # pylint: disable=invalid-name
     _allowed_attributes: list[str] = []
+    _bound_config: Config | None
+    _client_config: Config | None = None
     _datetime_property: list[str] = [
         'created',
     ]
     _default_values: dict[str, Any] = {}
+    _populate_lock: 'RLock | None'
+    _populating: asyncio.Future | None
+    _raw: dict[str, Any] | None
     _repr_ignore: set[str] = set()
+    _schema: ClassVar[Schema]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if '__slots__' not in vars(cls):
+            # Classes without slots get an instance dictionary, its descriptor
+            # would hide the representation of their objects. The class
+            # namespace is read only, its mapping is updated in place, then the
+            # schema assignment tells the interpreter the class changed.
+            namespace = gc.get_referents(vars(cls))[0]
+            namespace['__dict__'] = vars(AbstractObject)['__dict__']
+
+        # Classes may share the schema of their parent, like bound ones
+        cls._schema = vars(cls).get('_schema') or Schema(cls)
 
     def __init__(self, uid: str | None = None, **kwargs):
         """
@@ -52,13 +102,21 @@ class AbstractObject:
             An instance of the current object.
         """
         self._id = uid
-        self._data: dict[str, Any] = {}
-        self._bypass = False
-        self._populated = True
-
-        # init modified flags
-        self.__modified: set[str] | None = None
-        del self._modified
+        self._bound_config = self._client_config
+        self._data = {}
+        self._populate_lock = None
+        self._populating = None
+        self._raw = None
+        self.__bypass = False
+        self.__populated = True
+
+        # Modified flags are shared until someone asks for the object ones
+        self.__modified: frozenset[str] | set[str] | None = None
+
+        # Nested modifications once known, or the depth of a running check,
+        # objects relying on it are told when it changes
+        self.__dependents: weakref.ref | dict[int, weakref.ref] | None = None
+        self.__nested: bool | int | None = None
 
         self.hydrate(**self._default_values)
 
@@ -75,15 +133,7 @@ class AbstractObject:
         Returns:
             A simple representation of the current object.
         """
-        representation = {}
-
-        if self.id is not None:
-            representation['id'] = self.id
-
-        for key, value in self._data.items():
-            representation[key] = value
-
-        return representation
+        return self._values()
 
     @__dict__.setter
     def __dict__(self, value: Any):
@@ -96,6 +146,8 @@ class AbstractObject:
         raise ValueError(f'{value} cannot be added to our dataModel')
 
     def __repr__(self) -> str:
+        self._materialise()
+
         args = []
 
         if self.id:
@@ -122,51 +174,58 @@ class AbstractObject:
 
     @_bypass.setter
     def _bypass(self, value: bool) -> None:
+        # Nested objects hydrated meanwhile get it for the call, see `_hydrate_nested`
         self.__bypass = value
 
-        for obj in self._data.values():
-            # pylint: disable=protected-access
-            if isinstance(obj, AbstractObject) and obj.__bypass != value:
-                obj._bypass = value
-
-    @classmethod
-    def _get_allowed_attributes(cls) -> set[str]:
-        allowed = set()
+    @property
+    def _config(self) -> Config:
+        """Configuration used by the object, the one of its client when bound."""
+        config = self._bound_config
 
-        for parent in cls.mro():
-            if hasattr(parent, '_allowed_attributes'):
-                allowed.update(parent._allowed_attributes)  # pylint: disable=protected-access
+        return Config() if config is None else config
 
-        return allowed
+    @classmethod
+    def _get_allowed_attributes(cls) -> frozenset[str]:
+        return cls._schema.allowed
 
     @classmethod
-    def _get_datetime_property(cls) -> set[str]:
-        allowed = set()
+    def _get_datetime_property(cls) -> frozenset[str]:
+        return cls._schema.datetimes
 
-        for parent in cls.mro():
-            if hasattr(parent, '_datetime_property'):
-                allowed.update(parent._datetime_property)  # pylint: disable=protected-access
+    @property
+    def _modified(self) -> set[str]:
+        self._materialise()
 
-        return allowed
+        flags = self.__modified
 
-    @property
-    def _modified(self) -> set[str] | None:
-        return self.__modified
+        if not isinstance(flags, set):
+            # Flags given may be updated, they can not be shared anymore
+            flags = self.__modified = Flags(self._changed, flags or ())
+
+        return flags
 
     @_modified.setter
     def _modified(self, value: str) -> None:
-        if self.__modified is None:
-            self.__modified = {value}
+        flags = self.__modified
+
+        if isinstance(flags, set):
+            flags.add(value)
         else:
-            self.__modified.add(value)
+            self.__modified = add_flag(flags or frozenset(), value)
+            self._changed()
 
     @_modified.deleter
     def _modified(self) -> None:
-        self.__modified = set()
+        self._materialise()
+
+        if self.__modified:
+            self._changed()
+
+        self.__modified = None
 
         for obj in self._data.values():
             # pylint: disable=protected-access
-            if isinstance(obj, AbstractObject) and obj._modified:
+            if isinstance(obj, AbstractObject) and obj.__modified:
                 del obj._modified
 
     @property
@@ -175,6 +234,9 @@ class AbstractObject:
 
     @_populated.setter
     def _populated(self, value: bool) -> None:
+        if self.__populated == value:
+            return
+
         self.__populated = value
 
         for obj in self._data.values():
@@ -196,8 +258,7 @@ class AbstractObject:
     def id(self) -> None:
         self._id = None
 
-    @property
-    @populate_on_call
+    @field
     def created(self) -> datetime | None:
         """
         Return the creation date and time of the current object.
@@ -207,6 +268,23 @@ class AbstractObject:
         """
         return self._data.get('created')
 
+    async def adelete(self: Self) -> Self:
+        """
+        Delete the current object, asynchronously.
+
+        Returns:
+            Current instance.
+
+        Raises:
+            StancerHTTPError: On error during with the API.
+        """
+        await AsyncRequest(self._config).delete(self)
+
+        # Force modified to allow sending it again to the API
+        self._modified = 'id'
+
+        return self
+
     def delete(self: Self) -> Self:
         """
         Delete the current object.
@@ -217,20 +295,106 @@ class AbstractObject:
         Raises:
             StancerHTTPError: On error during with the API.
         """
-        Request().delete(self)
+        Request(self._config).delete(self)
 
         # Force modified to allow sending it again to the API
         self._modified = 'id'
 
         return self
 
-    def _hydrate_list(self, key: str, value: Any) -> list:
-        tmp = getattr(self, key)
-        init_method = '_init_' + key
+    def _load(
+        self: Self, item: dict[str, Any], config: Config, lazy: bool = False
+    ) -> Self:
+        """Fill a new object with an API result, kept raw when `lazy`."""
+        self._bound_config = config
+
+        if not lazy:
+            return self.hydrate(**item)
+
+        # Fields are hydrated from the raw data when read
+        self._id = item.get('id')
+        self._raw = {key: value for key, value in item.items() if key != 'id'}
+
+        return self
+
+    def _materialise(self, *names: str) -> None:
+        """Hydrate fields kept raw by a lazy list, every one without `names`."""
+        raw = self._raw
+
+        if not raw:
+            return
+
+        if names:
+            params = {name: raw.pop(name) for name in names if name in raw}
+        else:
+            (params, raw) = (raw, {})
+
+        # Other raw fields must not be hydrated with these ones
+        self._raw = None
+
+        try:
+            self.hydrate(**params)
+        finally:
+            self._raw = raw or None
+
+        # Nested objects get the state the object gave them since it was listed
+        for key in params:
+            value = self._data.get(key)
+
+            for obj in value if isinstance(value, list) else [value]:
+                # pylint: disable=protected-access
+                if isinstance(obj, AbstractObject):
+                    obj._populated = self.__populated
+
+    def _attach(self, value: Any) -> None:
+        """
+        Give nested objects the client of the object.
+
+        Objects filled with an API response are populated, so are the ones they
+        are given.
+        """
+        populated = self.__bypass and self.__populated
+
+        for obj in value if isinstance(value, list) else [value]:
+            # pylint: disable=protected-access
+            if not isinstance(obj, AbstractObject):
+                continue
+
+            if obj._bound_config is None:
+                obj._bound_config = self._bound_config
+
+            if populated:
+                obj._populated = True
+
+    def _hydrate_nested(self: Self, bypass: bool, params: dict[str, Any]) -> Self:
+        """Hydrate the object in place for the one it is nested in."""
+        (previous, populated) = (self.__bypass, self.__populated)
+
+        # Errors are bypassed like for the other object, setters must not
+        # populate this one meanwhile
+        self.__bypass = bypass
+        self.__populated = True
+
+        try:
+            return self.hydrate(**params)
+        finally:
+            self.__bypass = previous
+            self.__populated = populated
+
+    def _hydrate_list(self, key: str, value: Any) -> Items:
+        """Merge values in the objects already known, matched by their id."""
+        index: dict[str | None, list[AbstractObject]] = {}
         new_values = []
+        seen = set()
+
+        # Known objects keep their place, new ones follow in the given order
+        for obj in self._data.get(key, []):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                new_values.append(obj)
+                index.setdefault(obj.id, []).append(obj)
 
         for current_value in value:
-            missing = True
             val = current_value
 
             if isinstance(current_value, str):
@@ -241,27 +405,43 @@ class AbstractObject:
             else:
                 uid = current_value.get('id')
 
-            for obj in tmp:
-                if obj.id == uid:
-                    missing = False
+            known = index.get(uid)
 
-                    if isinstance(val, AbstractObject):
-                        obj.hydrate(**val.__dict__)
-                    else:
-                        obj.hydrate(**val)
+            if known:
+                for obj in known:
+                    # pylint: disable=protected-access
+                    params = val._values() if isinstance(val, AbstractObject) else val
+                    obj._hydrate_nested(self.__bypass, params)
+
+                continue
 
-                if obj not in new_values:
-                    new_values.append(obj)
+            if not isinstance(val, AbstractObject):
+                cls = self._schema.factory(self, key)
+                val = cls(uid, **val)  # type: ignore[misc]
 
-            if missing:
-                if not isinstance(val, AbstractObject):
-                    cls = getattr(self, init_method)
-                    val = cls(uid, **val)
+            if id(val) not in seen:
+                seen.add(id(val))
+                new_values.append(val)
 
-                if val not in new_values:
-                    new_values.append(val)
+                # Objects without id are never the same
+                if uid is not None:
+                    index[uid] = [val]
 
-        return new_values
+        return Items(self._changed, new_values)
+
+    def _values(self) -> dict[str, Any]:
+        """Return the object data, with its id."""
+        self._materialise()
+
+        representation = {}
+
+        if self.id is not None:
+            representation['id'] = self.id
+
+        for key, value in self._data.items():
+            representation[key] = value
+
+        return representation
 
     def hydrate(self: Self, **params) -> Self:
         """
@@ -274,25 +454,35 @@ class AbstractObject:
         Returns:
             Current instance.
         """
-        config = Config()
+        self._materialise()
+
+        config = self._config
+        schema = self._schema
 
         for key, value in list(params.items()):
             if value is not False and not value:
                 continue
 
+            if key == 'id':
+                self._id = value or None
+
+                continue
+
             modify = True
 
-            if hasattr(self, key):
-                tmp = getattr(self, key)
-                init_method = '_init_' + key
+            if key in schema.fields:
+                # Getters are never called, they could populate the object
+                tmp = self._data.get(key)
+                factory = key in schema.factories
 
                 if (
-                    isinstance(tmp, list)
+                    factory
                     and isinstance(value, list)
-                    and hasattr(self, init_method)
+                    and isinstance(self._data.get(key, []), list)
                 ):
                     value = self._hydrate_list(key, value)
                     modify = not all(isinstance(val, AbstractObject) for val in value)
+                    tmp = value
 
                 if isinstance(tmp, datetime):
                     tmp = None
@@ -300,8 +490,8 @@ class AbstractObject:
                 if tmp is None and isinstance(value, AbstractObject):
                     (tmp, value) = (value, {})
 
-                if tmp is None and hasattr(self, init_method):
-                    tmp = getattr(self, init_method)
+                if tmp is None and factory:
+                    tmp = schema.factory(self, key)
 
                 if callable(tmp):
                     modify = False
@@ -316,42 +506,141 @@ class AbstractObject:
                 ):
                     val = {'id': value} if not isinstance(value, dict) else value
 
-                    # pylint: disable=protected-access
-
                     modify = False
-                    populated = tmp._populated
-                    tmp._populated = True
-                    value = tmp.hydrate(**val)
-                    value._populated = populated
+                    value = tmp._hydrate_nested(self.__bypass, val)  # pylint: disable=protected-access
+
+            if self._bound_config is not None or (self.__bypass and self.__populated):
+                self._attach(value)
 
-            if key in self._get_datetime_property() and isinstance(value, int):
+            if key in schema.datetimes and isinstance(value, int):
                 value = datetime.fromtimestamp(value, tz=config.default_timezone)
 
-            if key == 'id':
-                self._id = value
-            else:
-                applied = False
+            applied = False
+            setter = schema.setters.get(key)
 
-                try:
-                    # because we override the __dict__ method,
-                    # mypy is a little lost on the correct type.
-                    prop = self.__class__.__dict__.get(key)  # type: ignore # (see above)
+            try:
+                if setter is not None:
+                    setter(self, value)
+                    applied = True
+            except ValueError:
+                if not self._bypass:
+                    raise
 
-                    if prop is not None and prop.fset is not None:
-                        prop.fset(self, value)
-                        applied = True
-                except ValueError:
-                    if not self._bypass:
-                        raise
+            if not applied:
+                self._data[key] = value
 
-                if not applied:
-                    self._data[key] = value
+                if modify:
+                    self._modified = key
 
-                    if modify:
-                        self._modified = key
+        if params:
+            # Nested objects may have been replaced without any flag
+            self._changed()
 
         return self
 
+    def _changed(self) -> None:
+        """Forget the nested state of the object, and of every object relying on it."""
+        self.__nested = None
+
+        dependents = self.__dependents
+
+        if dependents is None:
+            return
+
+        self.__dependents = None
+
+        for ref in (
+            dependents.values() if isinstance(dependents, dict) else [dependents]
+        ):
+            obj = ref()
+
+            if obj is not None:
+                obj._changed()  # pylint: disable=protected-access
+
+    def _check(self, depth: int) -> tuple[bool, int]:
+        """
+        Tell if the object or a nested one was modified.
+
+        Known states are kept until the object, or a nested one, changes. Objects
+        leading back to one still being checked count it as not modified, their
+        states are not kept, only the one of the first object checked is.
+
+        Args:
+            depth: Number of objects being checked before this one.
+
+        Returns:
+            Was it modified, and the depth of the first object being checked seen.
+        """
+        self._materialise()
+
+        state = self.__nested
+
+        if self.__modified or state is True:
+            return (True, _UNSEEN)
+
+        if state is False:
+            return (False, _UNSEEN)
+
+        if state is not None:
+            return (False, state)
+
+        self.__nested = depth
+        modified = False
+        seen = _UNSEEN
+
+        for obj in self._nested():
+            # pylint: disable=protected-access
+            (modified, first) = obj._check(depth + 1)
+            obj._depend(self)
+            seen = min(seen, first)
+
+            if modified:
+                break
+
+        if modified or seen >= depth:
+            self.__nested = modified
+
+            return (modified, _UNSEEN)
+
+        self.__nested = None
+
+        return (False, seen)
+
+    def _depend(self, obj: 'AbstractObject') -> None:
+        """Register an object to change with this one."""
+        ref = weakref.ref(obj)
+        dependents = self.__dependents
+
+        if isinstance(dependents, dict):
+            dependents[id(obj)] = ref
+
+            return
+
+        other = dependents() if dependents is not None else None
+
+        if dependents is None or other is None or other is obj:
+            self.__dependents = ref
+        else:
+            self.__dependents = {id(other): dependents, id(obj): ref}
+
+    def _nested(self) -> Iterator['AbstractObject']:
+        """Yield nested objects, with the ones in lists."""
+        for key, value in self._data.items():
+            if key not in self._schema.allowed:
+                continue
+
+            if isinstance(value, AbstractObject):
+                yield value
+
+            if isinstance(value, list):
+                if not isinstance(value, Items):
+                    # Lists are watched, they can be changed in place
+                    value = self._data[key] = Items(self._changed, value)
+
+                for val in value:
+                    if isinstance(val, AbstractObject):
+                        yield val
+
     @property
     def is_complete(self) -> bool:
         """
@@ -372,22 +661,11 @@ class AbstractObject:
         Returns
             Was it modified ?
         """
-        if self._modified is not None and len(self._modified) > 0:
-            return True
+        if self.__nested is False and not self.__modified:
+            # Nothing changed since the last check
+            return False
 
-        for key, value in self._data.items():
-            if key not in self._get_allowed_attributes():
-                continue
-
-            if isinstance(value, AbstractObject) and value.is_modified:
-                return True
-
-            if isinstance(value, list):
-                for val in value:
-                    if isinstance(val, AbstractObject) and val.is_modified:
-                        return True
-
-        return False
+        return self._check(0)[0]
 
     @property
     def is_not_complete(self) -> bool:
@@ -431,8 +709,7 @@ class AbstractObject:
         """
         return self._populated
 
-    @property
-    @populate_on_call
+    @field
     def live_mode(self) -> bool | None:
         """
         Indicate if we are in live or test mode.
@@ -444,6 +721,68 @@ class AbstractObject:
         """
         return self._data.get('live_mode')
 
+    def _changes(self) -> dict[str, Any]:
+        """Return the fields modified locally, kept over the API data."""
+        return {
+            key: self._data[key] for key in self.__modified or () if key in self._data
+        }
+
+    def _keep(self, changes: dict[str, Any]) -> None:
+        """Put back fields modified locally, they are still to be sent."""
+        for key, value in changes.items():
+            self._data[key] = value
+            self._modified = key
+
+    def _populate_with(self, data: dict[str, Any]) -> None:
+        """Populate the object with API data, like the ones fetched by `prefetch()`."""
+        changes = self._changes()
+
+        self._populated = True
+        self.__bypass = True
+
+        try:
+            self.hydrate(**data)
+        finally:
+            self.__bypass = False
+
+        del self._modified
+        self._keep(changes)
+
+    async def apopulate(self: Self) -> Self:
+        """
+        Populate the current object, asynchronously.
+
+        See `AbstractObject.populate()`.
+
+        Returns:
+            Current instance.
+        """
+        populating = self._populating
+
+        if populating is not None:
+            # Another task is already populating this object, share its call
+            await asyncio.shield(populating)
+
+            return self
+
+        if self.id is not None and self._ENDPOINT is not None and not self._populated:
+            self._populated = True
+            self._populating = asyncio.get_running_loop().create_future()
+            changes = self._changes()
+
+            try:
+                await AsyncRequest(self._config).get(self)
+
+                del self._modified
+                self._keep(changes)
+            finally:
+                self._populating.set_result(None)
+                self._populating = None
+
+        self._populated = True
+
+        return self
+
     def populate(self: Self) -> Self:
         """
         Populate the current object.
@@ -454,13 +793,61 @@ class AbstractObject:
         Returns:
             Current instance.
         """
-        if self.id is not None and self._ENDPOINT is not None and not self._populated:
-            self._populated = True
-            Request().get(self)
+        if self._populated and self._populate_lock is None:
+            return self
 
-            del self._modified
+        # Threads populating the same object wait for the first one,
+        # the lock only lives while the object is being populated.
+        with _populate_guard:
+            lock = self._populate_lock
+            owner = lock is None
 
-        self._populated = True
+            if lock is None:
+                lock = self._populate_lock = RLock()
+
+        try:
+            with lock:
+                if (
+                    self.id is not None
+                    and self._ENDPOINT is not None
+                    and not self._populated
+                ):
+                    self._populated = True
+                    changes = self._changes()
+                    Request(self._config).get(self)
+
+                    del self._modified
+                    self._keep(changes)
+
+                self._populated = True
+        finally:
+            if owner:
+                self._populate_lock = None
+
+        return self
+
+    async def asend(self: Self) -> Self:
+        """
+        Save the current object, asynchronously.
+
+        See `AbstractObject.send()`.
+
+        Returns:
+            Current instance.
+
+        Raises:
+            StancerHTTPError: On error during with the API (may be child instance
+                of StancerHTTPError).
+        """
+        self._materialise()
+
+        if self.__modified:
+            if self.id is None:
+                await AsyncRequest(self._config).post(self)
+            else:
+                await AsyncRequest(self._config).patch(self)
+
+        del self._modified
 
         return self
 
@@ -477,11 +864,13 @@ class AbstractObject:
             StancerHTTPError: On error during with the API (may be child instance
                 of StancerHTTPError).
         """
-        if self._modified:
+        self._materialise()
+
+        if self.__modified:
             if self.id is None:
-                Request().post(self)
+                Request(self._config).post(self)
             else:
-                Request().patch(self)
+                Request(self._config).patch(self)
 
         del self._modified
 
@@ -499,7 +888,7 @@ class AbstractObject:
         Returns:
             A JSON representation of the current object.
         """
-        return json.dumps(self.to_json_repr(), separators=(',', ':'))
+        return self._config.json_codec.dumps(self.to_json_repr())
 
     def to_json_repr(self) -> dict[str, Any] | str:
         """
@@ -508,18 +897,21 @@ class AbstractObject:
         Returns:
             A JSON still as a dictionnary.
         """
+        self._materialise()
+
         representation: dict[str, Any] = {}
 
         if self.id is not None and self.is_not_modified:
             return self.id
 
+        modified = self.__modified or ()
         items = {
             key: value
             for key, value in self._data.items()
-            if key in self._get_allowed_attributes()
+            if key in self._schema.allowed
             and value is not None
             and (
-                (self._modified is not None and key in self._modified)
+                key in modified
                 or (isinstance(value, AbstractObject) and value.is_modified)
             )
         }
@@ -548,7 +940,7 @@ class AbstractObject:
         Returns:
             Uniform Resource Identifier.
         """
-        conf = Config()
+        conf = self._config
         port = ''
 
         if conf.port is not None:
@@ -563,3 +955,6 @@ class AbstractObject:
             location += '/' + self.id
 
         return location
+
+
+AbstractObject._schema = Schema(AbstractObject)  # pylint: disable=protected-access
@@ -1,15 +1,35 @@
 # -*- coding: utf-8 -*-
 
-import json
+import asyncio
+import sys
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Sequence
+from contextlib import suppress
+from contextvars import copy_context
 from datetime import datetime
+from queue import Queue
+from threading import Event
+from threading import Semaphore
+from threading import Thread
 from time import time
+from typing import Any
 
+from requests import RequestException
+
+from ..config import Config
 from ..exceptions import InvalidSearchFilter
 from ..exceptions import InvalidSearchResponse
 from ..exceptions import NotFoundError
+from ..exceptions import StancerException
+from .abstract_object import AbstractObject
+from .async_request import AsyncRequest
+from .prefetch import aprefetch
+from .prefetch import prefetch as prefetch_nested
+from .rate_limit import BATCH
+from .rate_limit import get_priority
+from .rate_limit import priority
 from .request import Request
 
 # This code is a Hack to let us use Self from typing if available, else we use TypeVar
@@ -21,10 +41,14 @@ except ImportError:
 
     Self = TypeVar('Self', bound='AbstractSearch')  # type: ignore
 
+MAX_LIMIT = 100
+
 
 class AbstractSearch(ABC):
     """Common search method."""
 
+    __slots__ = ()
+
     @classmethod
     def filter_list_params(cls, **kwargs) -> dict:  # pylint: disable=unused-argument
         """
@@ -53,32 +77,59 @@ class AbstractSearch(ABC):
             Current instance.
         """
 
-    @classmethod
-    def list(
-        cls,
-        created: int | float | datetime | None = None,
-        limit: int | None = None,
-        start: int | None = None,
-        **kwargs,
-    ):
+    @abstractmethod
+    def _load(
+        self: Self, item: dict[str, Any], config: Config, lazy: bool = False
+    ) -> Self:
         """
-        List elements.
+        Fill a new object with an API result.
 
         Args:
-            created: must be an unix timestamp or a datetime object which will
-                filter payments equal to or greater than this value.
-            limit: must be an integer between 1 and 100 and will limit the number of
-                objects to be returned.
-            start: must be an integer, will be used as a pagination cursor,
-                starts at 0.
-            kwargs: Arbitrary keyword argument.
+            item: Object data, as received.
+            config: Configuration used by the object.
+            lazy: Keep the data raw, fields are hydrated when read.
 
         Returns:
-            Generator.
+            Current instance.
         """
 
+    @classmethod
+    def _searcher(cls) -> tuple[AbstractObject, Config]:
+        """Return an empty object requesting the pages, and its configuration."""
+        obj = cls()
+
+        if isinstance(obj, AbstractObject):
+            return (obj, obj._config)  # pylint: disable=protected-access
+
+        raise TypeError(f'"{cls.__name__}" is not an API object.')
+
+    @classmethod
+    def _build_page(cls, items: list[dict], config: Config, lazy: bool = False) -> list:
+        """Create objects of a page of results."""
+
+        return [cls()._load(item, config, lazy) for item in items]
+
+    @classmethod
+    def _list_params(
+        cls,
+        created: float | datetime | None = None,
+        limit: int | None = None,
+        start: int | None = None,
+        exhaustive: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Validate list filters and build query parameters."""
+
         params = cls.filter_list_params(**kwargs)
 
+        if exhaustive:
+            if limit is not None:
+                raise InvalidSearchFilter(
+                    'Limit can not be used on an exhaustive list.'
+                )
+
+            limit = MAX_LIMIT
+
         if created is not None:
             if isinstance(created, datetime):
                 created = created.timestamp()
@@ -97,7 +148,7 @@ class AbstractSearch(ABC):
             params['created'] = created
 
         if limit is not None:
-            if not isinstance(limit, int) or limit < 1 or limit > 100:
+            if not isinstance(limit, int) or limit < 1 or limit > MAX_LIMIT:
                 raise InvalidSearchFilter('Limit must be between 1 and 100.')
 
             params['limit'] = limit
@@ -111,36 +162,292 @@ class AbstractSearch(ABC):
         if not params:
             raise InvalidSearchFilter('Invalid search filters.')
 
-        request = Request()
-        obj = cls()
+        return params
 
-        def gen():
+    @classmethod
+    def _read_page(
+        cls,
+        content: bytes,
+        params: dict[str, Any],
+        config: Config,
+    ) -> tuple[list, bool]:
+        """
+        Decode a page of results and move the pagination cursor.
+
+        Returns items of the page and whether there is more pages.
+        """
+
+        try:
+            response = config.json_codec.loads(content)
+        except ValueError as err:
+            raise InvalidSearchResponse('Invalid results.') from err
+
+        keys = list(response.keys() - ['live_mode', 'range'])
+
+        if len(keys) != 1:
+            raise InvalidSearchResponse('Results not found.')
+
+        key = keys[0]
+        has_more = response['range']['has_more']
+        params['start'] = response['range']['start'] + response['range']['limit']
+
+        return (response[key], has_more)
+
+    @classmethod
+    def alist(  # pylint: disable=too-many-arguments, too-many-locals
+        cls,
+        created: float | datetime | None = None,
+        limit: int | None = None,
+        start: int | None = None,
+        *,
+        read_ahead: int = 1,
+        exhaustive: bool = False,
+        prefetch: Sequence[str] = (),
+        lazy: bool = False,
+        **kwargs,
+    ):
+        """
+        List elements, asynchronously.
+
+        Works like `list()` but returns an asynchronous generator.
+        With `read_ahead`, next pages are requested in the background while
+        you are consuming the current one.
+
+        Args:
+            created: must be an unix timestamp or a datetime object which will
+                filter payments equal to or greater than this value.
+            limit: must be an integer between 1 and 100 and will limit the number of
+                objects to be returned.
+            start: must be an integer, will be used as a pagination cursor,
+                starts at 0.
+            read_ahead: number of pages requested ahead, in a task, while you
+                are consuming the current one. Default to 1, use 0 to request
+                a page only when the previous one is consumed.
+            exhaustive: use the biggest page size allowed, to minimise the
+                number of calls, can not be used with `limit`. Pages are
+                requested with the batch priority, see `priority()`.
+            prefetch: nested objects populated for a whole page before it is
+                given, like `('customer', 'card')`, see `stancer.prefetch()`.
+            lazy: keep the data of every object as it was received, a field
+                is only hydrated, with its dates and nested objects, when read
+                for the first time. Faster when only a few fields are read.
+            kwargs: Arbitrary keyword argument.
+
+        Returns:
+            Asynchronous generator.
+        """
+
+        params = cls._list_params(
+            created=created,
+            limit=limit,
+            start=start,
+            exhaustive=exhaustive,
+            **kwargs,
+        )
+
+        if not isinstance(read_ahead, int) or read_ahead < 0:
+            raise InvalidSearchFilter('Read ahead must be a positive integer.')
+
+        (obj, config) = cls._searcher()
+        request = AsyncRequest(config)
+        # Exhaustive scans are background work, other calls keep the caller priority
+        rank = BATCH if exhaustive else get_priority()
+
+        async def fetch() -> tuple[list, bool]:
+            try:
+                with priority(rank):
+                    content = await request.get_content(obj, **params)
+            except NotFoundError:
+                return ([], False)
+
+            return cls._read_page(content, params, config)
+
+        async def pages():
+            has_more = True
+
+            while has_more:
+                (items, has_more) = await fetch()
+
+                yield items
+
+        async def read_ahead_pages():
+            queue: asyncio.Queue = asyncio.Queue()
+            # The page being consumed plus the ones requested ahead
+            slots = asyncio.Semaphore(read_ahead + 1)
+
+            async def produce():
+                has_more = True
+                error = None
+
+                try:
+                    while has_more:
+                        await slots.acquire()
+                        (items, has_more) = await fetch()
+                        await queue.put(items)
+                except (StancerException, RequestException) as err:
+                    error = err
+                finally:
+                    # Pages end on any error, the consumer raises it instead of waiting
+                    queue.put_nowait(error or sys.exc_info()[1])
+
+            task = asyncio.create_task(produce())
+
+            try:
+                while True:
+                    page = await queue.get()
+
+                    if page is None:
+                        break
+
+                    if isinstance(page, BaseException):
+                        raise page
+
+                    yield page
+
+                    slots.release()
+            finally:
+                task.cancel()
+
+                with suppress(asyncio.CancelledError):
+                    await task
+
+        async def gen():
+            async for items in read_ahead_pages() if read_ahead else pages():
+                results = cls._build_page(items, config, lazy)
+
+                if prefetch:
+                    await aprefetch(results, *prefetch)
+
+                for result in results:
+                    yield result
+
+        return gen()
+
+    @classmethod
+    def list(  # pylint: disable=too-many-arguments, too-many-locals
+        cls,
+        created: float | datetime | None = None,
+        limit: int | None = None,
+        start: int | None = None,
+        *,
+        read_ahead: int = 0,
+        exhaustive: bool = False,
+        prefetch: Sequence[str] = (),
+        lazy: bool = False,
+        **kwargs,
+    ):
+        """
+        List elements.
+
+        Args:
+            created: must be an unix timestamp or a datetime object which will
+                filter payments equal to or greater than this value.
+            limit: must be an integer between 1 and 100 and will limit the number of
+                objects to be returned.
+            start: must be an integer, will be used as a pagination cursor,
+                starts at 0.
+            read_ahead: number of pages requested ahead, on a worker thread,
+                while you are consuming the current one. Default to 0, a page
+                is only requested when the previous one is consumed.
+            exhaustive: use the biggest page size allowed, to minimise the
+                number of calls, can not be used with `limit`. Pages are
+                requested with the batch priority, see `priority()`.
+            prefetch: nested objects populated for a whole page before it is
+                given, like `('customer', 'card')`, see `stancer.prefetch()`.
+            lazy: keep the data of every object as it was received, a field
+                is only hydrated, with its dates and nested objects, when read
+                for the first time. Faster when only a few fields are read.
+            kwargs: Arbitrary keyword argument.
+
+        Returns:
+            Generator.
+        """
+
+        params = cls._list_params(
+            created=created,
+            limit=limit,
+            start=start,
+            exhaustive=exhaustive,
+            **kwargs,
+        )
+
+        if not isinstance(read_ahead, int) or read_ahead < 0:
+            raise InvalidSearchFilter('Read ahead must be a positive integer.')
+
+        (obj, config) = cls._searcher()
+        request = Request(config)
+        # Exhaustive scans are background work, other calls keep the caller priority
+        rank = BATCH if exhaustive else get_priority()
+
+        def fetch() -> tuple[list, bool]:
+            try:
+                with priority(rank):
+                    content = request.get_content(obj, **params)
+            except NotFoundError:
+                return ([], False)
+
+            return cls._read_page(content, params, config)
+
+        def pages():
             has_more = True
 
             while has_more:
+                (items, has_more) = fetch()
+
+                yield items
+
+        def read_ahead_pages():
+            queue: Queue = Queue()
+            # The page being consumed plus the ones requested ahead
+            slots = Semaphore(read_ahead + 1)
+            stop = Event()
+
+            def produce():
+                has_more = True
+                error = None
+
                 try:
-                    response = json.loads(request.get(obj, update=False, **params))
+                    while has_more:
+                        slots.acquire()  # pylint: disable=consider-using-with
+
+                        if stop.is_set():
+                            return
 
-                    keys = list(response.keys() - ['live_mode', 'range'])
+                        (items, has_more) = fetch()
+                        queue.put(items)
+                except (StancerException, RequestException) as err:
+                    error = err
+                finally:
+                    # Pages end on any error, the consumer raises it instead of waiting
+                    queue.put(error or sys.exc_info()[1])
 
-                    if len(keys) != 1:
-                        raise InvalidSearchResponse('Results not found.')
+            # Pages are requested with the deadline and the scope of the consumer
+            Thread(target=copy_context().run, args=(produce,), daemon=True).start()
 
-                    key = keys[0]
-                    has_more = response['range']['has_more']
-                    params['start'] = (
-                        response['range']['start'] + response['range']['limit']
-                    )
+            try:
+                while True:
+                    page = queue.get()
 
-                    for item in response[key]:
-                        yield cls().hydrate(**item)
+                    if page is None:
+                        break
 
-                except NotFoundError:
-                    has_more = False
+                    if isinstance(page, BaseException):
+                        raise page
+
+                    yield page
+
+                    slots.release()
+            finally:
+                stop.set()
+                slots.release()
+
+        def gen():
+            for items in read_ahead_pages() if read_ahead else pages():
+                results = cls._build_page(items, config, lazy)
 
-                except json.JSONDecodeError as err:
-                    has_more = False
+                if prefetch:
+                    prefetch_nested(results, *prefetch)
 
-                    raise InvalidSearchResponse('Invalid results.') from err
+                yield from results
 
         return gen()
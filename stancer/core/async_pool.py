@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import requests
+
+from .compression import TransferStats
+from .timeout import Timeout
+from .transport import build_response
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+
+class AsyncConnectionPool:
+    """
+    Long-lived asynchronous HTTP connection pool.
+
+    Asynchronous counterpart of `ConnectionPool`, used by `AsyncRequest`.
+    It needs the optional `httpx` dependency (`pip install stancer[async]`).
+
+    An HTTP client is bound to the event loop it runs on, a new one is
+    created if the pool is used from another loop. A client is closed when
+    its loop shuts down, like at the end of `asyncio.run()`, or on its loop
+    when it is replaced.
+    """
+
+    def __init__(
+        self,
+        connections: int = 10,
+        maxsize: int = 10,
+        keep_alive: float | None = 60,
+        transport: Any = None,
+    ) -> None:
+        """
+        Create a new pool.
+
+        Args:
+            connections: Number of hosts kept in the pool.
+            maxsize: Maximum number of connections kept open per host.
+            keep_alive: Number of seconds an idle connection is kept open,
+                `None` to never close it.
+            transport: Custom `httpx` transport, mainly used for testing.
+
+        Raises:
+            ImportError: When `httpx` is not installed.
+        """
+        if httpx is None:
+            message = 'Async support needs "httpx", install "stancer[async]".'
+
+            raise ImportError(message)
+
+        self._connections = connections
+        self._maxsize = maxsize
+        self._keep_alive = keep_alive
+        self._transport = transport
+
+        self._client: Any = None
+        self._closer: AsyncGenerator[None, None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._clients = 0
+        self._requests = 0
+
+        self.transfer = TransferStats()
+
+    @staticmethod
+    async def _closing(client: Any) -> AsyncGenerator[None, None]:
+        """Keep a client opened, loops close asynchronous generators when shutting down."""
+        try:
+            yield
+        finally:
+            await client.aclose()
+
+    async def _get_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._loop is not loop:
+            self.close_later()
+
+            limits = httpx.Limits(
+                max_connections=self._connections * self._maxsize,
+                max_keepalive_connections=self._maxsize,
+                keepalive_expiry=self._keep_alive,
+            )
+
+            client = httpx.AsyncClient(limits=limits, transport=self._transport)
+            closer = self._closing(client)
+
+            await anext(closer)
+
+            self._client = client
+            self._closer = closer
+            self._loop = loop
+            self._clients += 1
+
+        return self._client
+
+    @property
+    def connections(self) -> int:
+        """
+        Number of hosts kept in the pool.
+
+        Returns:
+            Number of host pools.
+        """
+        return self._connections
+
+    @property
+    def keep_alive(self) -> float | None:
+        """
+        Idle time, in seconds, before connections are closed.
+
+        Returns:
+            Keep-alive idle timeout.
+        """
+        return self._keep_alive
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of connections kept open per host.
+
+        Returns:
+            Connections per host.
+        """
+        return self._maxsize
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Pool statistics.
+
+        `requests` is the number of requests sent through the pool and
+        `clients` the number of HTTP clients created (one per event loop).
+        Bytes exchanged and saved by compression are added, see `TransferStats`.
+
+        Returns:
+            Pool statistics.
+        """
+        return {
+            'clients': self._clients,
+            'requests': self._requests,
+            **self.transfer.stats,
+        }
+
+    async def close(self) -> None:
+        """Close every opened connection."""
+        closer = self._closer
+
+        self._client = None
+        self._closer = None
+        self._loop = None
+
+        if closer is not None:
+            await closer.aclose()
+
+    def close_later(self) -> None:
+        """
+        Close every opened connection on the event loop of the HTTP client.
+
+        Usable without a running loop or from another one, the client is
+        closed as soon as its loop runs. Clients of closed loops were closed
+        when their loop shut down.
+        """
+        closer = self._closer
+        loop = self._loop
+
+        self._client = None
+        self._closer = None
+        self._loop = None
+
+        if closer is not None and loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(closer.aclose(), loop)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: str | bytes | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send an HTTP request on a pooled connection.
+
+        Arguments are the same as `ConnectionPool.request`, the response is
+        converted to a `requests.Response`, and transport errors to
+        `requests.Timeout` or `requests.ConnectionError`, so both pools can be
+        handled the same way.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            data: Request body.
+            kwargs: `auth`, `headers`, `params` and `timeout`, split timeouts
+                also limit the wait for a free connection.
+
+        Returns:
+            API response.
+
+        Raises:
+            requests.ConnectionError: When the connection failed.
+            requests.Timeout: When the request timed out.
+        """
+        client = await self._get_client()
+        self._requests += 1
+
+        timeout = kwargs.get('timeout')
+
+        if isinstance(timeout, Timeout):
+            kwargs['timeout'] = httpx.Timeout(
+                connect=timeout.connect,
+                read=timeout.read,
+                write=timeout.read,
+                pool=timeout.pool,
+            )
+
+        try:
+            response = await client.request(method, url, content=data, **kwargs)
+        except httpx.TimeoutException as err:
+            raise requests.Timeout(str(err)) from err
+        except httpx.TransportError as err:
+            raise requests.ConnectionError(str(err)) from err
+
+        return build_response(
+            response.status_code,
+            response.reason_phrase,
+            response.headers,
+            str(response.url),
+            response.content,
+        )
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from time import monotonic
+from typing import TYPE_CHECKING
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from ..exceptions import DeadlineExceededError
+from ..exceptions import StancerHTTPError
+from .rate_limit import parse_retry_after
+from .request import Request
+from .single_flight import AsyncSingleFlight
+from .timeout import expires_within
+
+# Coroutines follow the same steps as synchronous requests
+# pylint: disable=duplicate-code
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from .abstract_object import AbstractObject
+    from .compression import TransferStats
+    from .hedging import HedgingPolicy
+    from .rate_limit import RateLimiter
+
+# This code is a Hack to let us use Self from typing if available, else we use TypeVar
+try:
+    # Self is available in Python 3.11
+    from typing import Self  # type: ignore # pylint: disable=ungrouped-imports
+except ImportError:
+    from typing import TypeVar
+
+    Self = TypeVar('Self', bound='AsyncRequest')  # type: ignore
+
+
+_in_flight = AsyncSingleFlight()
+
+
+class AsyncRequest(Request):
+    """
+    Asynchronous API request manager.
+
+    Same as `Request` but every method is a coroutine, requests are sent
+    through `Config.async_pool` and follow the same `Config.retry`, `Config.circuit_breaker`
+    and `Config.hedging` policies.
+    """
+
+    # Coroutines replace the methods of `Request`
+    # pylint: disable=invalid-overridden-method
+
+    async def delete(self: Self, obj: 'AbstractObject') -> Self | str:  # type: ignore # async override
+        """
+        Send a DELETE HTTP request.
+
+        Args:
+            obj: Target object.
+
+        Returns:
+            Current instance of AsyncRequest.
+        """
+        return await self._request('delete', obj)
+
+    async def get(  # type: ignore # async override
+        self: Self,
+        obj,
+        update: bool = True,
+        **kwargs,
+    ) -> Self | str:
+        """
+        Send a GET HTTP request.
+
+        Args:
+            obj: Target object.
+            update: Do we update the object ?
+            kwargs: Query parameters.
+
+        Returns:
+            Current instance of AsyncRequest.
+        """
+        return await self._request('get', obj, update, **kwargs)
+
+    async def get_content(self, obj: 'AbstractObject', **kwargs) -> bytes:  # type: ignore # async override
+        """
+        Send a GET HTTP request and return the raw response body.
+
+        See `Request.get_content()`.
+
+        Args:
+            obj: Target object.
+            kwargs: Query parameters.
+
+        Returns:
+            Response body.
+        """
+        options = self._prepare('get', obj, **kwargs)
+        response = await self._send(options)
+
+        if not response.ok:
+            raise StancerHTTPError(response)
+
+        return response.content
+
+    async def patch(self: Self, obj: 'AbstractObject') -> Self | str:  # type: ignore # async override
+        """
+        Send a PATCH HTTP request.
+
+        Args:
+            obj: Target object.
+
+        Returns:
+            Current instance of AsyncRequest.
+        """
+        return await self._request('patch', obj)
+
+    async def post(self: Self, obj: 'AbstractObject') -> Self | str:  # type: ignore # async override
+        """
+        Send a POST HTTP request.
+
+        Args:
+            obj: Target object.
+
+        Returns:
+            Current instance of AsyncRequest.
+        """
+        return await self._request('post', obj)
+
+    async def _admit(  # type: ignore # async override
+        self,
+        options: dict[str, Any],
+    ) -> tuple['RateLimiter | None', Any]:
+        """Wait for `Config.rate_limiter`, returns the limiter and the bucket key."""
+
+        limiter = self._conf.rate_limiter
+
+        if limiter is None:
+            return (None, None)
+
+        key = limiter.key(options['auth'][0], urlsplit(options['url']).path)
+        await limiter.aacquire(key)
+
+        return (limiter, key)
+
+    async def _request(  # type: ignore # async override
+        self: Self,
+        method: str,
+        obj: 'AbstractObject',
+        update: bool = True,
+        **kwargs,
+    ) -> Self | str:
+        """Handle "delete", "get", "patch" and "post" method."""
+
+        options = self._prepare(method, obj, **kwargs)
+        response = await self._send(options)
+
+        return self._handle(method, obj, response, update)
+
+    async def _send(self, options: dict[str, Any]) -> 'Response':  # type: ignore # async override
+        """Send the request, concurrent identical GET requests share the same call."""
+
+        if options['method'] != 'get' or not self._conf.coalesce:
+            return await self._send_retry(options)
+
+        return await _in_flight.do(
+            self._flight_key(options), lambda: self._send_retry(options)
+        )
+
+    async def _send_retry(self, options: dict[str, Any]) -> 'Response':  # type: ignore # async override
+        """Send the request, and send it again when `Config.retry` allows it."""
+
+        policy = self._conf.retry
+        method = options['method']
+        started = monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                response = await self._send_attempt(options)
+            except DeadlineExceededError:
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                if policy is None or not policy.can_retry(method):
+                    raise
+
+                delay = policy.next_delay(attempt, monotonic() - started)
+
+                if delay is None or expires_within(delay):
+                    raise
+            else:
+                if (
+                    policy is None
+                    or response.ok
+                    or not policy.can_retry(method, response.status_code)
+                ):
+                    return response
+
+                delay = policy.next_delay(
+                    attempt,
+                    monotonic() - started,
+                    parse_retry_after(response.headers.get('Retry-After')),
+                )
+
+                if delay is None or expires_within(delay):
+                    return response
+
+            await asyncio.sleep(delay)
+
+    async def _send_attempt(self, options: dict[str, Any]) -> 'Response':  # type: ignore # async override
+        """Send the request once, hedged when `Config.hedging` is set."""
+
+        policy = self._conf.hedging
+
+        if policy is None or options['method'] != 'get':
+            return await self._send_once(options)
+
+        return await self._send_hedged(policy, options)
+
+    async def _send_hedged(  # type: ignore # async override
+        self,
+        policy: 'HedgingPolicy',
+        options: dict[str, Any],
+    ) -> 'Response':
+        """Send a duplicate of a slow request, use the first response and cancel the other."""
+
+        policy.track()
+
+        tasks = [asyncio.ensure_future(self._send_timed(policy, options))]
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=policy.delay)
+
+            if done or not policy.acquire():
+                return await tasks[0]
+
+            tasks.append(asyncio.ensure_future(self._send_timed(policy, options)))
+            pending = set(tasks)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    if task.exception() is None:
+                        if task is tasks[1]:
+                            policy.won()
+
+                        return task.result()
+
+            # Both failed, the original error is raised
+            return tasks[0].result()
+        finally:
+            for task in tasks:
+                if task.done():
+                    if not task.cancelled():
+                        task.exception()
+                else:
+                    task.cancel()
+
+    async def _send_once(self, options: dict[str, Any]) -> 'Response':  # type: ignore # async override
+        """Send the request once, through the rate limiter and the circuit breaker."""
+
+        (limiter, key) = await self._admit(options)
+        response = None
+
+        try:
+            timeout = self._timeout(options)
+            self._before_send(options)
+
+            try:
+                response = await self._conf.async_pool.request(
+                    **{**options, 'timeout': timeout}
+                )
+            except Exception:
+                self._after_send(options)
+                raise
+            except BaseException:
+                # Cancelled, the host did not fail but a probe may be held
+                self._abort_send(options)
+                raise
+
+            self._after_send(options, response)
+        finally:
+            self._dismiss(limiter, key, response)
+
+        return response
+
+    async def _send_timed(  # type: ignore # async override
+        self,
+        policy: 'HedgingPolicy',
+        options: dict[str, Any],
+    ) -> 'Response':
+        """Send the request once and record its latency."""
+
+        started = monotonic()
+        response = await self._send_once(options)
+
+        policy.record(monotonic() - started)
+
+        return response
+
+    def _transfer(self) -> 'TransferStats':
+        """Transfer statistics of the pool used to send requests."""
+
+        return self._conf.async_pool.transfer
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from threading import Lock
+from time import monotonic
+
+from ..exceptions import CircuitOpenError
+
+Listener = Callable[[str, str, str], None]
+
+
+class _Circuit:
+    """Breaker state of one host."""
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened = 0.0
+        self.probes = 0
+        self.state = CircuitBreaker.CLOSED
+
+
+class CircuitBreaker:
+    """
+    Stop calling an API host when it keeps failing.
+
+    Every host has its own circuit, starting `closed`: calls go through and
+    consecutive failures (5xx responses, timeouts and connection errors) are
+    counted. After `threshold` failures the circuit goes `open`, every call
+    to that host is rejected with a `CircuitOpenError` without being sent.
+
+    After `recovery` seconds the circuit goes `half_open`, up to `probes`
+    calls are let through. The first successful probe closes the circuit,
+    a failed one opens it again for another `recovery` period.
+
+    Listeners are called on every state change with the host, the previous
+    state and the new one.
+
+    Constants:
+        CLOSED: Calls are sent.
+        HALF_OPEN: A limited number of probe calls are sent.
+        OPEN: Calls are rejected.
+    """
+
+    CLOSED = 'closed'  # pylint: disable=invalid-name
+    HALF_OPEN = 'half_open'  # pylint: disable=invalid-name
+    OPEN = 'open'  # pylint: disable=invalid-name
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        recovery: float = 30,
+        probes: int = 1,
+        listeners: Iterable[Listener] | None = None,
+    ) -> None:
+        """
+        Create a new breaker.
+
+        Args:
+            threshold: Consecutive failures needed to open a circuit.
+            recovery: Number of seconds a circuit stays open.
+            probes: Number of concurrent probe calls in half-open state.
+            listeners: Callables notified of state changes.
+        """
+        self.threshold = threshold
+        self.recovery = recovery
+        self.probes = probes
+        self.listeners: list[Listener] = list(listeners or [])
+
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = Lock()
+
+    def _change(
+        self,
+        host: str,
+        circuit: _Circuit,
+        state: str,
+        changes: list[tuple[str, str, str]],
+    ) -> None:
+        """Update a circuit state and keep track of the change."""
+        changes.append((host, circuit.state, state))
+
+        circuit.failures = 0
+        circuit.probes = 0
+        circuit.state = state
+
+        if state == self.OPEN:
+            circuit.opened = monotonic()
+
+    def _notify(self, changes: list[tuple[str, str, str]]) -> None:
+        """Call listeners, outside of the lock."""
+        for change in changes:
+            for listener in self.listeners:
+                listener(*change)
+
+    def acquire(self, host: str) -> None:
+        """
+        Ask for the permission to call a host.
+
+        Every granted call must be followed by a call to `record()`, or to
+        `release()` when it ended without an outcome.
+
+        Args:
+            host: Target host.
+
+        Raises:
+            CircuitOpenError: When the circuit is open, or when every probe
+                slot is taken in half-open state.
+        """
+        changes: list[tuple[str, str, str]] = []
+
+        try:
+            with self._lock:
+                circuit = self._circuits.setdefault(host, _Circuit())
+
+                if circuit.state == self.OPEN:
+                    remaining = self.recovery - (monotonic() - circuit.opened)
+
+                    if remaining > 0:
+                        raise CircuitOpenError(host, remaining)
+
+                    self._change(host, circuit, self.HALF_OPEN, changes)
+
+                if circuit.state == self.HALF_OPEN:
+                    if circuit.probes >= self.probes:
+                        raise CircuitOpenError(host)
+
+                    circuit.probes += 1
+        finally:
+            self._notify(changes)
+
+    def record(self, host: str, failed: bool) -> None:
+        """
+        Record the outcome of a call granted by `acquire()`.
+
+        Args:
+            host: Target host.
+            failed: Did the call fail ?
+        """
+        changes: list[tuple[str, str, str]] = []
+
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+
+            if circuit.state == self.HALF_OPEN:
+                state = self.OPEN if failed else self.CLOSED
+                self._change(host, circuit, state, changes)
+            elif not failed:
+                circuit.failures = 0
+            elif circuit.state == self.CLOSED:
+                circuit.failures += 1
+
+                if circuit.failures >= self.threshold:
+                    self._change(host, circuit, self.OPEN, changes)
+
+        self._notify(changes)
+
+    def release(self, host: str) -> None:
+        """
+        Give back a call granted by `acquire()`, without outcome.
+
+        Used for cancelled or interrupted calls, which tell nothing about the
+        host: the state is kept, a probe slot is freed in half-open state.
+
+        Args:
+            host: Target host.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+
+            if circuit is not None and circuit.probes:
+                circuit.probes -= 1
+
+    def reset(self, host: str | None = None) -> None:
+        """
+        Close a circuit, or every circuit when no host is given.
+
+        Args:
+            host: Host to reset.
+        """
+        changes: list[tuple[str, str, str]] = []
+
+        with self._lock:
+            hosts = list(self._circuits) if host is None else [host]
+
+            for name in hosts:
+                circuit = self._circuits.get(name)
+
+                if circuit is not None and circuit.state != self.CLOSED:
+                    self._change(name, circuit, self.CLOSED, changes)
+
+        self._notify(changes)
+
+    def state(self, host: str) -> str:
+        """
+        Current state of a host circuit.
+
+        An open circuit stays reported as open until a call is attempted
+        after its recovery period.
+
+        Args:
+            host: Target host.
+
+        Returns:
+            One of `CLOSED`, `HALF_OPEN` or `OPEN`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+
+            if circuit is None:
+                return self.CLOSED
+
+            return circuit.state
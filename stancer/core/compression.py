@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+
+from importlib.util import find_spec
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+def _accept_encoding() -> str:
+    """Content codings every transport is able to decode."""
+    encodings = ['gzip', 'deflate']
+
+    if find_spec('brotli') is not None or find_spec('brotlicffi') is not None:
+        encodings.append('br')
+
+    return ', '.join(encodings)
+
+
+ACCEPT_ENCODING = _accept_encoding()
+
+
+def compress(data: bytes, threshold: int | None) -> bytes | None:
+    """
+    Compress a request body with gzip.
+
+    Args:
+        data: Request body.
+        threshold: Minimum body size, in bytes, to compress,
+            `None` to never compress.
+
+    Returns:
+        Compressed body, `None` when the body is not compressed.
+    """
+    if threshold is None or len(data) < threshold:
+        return None
+
+    return gzip.compress(data, mtime=0)
+
+
+def body_size(body: str | bytes, encoding: str | None) -> tuple[int, int]:
+    """
+    Number of body bytes sent on the network for a request.
+
+    Args:
+        body: Request body, as sent.
+        encoding: `Content-Encoding` of the body.
+
+    Returns:
+        Size of the body as sent, and before compression.
+    """
+    data = body.encode('utf-8') if isinstance(body, str) else body
+
+    if encoding != 'gzip':
+        return (len(data), len(data))
+
+    # The gzip trailer ends with the uncompressed size, modulo 2 ** 32
+    return (len(data), int.from_bytes(data[-4:], 'little'))
+
+
+def wire_size(response: 'Response') -> int:
+    """
+    Number of body bytes received on the network for a response.
+
+    Args:
+        response: API response, already read.
+
+    Returns:
+        Size of the body as received, before decompression.
+    """
+    size = len(response.content)
+
+    if response.headers.get('Content-Encoding', 'identity') == 'identity':
+        return size
+
+    tell = getattr(response.raw, 'tell', None)
+
+    if tell is not None:
+        return tell()
+
+    return int(response.headers.get('Content-Length', size))
+
+
+class TransferStats:
+    """
+    Count bytes exchanged by a connection pool, and bytes saved by compression.
+
+    `sent_bytes` and `received_bytes` are body sizes as sent and received on
+    the network, `sent_saved` and `received_saved` the difference with
+    uncompressed bodies, and `compressed` the number of compressed
+    request bodies.
+    """
+
+    def __init__(self) -> None:
+        """Create new counters."""
+        self._lock = Lock()
+        self._compressed = 0
+        self._received_bytes = 0
+        self._received_saved = 0
+        self._sent_bytes = 0
+        self._sent_saved = 0
+
+    def received(self, wire: int, decoded: int) -> None:
+        """
+        Count a response body.
+
+        Args:
+            wire: Size received on the network.
+            decoded: Size after decompression.
+        """
+        with self._lock:
+            self._received_bytes += wire
+            self._received_saved += decoded - wire
+
+    def sent(self, wire: int, raw: int) -> None:
+        """
+        Count a request body.
+
+        Args:
+            wire: Size sent on the network.
+            raw: Size before compression.
+        """
+        with self._lock:
+            if wire != raw:
+                self._compressed += 1
+
+            self._sent_bytes += wire
+            self._sent_saved += raw - wire
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Transfer statistics.
+
+        Returns:
+            Transfer statistics.
+        """
+        return {
+            'compressed': self._compressed,
+            'received_bytes': self._received_bytes,
+            'received_saved': self._received_saved,
+            'sent_bytes': self._sent_bytes,
+            'sent_saved': self._sent_saved,
+        }
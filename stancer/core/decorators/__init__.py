@@ -2,10 +2,12 @@
 
 """Internal decorators."""
 
+from .field import field
 from .populate_on_call import populate_on_call
 from .validate_type import validate_type
 
 __all__ = (
+    'field',
     'populate_on_call',
     'validate_type',
 )
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    # Type checkers only handle getters and setters of `property` itself
+    from builtins import property as field
+else:
+
+    class field(property):  # pylint: disable=invalid-name
+        """
+        Property of an API field, populating the object when the field is missing.
+
+        Used like `property`, it replaces `property` and `populate_on_call`:
+        the getter is returned as it is once the object is populated, or when it
+        gives a value. Only a field missing from the object data populates it,
+        a `False`, `0` or empty value already known never calls the API.
+
+        Objects from a lazy list keep their raw data, a field is hydrated from it
+        when read for the first time, every one of them before a modification.
+        """
+
+        _name: str | None = None
+
+        def __set_name__(self, owner: type, name: str) -> None:
+            self._name = name
+
+        def __set__(self, obj: Any, value: Any) -> None:
+            if getattr(obj, '_raw', None):
+                obj._materialise()
+
+            super().__set__(obj, value)
+
+        def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+            if obj is None:
+                return self
+
+            raw = getattr(obj, '_raw', None)
+
+            if raw and self._name in raw:
+                obj._materialise(self._name)
+
+            value = self.fget(obj)  # type: ignore[misc]
+
+            if value or self._name in obj._data:
+                return value
+
+            # Populated objects only wait for a concurrent population
+            if getattr(obj, '_populated', False) and obj._populate_lock is None:
+                return value
+
+            populate = getattr(obj, 'populate', None)
+
+            if populate is None:
+                return value
+
+            populate()
+
+            return self.fget(obj)  # type: ignore[misc]
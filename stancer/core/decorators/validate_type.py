@@ -1,141 +1,181 @@
 # -*- coding: utf-8 -*-
 
+from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
+from typing import Any
 
 from ...config import Config
 
-# pylint: disable=too-many-branches, too-many-statements, too-many-locals
+# pylint: disable=too-many-branches, too-many-locals
 
+# Checks are given the value and the original one, before being lowercased
+Check = Callable[[Any, Any], str | None]
 
-def validate_type(type_expected, **options):
-    """
-    Validate type, length... before setting values.
+_TYPE_NAMES = {
+    bool: 'a boolean',
+    int: 'an integer',
+    str: 'a string',
+}
 
-    This also add modified flag after modification.
-    """
 
-    config = Config()
+def _compile_checks(name: str, label: str, options: dict[str, Any]) -> list[Check]:
+    """Build checks of a standard type value, by priority."""
+    checks: list[Check] = []
+    allowed = options.get('allowed')
+    expected_length = options.get('length')
+    maximum = options.get('max')
+    minimum = options.get('min')
+
+    def length_of(value: Any) -> Any:
+        try:
+            return len(value)
+        except TypeError:
+            return value
+
+    def suffix(value: Any) -> str:
+        return ' characters' if isinstance(value, str) else ''
+
+    if allowed is not None:
+        accepted = frozenset(allowed)
+
+        def check_allowed(value: Any, original: Any) -> str | None:
+            if value in accepted:
+                return None
+
+            return ' '.join(
+                [
+                    f'"{original}" is not a valid {label},',
+                    f'please use one of following: {", ".join(allowed)}',
+                ]
+            )
+
+        checks.append(check_allowed)
+
+    if minimum is not None and maximum is not None:
+
+        def check_between(value: Any, _original: Any) -> str | None:
+            length = length_of(value)
+
+            if minimum <= length <= maximum:
+                return None
+
+            return f'{name} must be between {minimum} and {maximum}{suffix(value)}.'
+
+        checks.append(check_between)
+    elif minimum is not None:
+
+        def check_min(value: Any, _original: Any) -> str | None:
+            if length_of(value) >= minimum:
+                return None
+
+            return f'{name} must be greater than or equal to {minimum}{suffix(value)}.'
+
+        checks.append(check_min)
+    elif maximum is not None:
 
-    if 'silent' not in options:
-        options['silent'] = False
+        def check_max(value: Any, _original: Any) -> str | None:
+            if length_of(value) <= maximum:
+                return None
 
-    def get_min_max(options):
-        minimum = None
-        maximum = None
+            return f'{name} must be {maximum}{suffix(value)} maximum.'
 
-        if 'min' in options:
-            minimum = options['min']
+        checks.append(check_max)
 
-        if 'max' in options:
-            maximum = options['max']
+    if expected_length is not None:
 
-        return (minimum, maximum)
+        def check_length(value: Any, _original: Any) -> str | None:
+            if length_of(value) == expected_length:
+                return None
 
-    def is_std_type():
-        type_name = 'a ' + type_expected.__name__
-        std_type = False
+            return f'{name} must have {expected_length} characters.'
 
-        if type_expected is str:
-            type_name = 'a string'
-            std_type = True
+        checks.append(check_length)
 
-        if type_expected is int:
-            type_name = 'an integer'
-            std_type = True
+    return checks
 
-        if type_expected is bool:
-            type_name = 'a boolean'
-            std_type = True
 
-        return (std_type, type_name)
+def validate_type(type_expected, **options):
+    """
+    Validate type, length... before setting values.
+
+    This also add modified flag after modification.
+
+    Options are compiled once, when the setter is decorated, into the checks
+    it needs. Error messages are only built when a value is refused.
+    """
+
+    config = Config()
+    coerce = options.get('coerce')
+    lowercase = options.get('lowercase', False)
+    optional = options.get('optional', False)
+    silent = options.get('silent', False)
+    std_type = type_expected in _TYPE_NAMES
+    throws = options.get('throws')
+    timestamp = type_expected is datetime
+    validation = options.get('validation')
 
     def wrapper(method):
+        name = options.get('name', method.__name__.capitalize())
+        label = options.get('name', method.__name__)
+        checks = _compile_checks(name, label, options) if std_type else []
+        flag = method.__name__
+
+        def type_error() -> Exception:
+            if std_type:
+                message = f'{name} must be {_TYPE_NAMES[type_expected]}.'
+            else:
+                message = (
+                    f'You must provide a valid instance of {type_expected.__name__}.'
+                )
+
+            return (throws or TypeError)(message)
+
         @wraps(method)
         def wrapper(self, value=None, *args, **kwargs):  # pylint: disable=keyword-arg-before-vararg
-            name = options.get('name', method.__name__.capitalize())
-            message = None
-            excep = ValueError
-            is_optional = value is None and options.get('optional', False)
-
-            (std_type, type_name) = is_std_type()
+            is_optional = value is None and optional
 
-            if 'coerce' in options:
-                value = options['coerce'](value)
+            if coerce is not None:
+                value = coerce(value)
 
                 if value is None:
                     return None
 
-            try:
-                length = len(value)
-            except TypeError:
-                length = value
-
-            if type_expected == datetime and isinstance(value, int):
+            if timestamp and isinstance(value, int):
                 value = datetime.fromtimestamp(
                     value,
                     tz=config.default_timezone,
                 )
 
             if not isinstance(value, type_expected):
-                message = f'{name} must be {type_name}.'
-                excep = TypeError
-
-                if not std_type:
-                    message = f'You must provide a valid instance of {type_expected.__name__}.'
-
-            if std_type and message is None:
-                must_be_msg = f'{name} must be'
-                if 'length' in options and length != options['length']:
-                    message = f'{name} must have {options["length"]} characters.'
-
-                (minimum, maximum) = get_min_max(options)
-                char_suffix = ''
-
-                if isinstance(value, str):
-                    char_suffix = ' characters'
-
-                if minimum is not None:
-                    if maximum is not None:
-                        if length < minimum or length > maximum:
-                            message = f'{must_be_msg} between {minimum} and {maximum}{char_suffix}.'
-                    elif length < minimum:
-                        message = f'{must_be_msg} greater than or equal to {minimum}{char_suffix}.'
-                elif maximum is not None and length > maximum:
-                    message = f'{must_be_msg} {maximum}{char_suffix} maximum.'
-
-                tmp_value = value
+                if not is_optional:
+                    raise type_error()
+            else:
+                message = None
 
-                if (
-                    'lowercase' in options
-                    and options['lowercase']
-                    and hasattr(value, 'lower')
-                ):
-                    tmp_value = value.lower()
+                if std_type:
+                    original = value
 
-                if 'allowed' in options and tmp_value not in options['allowed']:
-                    message = ' '.join(
-                        [
-                            f'"{value}" is not a valid {options.get("name", method.__name__)},',
-                            f'please use one of following: {", ".join(options["allowed"])}',
-                        ]
-                    )
+                    if lowercase and hasattr(value, 'lower'):
+                        value = value.lower()
 
-                value = tmp_value
+                    for check in checks:
+                        message = check(value, original)
 
-            if 'validation' in options and message is None:
-                message = options['validation'](value)
+                        if message is not None:
+                            break
 
-            if message is not None and not is_optional:
-                if 'throws' in options:
-                    excep = options['throws']
+                if validation is not None and message is None:
+                    message = validation(value)
 
-                raise excep(message)
+                if message is not None and not is_optional:
+                    raise (throws or ValueError)(message)
 
             res = method(self, value, *args, **kwargs)
 
-            if hasattr(self, '_modified') and not options['silent']:
-                self._modified = method.__name__  # pylint: disable=protected-access
+            # Looked up on the class, reading flags would allocate them
+            if not silent and hasattr(type(self), '_modified'):
+                self._modified = flag  # pylint: disable=protected-access
 
             return res
 
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+
+class HedgingPolicy:  # pylint: disable=too-many-instance-attributes
+    """
+    Describe when a slow GET request is duplicated.
+
+    When a GET request is still waiting for its response after `delay`, the
+    same request is sent again and the first response received is used.
+    The delay is the `percentile` of the latencies observed on the last
+    `window` requests, `initial_delay` is used until `min_samples` latencies
+    are known.
+
+    Every GET request adds `budget` to a token bucket holding at most
+    `max_tokens`, and every duplicate takes one token, so hedging never adds
+    more than `budget` (10% by default) extra requests on a sustained load.
+
+    Synchronous requests are sent from a thread pool of `workers` threads,
+    a losing request ends in background and its connection goes back to the
+    pool. Losing asynchronous requests are cancelled.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        percentile: float = 95,
+        initial_delay: float = 0.1,
+        min_samples: int = 20,
+        window: int = 1000,
+        budget: float = 0.1,
+        max_tokens: float = 10,
+        workers: int = 32,
+    ) -> None:
+        """
+        Create a new policy.
+
+        Args:
+            percentile: Latency percentile, between 0 and 100, after which
+                a request is duplicated.
+            initial_delay: Delay in seconds used until enough latencies are known.
+            min_samples: Number of latencies needed to use the percentile.
+            window: Number of latencies kept.
+            budget: Ratio of extra requests allowed.
+            max_tokens: Maximum number of duplicates allowed in a burst.
+            workers: Number of threads sending synchronous requests.
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.workers = workers
+
+        self._lock = Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._delay: float | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._stale = 0
+        self._tokens = 0.0
+
+        self._hedged = 0
+        self._requests = 0
+        self._wins = 0
+
+    @property
+    def delay(self) -> float:
+        """
+        Time in seconds to wait for a response before sending a duplicate.
+
+        Returns:
+            Current hedging delay.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+
+            # Sorting the window is done again every few latencies only
+            if self._delay is None or self._stale >= 10:
+                self._stale = 0
+                latencies = sorted(self._latencies)
+                index = round(self.percentile / 100 * (len(latencies) - 1))
+                self._delay = latencies[index]
+
+            return self._delay
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool sending synchronous requests.
+
+        Returns:
+            Thread pool.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='stancer-hedging',
+                )
+
+            return self._executor
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Hedging statistics.
+
+        `requests` is the number of GET requests handled by the policy,
+        `hedged` the number of duplicates sent and `wins` the number of
+        duplicates answering before the original request.
+
+        Returns:
+            Hedging statistics.
+        """
+        return {
+            'hedged': self._hedged,
+            'requests': self._requests,
+            'wins': self._wins,
+        }
+
+    def acquire(self) -> bool:
+        """
+        Ask for the permission to send a duplicate.
+
+        Returns:
+            Is a duplicate allowed by the budget ?
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            self._hedged += 1
+
+            return True
+
+    def close(self) -> None:
+        """Stop the thread pool, waiting for running requests."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown()
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a request.
+
+        Args:
+            latency: Time in seconds to receive the response.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._stale += 1
+
+    def track(self) -> None:
+        """Count a new GET request, and add its share to the budget."""
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self._tokens + self.budget, self.max_tokens)
+
+    def won(self) -> None:
+        """Count a duplicate answering first."""
+        with self._lock:
+            self._wins += 1
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+
+class JsonCodec:
+    """
+    JSON encoder and decoder used for API bodies, based on the standard library.
+
+    A codec encodes request bodies to compact JSON strings, and decodes
+    responses directly from their raw bytes. Decoding errors are raised as
+    `ValueError`, whatever the underlying library.
+
+    `OrjsonCodec` and `MsgspecCodec` are faster, `default_codec()` picks the
+    best one installed. Use `Config.json_codec` to choose one.
+    """
+
+    name = 'json'
+
+    def dumps(self, value: Any) -> str:
+        """
+        Encode a value.
+
+        Args:
+            value: Value to encode.
+
+        Returns:
+            Compact JSON string.
+        """
+        return json.dumps(value, separators=(',', ':'))
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: Raw JSON document.
+
+        Returns:
+            Decoded value.
+
+        Raises:
+            ValueError: When the document is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on `orjson`."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        """
+        Create a new codec.
+
+        Raises:
+            ImportError: When `orjson` is not installed.
+        """
+        if orjson is None:
+            raise ImportError('"orjson" is not installed.')
+
+    def dumps(self, value: Any) -> str:
+        """
+        Encode a value.
+
+        Args:
+            value: Value to encode.
+
+        Returns:
+            Compact JSON string.
+        """
+        return orjson.dumps(value).decode('utf-8')
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: Raw JSON document.
+
+        Returns:
+            Decoded value.
+
+        Raises:
+            ValueError: When the document is not valid JSON.
+        """
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec based on `msgspec`."""
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        """
+        Create a new codec.
+
+        Raises:
+            ImportError: When `msgspec` is not installed.
+        """
+        if msgspec is None:
+            raise ImportError('"msgspec" is not installed.')
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def dumps(self, value: Any) -> str:
+        """
+        Encode a value.
+
+        Args:
+            value: Value to encode.
+
+        Returns:
+            Compact JSON string.
+        """
+        return self._encoder.encode(value).decode('utf-8')
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: Raw JSON document.
+
+        Returns:
+            Decoded value.
+
+        Raises:
+            ValueError: When the document is not valid JSON.
+        """
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as err:
+            raise ValueError(str(err)) from err
+
+
+def default_codec() -> JsonCodec:
+    """
+    Create the fastest codec available.
+
+    Returns:
+        An `OrjsonCodec`, a `MsgspecCodec` or a `JsonCodec`, depending on
+        installed libraries.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+
+    if msgspec is not None:
+        return MsgspecCodec()
+
+    return JsonCodec()
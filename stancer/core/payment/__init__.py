@@ -1,4 +1,5 @@
 from .auth import PaymentAuth
+from .ledger import RefundLedger
 from .page import PaymentPage
 from .payment_protocol import PaymentProtocol
 from .refund import PaymentRefund
@@ -8,4 +9,5 @@ __all__ = (
     'PaymentRefund',
     'PaymentPage',
     'PaymentProtocol',
+    'RefundLedger',
 )
@@ -9,7 +9,7 @@ from ...device import Device
 from ...exceptions import InvalidAuthError
 from ...exceptions import InvalidDeviceError
 from ...exceptions import StancerException
-from ..decorators import populate_on_call
+from ..decorators import field
 from ..decorators import validate_type
 from .payment_protocol import PaymentProtocol
 
@@ -32,6 +32,8 @@ def _coerce_auth(value: Auth | str | bool) -> Auth | None:
 class PaymentAuth(ABC, PaymentProtocol):
     """Specific auth property and method for payment."""
 
+    __slots__ = ()
+
     _allowed_attributes = [
         'auth',
         'device',
@@ -41,8 +43,7 @@ class PaymentAuth(ABC, PaymentProtocol):
     def __init__(self) -> None:
         pass
 
-    @property
-    @populate_on_call
+    @field
     def auth(self) -> Auth | None:
         """
         Authentication request.
@@ -67,8 +68,7 @@ class PaymentAuth(ABC, PaymentProtocol):
     def auth(self, value: Auth) -> None:
         self._data['auth'] = value
 
-    @property
-    @populate_on_call
+    @field
     def device(self) -> Device | None:
         """
         Device handling the payment.
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ...refund import Refund
+
+
+class RefundLedger:
+    """
+    Running totals of the refunds of a payment, per refund status.
+
+    Every refund is counted with the amount and the status it had when it was
+    recorded, recording it again only moves the difference. Refunds record
+    themselves again when hydrated, like when populated. Refunds without
+    amount are kept aside until they are recorded with one.
+
+    Attributes:
+        amount: Amount of every refund counted.
+        count: Number of refunds recorded.
+        totals: Amount of refunds counted, per refund status.
+        unknown: Refunds recorded without amount.
+    """
+
+    __slots__ = ('_entries', 'amount', 'totals', 'unknown')
+
+    def __init__(self) -> None:
+        """Create an empty ledger."""
+        self._entries: dict[Refund, tuple[str | None, int | None]] = {}
+        self.amount = 0
+        self.totals: dict[str | None, int] = {}
+        self.unknown: dict[Refund, None] = {}
+
+    @property
+    def count(self) -> int:
+        """Number of refunds recorded."""
+        return len(self._entries)
+
+    def _move(self, status: str | None, amount: int | None, sign: int) -> None:
+        """Add an amount to the totals, or take it off."""
+        if amount is None:
+            return
+
+        self.amount += sign * amount
+        self.totals[status] = self.totals.get(status, 0) + sign * amount
+
+        if not self.totals[status]:
+            del self.totals[status]
+
+    def record(self, refund: 'Refund') -> None:
+        """
+        Count a refund, replacing what was counted for it before.
+
+        Args:
+            refund: Refund of the payment.
+        """
+        # pylint: disable=protected-access
+        status = refund._data.get('status')
+        current = (
+            None if status is None else str(status),
+            refund._data.get('amount'),
+        )
+        previous = self._entries.get(refund)
+
+        # Hydrating the refund records it again
+        refund._ledger = self
+
+        if previous == current:
+            return
+
+        if previous is not None:
+            self._move(*previous, -1)
+
+        self._entries[refund] = current
+        self._move(*current, 1)
+
+        if current[1] is None:
+            self.unknown[refund] = None
+        else:
+            self.unknown.pop(refund, None)
+
+    def sync(self, refunds: list['Refund']) -> None:
+        """
+        Count every refund of a list, and only them.
+
+        Args:
+            refunds: Refunds of the payment.
+        """
+        for refund in refunds:
+            self.record(refund)
+
+        if len(self._entries) > len(refunds):
+            kept = set(refunds)
+
+            for refund in [item for item in self._entries if item not in kept]:
+                # pylint: disable=protected-access
+                self._move(*self._entries.pop(refund), -1)
+                self.unknown.pop(refund, None)
+
+                if refund._ledger is self:
+                    refund._ledger = None
@@ -3,12 +3,11 @@ from abc import ABC
 from abc import abstractmethod
 from urllib.parse import urlencode
 
-from ...config import Config
 from ...exceptions import InvalidUrlError
 from ...exceptions import MissingApiKeyError
 from ...exceptions import MissingPaymentIdError
 from ...exceptions import MissingReturnUrlError
-from ..decorators import populate_on_call
+from ..decorators import field
 from ..decorators import validate_type
 from .payment_protocol import PaymentProtocol
 
@@ -23,6 +22,8 @@ def _valid_return_url(value) -> str | None:
 class PaymentPage(ABC, PaymentProtocol):
     """Specific property and method for payment page."""
 
+    __slots__ = ()
+
     _allowed_attributes = [
         'return_url',
     ]
@@ -71,7 +72,7 @@ class PaymentPage(ABC, PaymentProtocol):
 
             raise MissingPaymentIdError(message)
 
-        config = Config()
+        config = self._config
 
         if config.public_key is None:
             message = 'A public API key is needed to obtain a payment page URL.'
@@ -103,8 +104,7 @@ class PaymentPage(ABC, PaymentProtocol):
 
         return url
 
-    @property
-    @populate_on_call
+    @field
     def return_url(self) -> str | None:
         """
         URL used to return to your store when using the payment page.
@@ -1,3 +1,4 @@
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Protocol
 
@@ -9,16 +10,42 @@ except ImportError:
 
     Self = TypeVar('Self', bound='PaymentProtocol')  # type: ignore
 
+if TYPE_CHECKING:
+    from .ledger import RefundLedger
+
 
 class PaymentProtocol(Protocol):
     """Protocol that define which attribute has to be implemented for Payment Objects"""
 
+    __slots__ = ()
+
     _allowed_attributes: list[str]
+    _config: Any
     _data: dict[str, Any]
-    _populated: bool
     amount: int | None
     currency: str | None
     id: str | None
     method: str | None
 
+    # Slots and properties of the payment, mixins can not hold slots
+    @property
+    def _populated(self) -> bool: ...
+
+    @_populated.setter
+    def _populated(self, value: bool) -> None: ...
+
+    @property
+    def _refund_ledger(self) -> 'RefundLedger | None': ...
+
+    @_refund_ledger.setter
+    def _refund_ledger(self, value: 'RefundLedger | None') -> None: ...
+
+    async def apopulate(self: Self) -> Self: ...
+
+    def _attach(self, value: Any) -> None: ...
+
+    def _changed(self) -> None: ...
+
+    def _materialise(self, *names: str) -> None: ...
+
     def populate(self: Self) -> Self: ...
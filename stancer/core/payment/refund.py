@@ -6,8 +6,9 @@ from typing import Any
 
 from ...exceptions import InvalidAmountError
 from ...status.refund import RefundStatus
-from ..decorators import populate_on_call
+from ..decorators import field
 from ..decorators import validate_type
+from .ledger import RefundLedger
 from .payment_protocol import PaymentProtocol
 
 if TYPE_CHECKING:
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 class PaymentRefund(ABC, PaymentProtocol):
     """Specific property and method for payment refunds."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self) -> None:
         pass
@@ -35,9 +38,11 @@ class PaymentRefund(ABC, PaymentProtocol):
         optional=True,
         silent=True,
     )
-    def refund(self, amount: int = 0):
+    async def arefund(self, amount: int = 0):
         """
-        Refund a payment, or part of it.
+        Refund a payment, or part of it, asynchronously.
+
+        See `PaymentRefund.refund()`.
 
         Args:
             amount (int): Amount to refund,
@@ -49,10 +54,33 @@ class PaymentRefund(ABC, PaymentProtocol):
         """
         from ...refund import Refund  # pylint: disable=import-outside-toplevel
 
+        await self.apopulate()
+
+        if amount:
+            # Only refunds without amount would need a call to the API
+            ledger = self._refunds_ledger()
+
+            for item in list(ledger.unknown):
+                await item.apopulate()
+                ledger.record(item)
+
         refund = Refund()
+        self._attach(refund)
+        refund.hydrate(**self._refund_params(amount))
+        await refund.asend()
+
+        if self._refund_sent(refund):
+            self._populated = False
+            await self.apopulate()
+
+        return refund
+
+    def _refund_params(self, amount: int) -> dict[str, Any]:
+        """Check the amount to refund and prepare the refund data."""
         params: dict[str, Any] = {
             'payment': self,
         }
+
         if amount:
             if amount > self.refundable_amount:
                 currency = self.currency.upper() if self.currency else ''
@@ -66,20 +94,102 @@ class PaymentRefund(ABC, PaymentProtocol):
 
             params['amount'] = amount
 
-        refund.hydrate(**params)
-        refund.send()
+        return params
+
+    def _count_refunds(self) -> None:
+        """Count hydrated refunds in the ledger."""
+        self._refunds_ledger().sync(self._data.get('refunds', []))
 
+    def _refund_sent(self, refund: 'Refund') -> bool:
+        """Keep track of a sent refund, tell if the payment must be populated again."""
+        ledger = self._refunds_ledger()
         refunds = self._data.get('refunds', [])
         refunds.append(refund)
 
         self._data['refunds'] = refunds
+        self._changed()
+        ledger.record(refund)
+
+        return refund.status != RefundStatus.TO_REFUND
+
+    def _refunds_ledger(self) -> RefundLedger:
+        """Return the refund ledger, counting refunds added to the list since."""
+        self._materialise('refunds')
+
+        ledger = self._refund_ledger
+
+        if ledger is None:
+            ledger = self._refund_ledger = RefundLedger()
+
+        refunds = self._data.get('refunds', [])
+
+        if ledger.count != len(refunds):
+            ledger.sync(refunds)
+
+        return ledger
+
+    def _refunds_counted(self) -> RefundLedger:
+        """Return the refund ledger, every refund counted with its amount."""
+        # Like the field, unknown refunds populate the payment
+        self._materialise('refunds')
+
+        if 'refunds' not in self._data:
+            self.populate()
+
+        ledger = self._refunds_ledger()
+
+        # Like reading their amount, refunds without one are populated
+        for refund in list(ledger.unknown):
+            refund.populate()
+            ledger.record(refund)
+
+        return ledger
+
+    @validate_type(
+        int,
+        min=50,
+        throws=InvalidAmountError,
+        optional=True,
+        silent=True,
+    )
+    def refund(self, amount: int = 0):
+        """
+        Refund a payment, or part of it.
+
+        Args:
+            amount (int): Amount to refund,
+                if not present all paid amount will be refund.
 
-        if refund.status != RefundStatus.TO_REFUND:
+        Raises:
+            InvalidAmountError: When trying to refund more than paid.
+            InvalidAmountError: When the amount is invalid.
+        """
+        from ...refund import Refund  # pylint: disable=import-outside-toplevel
+
+        refund = Refund()
+        self._attach(refund)
+        refund.hydrate(**self._refund_params(amount))
+        refund.send()
+
+        if self._refund_sent(refund):
             self._populated = False
             self.populate()
 
         return refund
 
+    @property
+    def refund_totals(self) -> dict[str | None, int]:
+        """
+        Amount of refunds, per refund status.
+
+        Totals are kept up to date on hydration and on every refund, they are
+        not computed again on each call.
+
+        Returns:
+            dict: Amount of refunds, per refund status.
+        """
+        return dict(self._refunds_counted().totals)
+
     @property
     def refunded_amount(self) -> int:
         """
@@ -88,7 +198,7 @@ class PaymentRefund(ABC, PaymentProtocol):
         Returns:
             int: Amount already refund.
         """
-        return sum(map(lambda refund: refund.amount, self.refunds))
+        return self._refunds_counted().amount
 
     @property
     def refundable_amount(self) -> int:
@@ -102,8 +212,7 @@ class PaymentRefund(ABC, PaymentProtocol):
             raise InvalidAmountError
         return self.amount - self.refunded_amount
 
-    @property
-    @populate_on_call
+    @field
     def refunds(self) -> list['Refund']:
         """
         Returns refund's list.
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Iterable
+from typing import Any
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from .timeout import Timeout
+from .transport import AbstractTransport
+
+
+class ConnectionPool(AbstractTransport):
+    """
+    Long-lived HTTP connection pool, backed by a `requests` session.
+
+    Every API call made by the module goes through one instance of this class,
+    owned by the configuration, so TCP and TLS connections are kept alive and
+    reused between calls instead of being opened again for each request.
+
+    This is the default transport, see `Urllib3ConnectionPool` for a lighter one.
+    """
+
+    def __init__(
+        self,
+        connections: int = 10,
+        maxsize: int = 10,
+        keep_alive: float | None = 60,
+    ) -> None:
+        """
+        Create a new pool.
+
+        Args:
+            connections: Number of hosts kept in the pool.
+            maxsize: Maximum number of connections kept open per host.
+            keep_alive: Number of seconds an idle pool is kept open,
+                `None` to never close it.
+        """
+        super().__init__(
+            connections=connections,
+            maxsize=maxsize,
+            keep_alive=keep_alive,
+        )
+
+        self._session = self._create_session()
+
+    def _close(self) -> None:
+        """Close every opened connection, the pool must stay usable."""
+        self._session.close()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._connections,
+            pool_maxsize=self._maxsize,
+        )
+
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def _managers(self) -> Iterable[Any]:
+        """Underlying `urllib3` pool managers, used for statistics."""
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+
+        for adapter in adapters.values():
+            manager = getattr(adapter, 'poolmanager', None)
+
+            if manager is not None:
+                yield manager
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Underlying HTTP session.
+
+        Returns:
+            Session used to send requests.
+        """
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """
+        Send an HTTP request on a pooled connection.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            kwargs: Every argument accepted by `requests.Session.request`,
+                `timeout` can also be split timeouts.
+
+        Returns:
+            API response.
+        """
+        self._expire_idle()
+
+        timeout = kwargs.get('timeout')
+
+        if isinstance(timeout, Timeout):
+            kwargs['timeout'] = (timeout.connect, timeout.read)
+
+        return self._session.request(method, url, **kwargs)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import requests
+
+from ..config import Config
+from .abstract_object import AbstractObject
+from .async_request import AsyncRequest
+from .request import Request
+
+Group = tuple[Config, list[AbstractObject]]
+
+
+def _collect(objects: Iterable[AbstractObject], names: tuple[str, ...]) -> list[Group]:
+    """Group nested objects needing to be populated, by API object."""
+    groups: dict[tuple[int, str], Group] = {}
+
+    for obj in objects:
+        for name in names:
+            # pylint: disable=protected-access
+            # Reading the property would populate the object
+            obj._materialise(name)
+            value = obj._data.get(name)
+
+            for nested in value if isinstance(value, list) else [value]:
+                if (
+                    isinstance(nested, AbstractObject)
+                    and nested.id is not None
+                    and nested._ENDPOINT is not None
+                    and nested.is_not_populated
+                ):
+                    config = nested._config
+                    key = (id(config), nested.uri)
+                    groups.setdefault(key, (config, []))[1].append(nested)
+
+    return list(groups.values())
+
+
+def _fill(group: Group, content: bytes) -> None:
+    """Populate objects with the same API response."""
+    (config, objects) = group
+    data = config.json_codec.loads(content)
+
+    for obj in objects:
+        if obj.is_not_populated:
+            obj._populate_with(data)  # pylint: disable=protected-access
+
+
+def _workers(groups: list[Group], concurrency: int | None) -> int:
+    """Number of objects fetched at the same time."""
+    return concurrency or groups[0][0].pool_maxsize
+
+
+async def aprefetch(
+    objects: Iterable[AbstractObject],
+    *names: str,
+    concurrency: int | None = None,
+) -> None:
+    """
+    Populate nested objects of many objects at once, asynchronously.
+
+    See `prefetch()`.
+
+    Args:
+        objects: Objects holding nested objects, like listed payments.
+        *names: Attributes to prefetch, like `customer` or `card`.
+        concurrency: Maximum number of objects fetched at the same time,
+            default to `Config.pool_maxsize`.
+    """
+    groups = _collect(objects, names)
+
+    if not groups:
+        return
+
+    slots = asyncio.Semaphore(_workers(groups, concurrency))
+
+    async def fetch(group: Group) -> None:
+        (config, objects) = group
+
+        async with slots:
+            try:
+                content = await AsyncRequest(config).get_content(objects[0])
+            except requests.RequestException:
+                return
+
+        _fill(group, content)
+
+    await asyncio.gather(*(fetch(group) for group in groups))
+
+
+def prefetch(
+    objects: Iterable[AbstractObject],
+    *names: str,
+    concurrency: int | None = None,
+) -> None:
+    """
+    Populate nested objects of many objects at once.
+
+    Reading `payment.customer.email` on every listed payment calls the API
+    once per customer. Prefetching them first collects every nested object
+    not populated yet, fetches each of them once, even when shared by many
+    objects, with `concurrency` calls at the same time, and hydrates them in
+    place.
+
+    An object failing to be fetched is left as it is, it will be populated,
+    and fail, when read.
+
+    Example:
+        payments = list(Payment.list(limit=100))
+
+        stancer.prefetch(payments, 'customer', 'card')
+
+    Args:
+        objects: Objects holding nested objects, like listed payments.
+        *names: Attributes to prefetch, like `customer` or `card`.
+        concurrency: Maximum number of objects fetched at the same time,
+            default to `Config.pool_maxsize`.
+    """
+    groups = _collect(objects, names)
+
+    if not groups:
+        return
+
+    def fetch(group: Group) -> bytes | None:
+        (config, objects) = group
+
+        try:
+            return Request(config).get_content(objects[0])
+        except requests.RequestException:
+            return None
+
+    with ThreadPoolExecutor(max_workers=_workers(groups, concurrency)) as executor:
+        # Objects are fetched with the client scope, deadline and priority of the caller
+        futures = [
+            executor.submit(copy_context().run, fetch, group) for group in groups
+        ]
+
+        for group, future in zip(groups, futures):
+            content = future.result()
+
+            if content is not None:
+                _fill(group, content)
@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from threading import Event
+from threading import Lock
+from time import monotonic
+from time import sleep
+from time import time
+
+from ..exceptions import StancerValueError
+from .timeout import endpoint
+
+BATCH = 'batch'
+INTERACTIVE = 'interactive'
+
+_priority: ContextVar[str] = ContextVar('stancer_priority', default=INTERACTIVE)
+
+
+def get_priority() -> str:
+    """
+    Priority class of the API calls made in the current context.
+
+    Returns:
+        `'interactive'` or `'batch'`.
+    """
+    return _priority.get()
+
+
+@contextmanager
+def priority(value: str) -> Iterator[str]:
+    """
+    Set the priority class of every API call made in the context.
+
+    Calls are `'interactive'` by default. Background work, like exports or
+    mass refunds, should run as `'batch'` so a `RateLimiter` lets interactive
+    calls go first. The priority applies to the current thread or
+    asynchronous task only.
+
+    Args:
+        value: `'interactive'` or `'batch'`.
+
+    Yields:
+        The priority class.
+
+    Raises:
+        StancerValueError: When the priority class is unknown.
+    """
+    if value not in (BATCH, INTERACTIVE):
+        raise StancerValueError(
+            f'"{value}" is not a valid priority, use "batch" or "interactive".'
+        )
+
+    token = _priority.set(value)
+
+    try:
+        yield value
+    finally:
+        _priority.reset(token)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a `Retry-After` header.
+
+    Args:
+        value: Header value, a number of seconds or an HTTP date.
+
+    Returns:
+        Number of seconds to wait, `None` when the header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        return None
+
+    return max(date.timestamp() - time(), 0.0)
+
+
+class _Share:
+    """Share of contested grants given to batch calls, over recent grants."""
+
+    WINDOW = 100  # pylint: disable=invalid-name
+
+    def __init__(self) -> None:
+        self.batch: float = 0
+        self.total: float = 0
+
+    def batch_turn(self, share: float) -> bool:
+        """Tell if the next contested grant goes to a batch call."""
+        return self.batch + 1 <= share * (self.total + 1)
+
+    def record(self, batch: bool) -> None:
+        """Count a contested grant."""
+        self.total += 1
+
+        if batch:
+            self.batch += 1
+
+        if self.total >= self.WINDOW:
+            self.batch /= 2
+            self.total /= 2
+
+
+class _Bucket:
+    """Token bucket of a key."""
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.blocked_until = now
+        self.share = _Share()
+        self.tokens = tokens
+        self.updated = now
+
+
+class _Waiter:
+    """A caller waiting for an in-flight slot."""
+
+    def __init__(self, wake: Callable[[], None], batch: bool) -> None:
+        self.batch = batch
+        self.granted = False
+        self.wake = wake
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Pace API calls and cap the number of calls in flight, by priority.
+
+    Every call takes a token from the bucket of its API key and endpoint (like
+    `checkout` or `customers`), buckets are refilled at `rate` tokens per
+    second up to `burst` tokens. A call finding an empty bucket waits for its
+    turn instead of being rejected.
+
+    At most `max_in_flight` calls are sent at the same time, whatever their
+    key, it should not exceed `Config.pool_maxsize`. A `429 Too Many Requests`
+    response blocks its bucket for the duration asked by its `Retry-After`
+    header, or `cooldown` seconds.
+
+    Calls are either interactive (the default) or batch, see `priority()`.
+    Interactive calls go ahead of waiting batch calls, for tokens and for
+    in-flight slots, but batch calls are guaranteed `batch_share` of them
+    when both are waiting. Calls of the same class are served in order.
+
+    The same limiter paces synchronous, threaded and asynchronous calls,
+    use `Config.rate_limiter` to enable it.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        rate: float = 25,
+        burst: int = 25,
+        max_in_flight: int | None = None,
+        cooldown: float = 1,
+        per_endpoint: bool = True,
+        batch_share: float = 0.2,
+    ) -> None:
+        """
+        Create a new limiter.
+
+        Args:
+            rate: Tokens added per second to every bucket.
+            burst: Maximum number of tokens in a bucket.
+            max_in_flight: Maximum number of calls sent at the same time,
+                `None` for no limit.
+            cooldown: Seconds a bucket is blocked after a `429` response
+                without `Retry-After` header.
+            per_endpoint: Use a bucket per API key and endpoint,
+                a single bucket per API key otherwise.
+            batch_share: Minimum share of tokens and slots given to batch
+                calls while interactive calls are waiting too.
+        """
+        self.batch_share = batch_share
+        self.burst = burst
+        self.cooldown = cooldown
+        self.max_in_flight = max_in_flight
+        self.per_endpoint = per_endpoint
+        self.rate = rate
+
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self._in_flight = 0
+        self._lock = Lock()
+        self._slots = _Share()
+        self._waiters: dict[bool, deque[_Waiter]] = {False: deque(), True: deque()}
+
+        self._delayed = 0
+        self._requests = 0
+        self._throttled = 0
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of calls currently sent.
+
+        Returns:
+            Calls in flight.
+        """
+        return self._in_flight
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Limiter statistics.
+
+        `requests` is the number of calls admitted, `delayed` the number of
+        times a call had to wait for a token or a slot, and `throttled` the
+        number of `429` responses received.
+
+        Returns:
+            Limiter statistics.
+        """
+        return {
+            'delayed': self._delayed,
+            'requests': self._requests,
+            'throttled': self._throttled,
+        }
+
+    def _enter(self, waiter: Callable[[], _Waiter]) -> _Waiter | None:
+        """Take an in-flight slot, or queue a waiter when every slot is used."""
+        with self._lock:
+            self._requests += 1
+
+            if self.max_in_flight is None or (
+                self._in_flight < self.max_in_flight
+                and not self._waiters[False]
+                and not self._waiters[True]
+            ):
+                self._in_flight += 1
+
+                return None
+
+            self._delayed += 1
+            queued = waiter()
+            self._waiters[queued.batch].append(queued)
+
+            return queued
+
+    def _leave(self) -> None:
+        """Give the slot to the next waiter, or free it."""
+        with self._lock:
+            while True:
+                queued = self._next_waiter()
+
+                if queued is None:
+                    break
+
+                try:
+                    queued.wake()
+                except RuntimeError:
+                    # Its event loop is closed, nobody is waiting anymore
+                    continue
+
+                queued.granted = True
+
+                return
+
+            self._in_flight -= 1
+
+    def _next_waiter(self) -> _Waiter | None:
+        """Pick the next waiter, interactive ones first but for the batch share."""
+        interactive = self._waiters[False]
+        batch = self._waiters[True]
+
+        if interactive and batch:
+            turn = self._slots.batch_turn(self.batch_share)
+            self._slots.record(turn)
+
+            return (batch if turn else interactive).popleft()
+
+        if interactive:
+            return interactive.popleft()
+
+        if batch:
+            return batch.popleft()
+
+        return None
+
+    def _remove(self, queued: _Waiter) -> bool:
+        """Remove a cancelled waiter, tell if it was already given a slot."""
+        with self._lock:
+            if not queued.granted:
+                self._waiters[queued.batch].remove(queued)
+
+            return queued.granted
+
+    def acquire(self, key: Hashable) -> None:
+        """
+        Wait for a token and an in-flight slot.
+
+        The priority class of the call is the one of the current context.
+
+        Args:
+            key: Bucket key, see `RateLimiter.key()`.
+        """
+        batch = get_priority() == BATCH
+
+        while True:
+            (taken, delay) = self.reserve(key, batch)
+
+            if delay > 0:
+                sleep(delay)
+
+            if taken:
+                break
+
+        event = Event()
+
+        if self._enter(lambda: _Waiter(event.set, batch)) is not None:
+            event.wait()
+
+    async def aacquire(self, key: Hashable) -> None:
+        """
+        Wait for a token and an in-flight slot, asynchronously.
+
+        The priority class of the call is the one of the current task.
+
+        Args:
+            key: Bucket key, see `RateLimiter.key()`.
+        """
+        batch = get_priority() == BATCH
+
+        while True:
+            (taken, delay) = self.reserve(key, batch)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if taken:
+                break
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(_resolve, future)
+
+        queued = self._enter(lambda: _Waiter(wake, batch))
+
+        if queued is not None:
+            try:
+                await future
+            except asyncio.CancelledError:
+                if self._remove(queued):
+                    self._leave()
+
+                raise
+
+    def key(self, api_key: str | None, path: str) -> Hashable:
+        """
+        Bucket key of a call.
+
+        Args:
+            api_key: API key used for the call.
+            path: Requested path, like `/v1/checkout/paym_xxx`.
+
+        Returns:
+            Bucket key.
+        """
+        if not self.per_endpoint:
+            return api_key
+
+        return (api_key, endpoint(path))
+
+    def release(
+        self,
+        key: Hashable,
+        status: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Report a call as finished, and free its in-flight slot.
+
+        Args:
+            key: Bucket key.
+            status: Response status, `None` when no response was received.
+            retry_after: Parsed `Retry-After` header of the response.
+        """
+        self._leave()
+
+        if status != 429:
+            return
+
+        now = monotonic()
+        wait = self.cooldown if retry_after is None else retry_after
+
+        with self._lock:
+            self._throttled += 1
+            bucket = self._buckets.get(key)
+
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(0, now)
+
+            bucket.blocked_until = max(bucket.blocked_until, now + wait)
+            bucket.tokens = min(bucket.tokens, 0)
+
+    def reserve(self, key: Hashable, batch: bool = False) -> tuple[bool, float]:
+        """
+        Take a token from a bucket.
+
+        Interactive calls always take a token, even from an empty bucket, and
+        wait for their turn. Batch calls only take a token from an empty
+        bucket when it is their share, otherwise they have to ask again later.
+
+        Args:
+            key: Bucket key.
+            batch: Is it a batch call ?
+
+        Returns:
+            Whether a token was taken, and seconds to wait before sending the
+            call or asking again.
+        """
+        now = monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(self.burst, now)
+            else:
+                refill = (now - bucket.updated) * self.rate
+                bucket.tokens = min(self.burst, bucket.tokens + refill)
+                bucket.updated = now
+
+            taken = True
+
+            if bucket.tokens < 1:
+                taken = not batch or bucket.share.batch_turn(self.batch_share)
+
+                if taken:
+                    bucket.share.record(batch)
+
+            if taken:
+                bucket.tokens -= 1
+                delay = max(-bucket.tokens / self.rate, bucket.blocked_until - now, 0)
+            else:
+                # Leave next tokens to interactive calls
+                delay = max(
+                    min(1 - bucket.tokens, 1) / self.rate, bucket.blocked_until - now
+                )
+
+            if delay > 0:
+                self._delayed += 1
+
+        return (taken, delay)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    """Wake an asynchronous waiter, unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
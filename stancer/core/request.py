@@ -1,32 +1,62 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from contextvars import copy_context
+from time import monotonic
+from time import sleep
 from typing import TYPE_CHECKING
+from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 
 from ..config import Config
+from ..exceptions import DeadlineExceededError
 from ..exceptions import StancerHTTPError
 from ..exceptions import StancerValueError
+from .compression import ACCEPT_ENCODING
+from .compression import TransferStats
+from .compression import body_size
+from .compression import compress
+from .compression import wire_size
+from .rate_limit import parse_retry_after
+from .single_flight import SingleFlight
+from .timeout import Timeout
+from .timeout import expires_within
+from .timeout import remaining
 
 if TYPE_CHECKING:
+    from requests import Response
+
     from .abstract_object import AbstractObject
+    from .hedging import HedgingPolicy
+    from .rate_limit import RateLimiter
 
 # This code is a Hack to let us use Self from typing if available, else we use TypeVar
 try:
     # Self is available in Python 3.11
-    from typing import Self  # type: ignore
+    from typing import Self  # type: ignore # pylint: disable=ungrouped-imports
 except ImportError:
     from typing import TypeVar
 
     Self = TypeVar('Self', bound='Request')  # type: ignore
 
 
+_in_flight = SingleFlight()
+
+
 class Request:
     """API request manager."""
 
-    def __init__(self):
-        """Initialize"""
-        self._conf = Config()
+    def __init__(self, config: Config | None = None):
+        """
+        Initialize
+
+        Args:
+            config: Configuration to use, default to `Config()`.
+        """
+        self._conf = Config() if config is None else config
 
     def delete(self: Self, obj: 'AbstractObject') -> Self | str:
         """
@@ -59,6 +89,28 @@ class Request:
         """
         return self._request('get', obj, update, **kwargs)
 
+    def get_content(self, obj: 'AbstractObject', **kwargs) -> bytes:
+        """
+        Send a GET HTTP request and return the raw response body.
+
+        Unlike `get()`, the object is not updated and the body is not
+        decoded, to let callers decode it directly from bytes.
+
+        Args:
+            obj: Target object.
+            kwargs: Query parameters.
+
+        Returns:
+            Response body.
+        """
+        options = self._prepare('get', obj, **kwargs)
+        response = self._send(options)
+
+        if not response.ok:
+            raise StancerHTTPError(response)
+
+        return response.content
+
     def patch(self: Self, obj: 'AbstractObject') -> Self | str:
         """
         Send a POST HTTP request.
@@ -83,14 +135,124 @@ class Request:
         """
         return self._request('post', obj)
 
-    def _request(
+    def _abort_send(self, options: dict[str, Any]) -> None:
+        """Give back the circuit breaker permission of a call ended without outcome."""
+
+        breaker = self._conf.circuit_breaker
+
+        if breaker is not None:
+            breaker.release(urlsplit(options['url']).netloc)
+
+    def _after_send(
+        self,
+        options: dict[str, Any],
+        response: 'Response | None' = None,
+    ) -> None:
+        """
+        Report a call outcome to the circuit breaker and transfer statistics.
+
+        No response means the call failed.
+        """
+
+        breaker = self._conf.circuit_breaker
+
+        if breaker is not None:
+            failed = response is None or response.status_code >= 500
+            breaker.record(urlsplit(options['url']).netloc, failed)
+
+        if response is None:
+            return
+
+        # Counted for every attempt, retried and hedged requests send their body again
+        transfer = self._transfer()
+        body = options['data']
+
+        if body is not None:
+            transfer.sent(*body_size(body, options['headers'].get('Content-Encoding')))
+
+        transfer.received(wire_size(response), len(response.content))
+
+    def _before_send(self, options: dict[str, Any]) -> None:
+        """Ask `Config.circuit_breaker` if the call can be sent."""
+
+        breaker = self._conf.circuit_breaker
+
+        if breaker is not None:
+            breaker.acquire(urlsplit(options['url']).netloc)
+
+    def _admit(self, options: dict[str, Any]) -> tuple['RateLimiter | None', Any]:
+        """Wait for `Config.rate_limiter`, returns the limiter and the bucket key."""
+
+        limiter = self._conf.rate_limiter
+
+        if limiter is None:
+            return (None, None)
+
+        key = limiter.key(options['auth'][0], urlsplit(options['url']).path)
+        limiter.acquire(key)
+
+        return (limiter, key)
+
+    @staticmethod
+    def _dismiss(
+        limiter: 'RateLimiter | None',
+        key: Any,
+        response: 'Response | None',
+    ) -> None:
+        """Report the end of an admitted call to the rate limiter."""
+
+        if limiter is None:
+            return
+
+        if response is None:
+            limiter.release(key)
+        else:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            limiter.release(key, response.status_code, retry_after)
+
+    @staticmethod
+    def _flight_key(options: dict[str, Any]) -> tuple:
+        """Identify identical requests, same location, query and credentials."""
+
+        return (
+            options['url'],
+            options['auth'],
+            repr(sorted(options['params'].items())),
+        )
+
+    def _handle(
         self: Self,
         method: str,
         obj: 'AbstractObject',
+        response: 'Response',
         update: bool = True,
-        **kwargs,
     ) -> Self | str:
-        """Handle "delete", "get", "patch" and "post" method."""
+        """Check the API response and update the object with it."""
+
+        if not response.ok:
+            raise StancerHTTPError(response)
+
+        if response.ok and method == 'delete':
+            del obj.id
+
+        if not update:
+            return response.text
+
+        if response.text:
+            # pylint: disable=protected-access
+            obj._bypass = True
+            obj.hydrate(**self._conf.json_codec.loads(response.content))
+            obj._bypass = False
+
+        return self
+
+    def _prepare(
+        self: Self,
+        method: str,
+        obj: 'AbstractObject',
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Validate the call and build arguments for the HTTP client."""
 
         if method not in ['delete', 'get', 'patch', 'post']:
             raise StancerValueError('Invalid HTTP method.')
@@ -100,36 +262,196 @@ class Request:
         if username is None:
             raise AttributeError('No API key found.')
 
-        body = None
+        body: str | bytes | None = None
+        headers = {
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Content-Type': 'application/json',
+        }
 
         if method not in ('get', 'delete'):
             body = obj.to_json()
+            data = body.encode('utf-8')
+            compressed = compress(data, self._conf.compression_threshold)
+
+            if compressed is not None:
+                body = compressed
+                headers['Content-Encoding'] = 'gzip'
+
+        return {
+            'method': method,
+            'url': obj.uri,
+            'auth': (username, ''),
+            'data': body,
+            'params': kwargs,
+            'timeout': self._conf.timeout,
+            'headers': headers,
+        }
+
+    def _request(
+        self: Self,
+        method: str,
+        obj: 'AbstractObject',
+        update: bool = True,
+        **kwargs,
+    ) -> Self | str:
+        """Handle "delete", "get", "patch" and "post" method."""
+
+        options = self._prepare(method, obj, **kwargs)
+        response = self._send(options)
+
+        return self._handle(method, obj, response, update)
 
-        response = requests.request(
-            method,
-            obj.uri,
-            auth=(username, ''),
-            data=body,
-            params=kwargs,
-            timeout=self._conf.timeout,
-            headers={
-                'Content-Type': 'application/json',
-            },
+    def _send(self, options: dict[str, Any]) -> 'Response':
+        """Send the request, concurrent identical GET requests share the same call."""
+
+        if options['method'] != 'get' or not self._conf.coalesce:
+            return self._send_retry(options)
+
+        return _in_flight.do(
+            self._flight_key(options), lambda: self._send_retry(options)
         )
 
-        if not response.ok:
-            raise StancerHTTPError(response)
+    def _send_retry(self, options: dict[str, Any]) -> 'Response':
+        """Send the request, and send it again when `Config.retry` allows it."""
 
-        if response.ok and method == 'delete':
-            del obj.id
+        policy = self._conf.retry
+        method = options['method']
+        started = monotonic()
+        attempt = 0
 
-        if not update:
-            return response.text
+        while True:
+            attempt += 1
 
-        if response.text:
-            # pylint: disable=protected-access
-            obj._bypass = True
-            obj.hydrate(**response.json())
-            obj._bypass = False
+            try:
+                response = self._send_attempt(options)
+            except DeadlineExceededError:
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                if policy is None or not policy.can_retry(method):
+                    raise
 
-        return self
+                delay = policy.next_delay(attempt, monotonic() - started)
+
+                if delay is None or expires_within(delay):
+                    raise
+            else:
+                if (
+                    policy is None
+                    or response.ok
+                    or not policy.can_retry(method, response.status_code)
+                ):
+                    return response
+
+                delay = policy.next_delay(
+                    attempt,
+                    monotonic() - started,
+                    parse_retry_after(response.headers.get('Retry-After')),
+                )
+
+                if delay is None or expires_within(delay):
+                    return response
+
+            sleep(delay)
+
+    def _send_attempt(self, options: dict[str, Any]) -> 'Response':
+        """Send the request once, hedged when `Config.hedging` is set."""
+
+        policy = self._conf.hedging
+
+        if policy is None or options['method'] != 'get':
+            return self._send_once(options)
+
+        return self._send_hedged(policy, options)
+
+    def _send_hedged(
+        self,
+        policy: 'HedgingPolicy',
+        options: dict[str, Any],
+    ) -> 'Response':
+        """Send a duplicate of a slow request, and use the first response."""
+
+        policy.track()
+
+        # Duplicates run in other threads, with the same priority and scope
+        first = policy.executor.submit(
+            copy_context().run, self._send_timed, policy, options
+        )
+        done, _ = wait([first], timeout=policy.delay)
+
+        if done or not policy.acquire():
+            return first.result()
+
+        second = policy.executor.submit(
+            copy_context().run, self._send_timed, policy, options
+        )
+        pending = {first, second}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception() is None:
+                    if future is second:
+                        policy.won()
+
+                    return future.result()
+
+        # Both failed, the original error is raised
+        return first.result()
+
+    def _send_once(self, options: dict[str, Any]) -> 'Response':
+        """Send the request once, through the rate limiter and the circuit breaker."""
+
+        (limiter, key) = self._admit(options)
+        response = None
+
+        try:
+            timeout = self._timeout(options)
+            self._before_send(options)
+
+            try:
+                response = self._conf.pool.request(**{**options, 'timeout': timeout})
+            except Exception:
+                self._after_send(options)
+                raise
+            except BaseException:
+                # Interrupted, the host did not fail but a probe may be held
+                self._abort_send(options)
+                raise
+
+            self._after_send(options, response)
+        finally:
+            self._dismiss(limiter, key, response)
+
+        return response
+
+    def _send_timed(
+        self,
+        policy: 'HedgingPolicy',
+        options: dict[str, Any],
+    ) -> 'Response':
+        """Send the request once and record its latency."""
+
+        started = monotonic()
+        response = self._send_once(options)
+
+        policy.record(monotonic() - started)
+
+        return response
+
+    def _timeout(self, options: dict[str, Any]) -> 'float | Timeout | None':
+        """Timeouts of the call, for its endpoint and within the deadline of the context."""
+
+        budget = remaining()
+
+        if budget is not None and budget <= 0:
+            raise DeadlineExceededError('Deadline exceeded, the API call was not sent.')
+
+        return Timeout.resolve(
+            options['timeout'], urlsplit(options['url']).path, budget
+        )
+
+    def _transfer(self) -> TransferStats:
+        """Transfer statistics of the pool used to send requests."""
+
+        return self._conf.pool.transfer
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+from random import SystemRandom
+from typing import ClassVar
+
+_random = SystemRandom()
+
+
+class RetryPolicy:
+    """
+    Describe when and how failed API calls are sent again.
+
+    A call is retried when its method and status are listed in `statuses`,
+    connection errors and timeouts are retried for every listed method.
+    Statuses can be exact codes (like `408`) or classes (like `'5xx'`).
+
+    Delays follow an exponential backoff with full jitter, capped by
+    `max_backoff`, and retries stop when `attempts` or the `total`
+    time budget are exhausted. A delay asked by the API with a `Retry-After`
+    header is always honoured, the call is not retried if it does not fit
+    in the time budget.
+
+    When `in_doubt` is enabled, a payment creation failing in a way that does
+    not tell if it was created (timeout, connection reset, server error) is
+    resolved by searching the payment with its `unique_id` before sending it
+    again, see `Payment.send()`.
+    """
+
+    DEFAULT_STATUSES: ClassVar[dict[str, tuple[int | str, ...]]] = {  # pylint: disable=invalid-name
+        'delete': (408, 429, '5xx'),
+        'get': (408, 429, '5xx'),
+    }
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 2,
+        total: float | None = 10,
+        statuses: dict[str, tuple[int | str, ...]] | None = None,
+        in_doubt: bool = True,
+    ) -> None:
+        """
+        Create a new policy.
+
+        Args:
+            attempts: Maximum number of attempts, including the first one.
+            backoff: Base delay in seconds, doubled on every attempt.
+            max_backoff: Maximum delay in seconds between two attempts.
+            total: Maximum time in seconds spent on every attempts,
+                `None` for no limit.
+            statuses: Retryable statuses per HTTP method,
+                default to `RetryPolicy.DEFAULT_STATUSES`.
+            in_doubt: Resolve ambiguous payment creation failures.
+        """
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.total = total
+        self.in_doubt = in_doubt
+
+        if statuses is None:
+            statuses = self.DEFAULT_STATUSES
+
+        self.statuses = {method.lower(): codes for method, codes in statuses.items()}
+
+    def can_retry(self, method: str, status: int | None = None) -> bool:
+        """
+        Tell if a failed call may be sent again.
+
+        Args:
+            method: HTTP method.
+            status: HTTP status, `None` for connection errors and timeouts.
+
+        Returns:
+            Is the call retryable ?
+        """
+        codes = self.statuses.get(method.lower())
+
+        if codes is None:
+            return False
+
+        if status is None:
+            return True
+
+        return status in codes or f'{status // 100}xx' in codes
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """
+        Compute how long to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts already made.
+            elapsed: Time in seconds spent since the first attempt.
+            retry_after: Delay in seconds asked by the API, if any.
+
+        Returns:
+            Delay in seconds, `None` when no more attempt is allowed.
+        """
+        if attempt >= self.attempts:
+            return None
+
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        delay = _random.uniform(0, ceiling)
+
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.total is not None:
+            remaining = self.total - elapsed
+
+            if remaining <= 0:
+                return None
+
+            if retry_after is not None and retry_after > remaining:
+                return None
+
+            delay = min(delay, remaining)
+
+        return delay
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Callable
+from typing import Any
+
+
+class Schema:
+    """
+    Fields of an API object class, computed once when the class is created.
+
+    Hydration, serialisation and modification tracking only read the schema
+    and the object data, they never call a property getter, which could
+    populate the object in the middle of a hydration.
+
+    Attributes:
+        allowed: Fields sent to the API, from every `_allowed_attributes`.
+        datetimes: Fields holding a date, from every `_datetime_property`.
+        factories: Getters of `_init_<field>` properties, giving the class
+            of nested objects.
+        fields: Every property of the class.
+        setters: Setters used on hydration, only the ones defined by the
+            class itself.
+    """
+
+    def __init__(self, cls: type) -> None:
+        """
+        Compute the schema of a class.
+
+        Args:
+            cls: API object class.
+        """
+        properties: dict[str, property] = {}
+
+        self.allowed: frozenset[str] = frozenset()
+        self.datetimes: frozenset[str] = frozenset()
+
+        for parent in cls.mro():
+            self.allowed |= frozenset(getattr(parent, '_allowed_attributes', ()))
+            self.datetimes |= frozenset(getattr(parent, '_datetime_property', ()))
+
+        for parent in reversed(cls.mro()):
+            for name, value in vars(parent).items():
+                if isinstance(value, property):
+                    properties[name] = value
+
+        self.fields = frozenset(properties)
+        self.factories: dict[str, Callable[[Any], type]] = {
+            name: properties['_init_' + name].fget  # type: ignore[misc]
+            for name in properties
+            if '_init_' + name in properties
+        }
+        self.setters: dict[str, Callable[[Any, Any], None]] = {
+            name: value.fset
+            for name, value in vars(cls).items()
+            if isinstance(value, property) and value.fset is not None
+        }
+
+        self._classes: dict[str, type] = {}
+
+    def factory(self, obj: Any, name: str) -> type | None:
+        """
+        Class of the nested objects of a field.
+
+        Args:
+            obj: Object being hydrated.
+            name: Field name.
+
+        Returns:
+            Nested object class, `None` for fields without nested objects.
+        """
+        found = self._classes.get(name)
+
+        if found is None:
+            getter = self.factories.get(name)
+
+            if getter is None:
+                return None
+
+            # Factories may import their class, they are resolved on first use
+            found = self._classes[name] = getter(obj)
+
+        return found
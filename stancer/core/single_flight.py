@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from threading import Event
+from threading import Lock
+from typing import Any
+
+
+class _Call:
+    """A call in flight, and its outcome."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.error: BaseException | None = None
+        self.result: Any = None
+
+
+class SingleFlight:
+    """
+    Share one call between concurrent callers asking for the same thing.
+
+    The first caller for a key runs the call, callers arriving with the same
+    key while it is running wait for it and get the same result, or the same
+    error. Keys are forgotten as soon as the call ends, results are not cached.
+    """
+
+    def __init__(self) -> None:
+        """Create a new group of calls."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = Lock()
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """
+        Number of calls avoided by sharing a call in flight.
+
+        Returns:
+            Shared calls.
+        """
+        return self._shared
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run a call, or wait for the identical call in flight.
+
+        Args:
+            key: Call identifier.
+            func: The call.
+
+        Returns:
+            Call result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            owner = call is None
+
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self._shared += 1
+
+        if not owner:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Share one coroutine between concurrent tasks asking for the same thing.
+
+    Asynchronous counterpart of `SingleFlight`, calls are only shared between
+    tasks running on the same event loop.
+    """
+
+    def __init__(self) -> None:
+        """Create a new group of calls."""
+        self._calls: dict[tuple[int, Hashable], asyncio.Future] = {}
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """
+        Number of calls avoided by sharing a call in flight.
+
+        Returns:
+            Shared calls.
+        """
+        return self._shared
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or wait for the identical call in flight.
+
+        Args:
+            key: Call identifier.
+            func: Coroutine function making the call.
+
+        Returns:
+            Call result.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        future = self._calls.get(loop_key)
+
+        if future is not None:
+            self._shared += 1
+
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+            # The task running the call was cancelled, not this one
+            return await self.do(key, func)
+
+        future = self._calls[loop_key] = loop.create_future()
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            future.exception()  # Waiters still get it, it must not be logged as never retrieved
+            raise
+        finally:
+            del self._calls[loop_key]
+
+        future.set_result(result)
+
+        return result
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+_deadline: ContextVar[float | None] = ContextVar('stancer_deadline', default=None)
+
+
+def endpoint(path: str) -> str:
+    """
+    Endpoint of a requested path.
+
+    Args:
+        path: Requested path, like `/v1/checkout/paym_xxx`.
+
+    Returns:
+        Endpoint name, like `checkout`.
+    """
+    segments = [segment for segment in path.split('/') if segment]
+
+    return segments[1] if len(segments) > 1 else ''
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Give a total time budget to every API call made in the context.
+
+    A high-level operation, like `payment.refund()`, can chain many API calls.
+    Inside the context, every call is sent with the time remaining before the
+    deadline as timeout, retries stop when they would end after it, and a call
+    made once the deadline is passed raises `DeadlineExceededError` without
+    being sent.
+
+    Nested deadlines can only shorten the budget. The deadline applies to the
+    current thread or asynchronous task only.
+
+    Args:
+        seconds: Time budget in seconds.
+
+    Yields:
+        Nothing.
+    """
+    limit = monotonic() + seconds
+    current = _deadline.get()
+
+    if current is not None:
+        limit = min(limit, current)
+
+    token = _deadline.set(limit)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def expires_within(seconds: float) -> bool:
+    """
+    Tell if the deadline of the current context is passed within a delay.
+
+    Args:
+        seconds: Delay in seconds.
+
+    Returns:
+        `True` when the deadline will be passed, `False` without deadline.
+    """
+    left = remaining()
+
+    return left is not None and left <= seconds
+
+
+def remaining() -> float | None:
+    """
+    Time left before the deadline of the current context.
+
+    Returns:
+        Seconds left, negative once the deadline is passed, `None` without deadline.
+    """
+    limit = _deadline.get()
+
+    if limit is None:
+        return None
+
+    return limit - monotonic()
+
+
+class Timeout:
+    """
+    Connect, read and pool timeouts of API calls.
+
+    `connect` limits the time to open a connection, `read` the time to wait
+    for the response, and `pool` the time to wait for a free connection.
+    Synchronous pools never wait for a connection, they open a new one, so
+    `pool` only applies to asynchronous calls.
+
+    `endpoints` overrides timeouts for some endpoints, like a longer read
+    timeout when listing payments. Timeouts not given by an override are the
+    default ones.
+
+    Example:
+        Config().timeout = Timeout(
+            connect=2,
+            read=10,
+            endpoints={'checkout': Timeout(read=30)},
+        )
+    """
+
+    def __init__(
+        self,
+        connect: float | None = None,
+        read: float | None = None,
+        pool: float | None = None,
+        endpoints: Mapping[str, 'Timeout'] | None = None,
+    ) -> None:
+        """
+        Create new timeouts.
+
+        Args:
+            connect: Seconds to open a connection, `None` for no limit.
+            read: Seconds to wait for the response, `None` for no limit.
+            pool: Seconds to wait for a free connection, `None` for no limit.
+            endpoints: Timeouts by endpoint name, like `checkout` or `customers`.
+        """
+        self.connect = connect
+        self.endpoints = dict(endpoints or {})
+        self.pool = pool
+        self.read = read
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Timeout):
+            return NotImplemented
+
+        return (self.connect, self.read, self.pool, self.endpoints) == (
+            other.connect,
+            other.read,
+            other.pool,
+            other.endpoints,
+        )
+
+    def __repr__(self) -> str:
+        return f'Timeout(connect={self.connect}, read={self.read}, pool={self.pool})'
+
+    @classmethod
+    def resolve(
+        cls,
+        value: 'float | Timeout | None',
+        path: str,
+        budget: float | None = None,
+    ) -> 'float | Timeout | None':
+        """
+        Timeouts of a call.
+
+        Args:
+            value: `Config.timeout`, a number of seconds or timeouts.
+            path: Requested path, like `/v1/checkout/paym_xxx`.
+            budget: Seconds left before the deadline, see `remaining()`.
+
+        Returns:
+            Timeouts to give to the transport, a number of seconds
+            is kept as it is without deadline.
+        """
+        if not isinstance(value, Timeout):
+            if budget is None:
+                return value
+
+            value = cls(connect=value, read=value, pool=value)
+
+        override = value.endpoints.get(endpoint(path))
+
+        if override is not None:
+            value = cls(
+                connect=value.connect if override.connect is None else override.connect,
+                read=value.read if override.read is None else override.read,
+                pool=value.pool if override.pool is None else override.pool,
+            )
+
+        if budget is None:
+            return value
+
+        def limit(seconds: float | None) -> float:
+            return budget if seconds is None else min(seconds, budget)
+
+        return cls(
+            connect=limit(value.connect),
+            read=limit(value.read),
+            pool=limit(value.pool),
+        )
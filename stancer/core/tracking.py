@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+_flags: dict[tuple[frozenset[str], str], frozenset[str]] = {}
+_FLAGS_MAX = 4096
+
+
+def add_flag(flags: frozenset[str], name: str) -> frozenset[str]:
+    """Add a modified flag, objects modified the same way share their flags."""
+    key = (flags, name)
+    found = _flags.get(key)
+
+    if found is None:
+        found = flags | {name}
+
+        if len(_flags) < _FLAGS_MAX:
+            _flags[key] = found
+
+    return found
+
+
+def _changing(method: Any) -> Any:
+    """Wrap a container method, its owner is told after every call."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.changed()
+
+        return result
+
+    return wrapper
+
+
+class Flags(set):
+    """Modified flags given by an object, updating them changes the object."""
+
+    __slots__ = ('changed',)
+
+    def __init__(self, changed: Callable[[], None], flags: Any = ()) -> None:
+        super().__init__(flags)
+        self.changed = changed
+
+    def __reduce__(self) -> Any:
+        # Copies are plain sets, they are not the object flags
+        return (set, (set(self),))
+
+    __iand__ = _changing(set.__iand__)
+    __ior__ = _changing(set.__ior__)
+    __isub__ = _changing(set.__isub__)
+    __ixor__ = _changing(set.__ixor__)
+    add = _changing(set.add)
+    clear = _changing(set.clear)
+    difference_update = _changing(set.difference_update)
+    discard = _changing(set.discard)
+    intersection_update = _changing(set.intersection_update)
+    pop = _changing(set.pop)
+    remove = _changing(set.remove)
+    symmetric_difference_update = _changing(set.symmetric_difference_update)
+    update = _changing(set.update)
+
+
+class Items(list):
+    """Nested objects of an object, updating the list changes the object."""
+
+    __slots__ = ('changed',)
+
+    def __init__(self, changed: Callable[[], None], items: Any = ()) -> None:
+        super().__init__(items)
+        self.changed = changed
+
+    def __reduce__(self) -> Any:
+        # Copies are plain lists, they are not the object ones
+        return (list, (list(self),))
+
+    __delitem__ = _changing(list.__delitem__)
+    __iadd__ = _changing(list.__iadd__)
+    __imul__ = _changing(list.__imul__)
+    __setitem__ = _changing(list.__setitem__)
+    append = _changing(list.append)
+    clear = _changing(list.clear)
+    extend = _changing(list.extend)
+    insert = _changing(list.insert)
+    pop = _changing(list.pop)
+    remove = _changing(list.remove)
+    reverse = _changing(list.reverse)
+    sort = _changing(list.sort)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Mapping
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .compression import TransferStats
+from .timeout import Timeout
+
+
+def build_response(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    status_code: int,
+    reason: str | None,
+    headers: Mapping[str, str],
+    url: str,
+    content: bytes,
+    raw: Any = None,
+) -> requests.Response:
+    """
+    Build the response object returned by every transport.
+
+    Args:
+        status_code: HTTP status.
+        reason: HTTP reason phrase.
+        headers: Response headers.
+        url: Requested URL.
+        content: Response body.
+        raw: Underlying response, used to know its size on the network.
+
+    Returns:
+        A `requests.Response` filled with given values.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason  # type: ignore
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = content  # pylint: disable=protected-access
+    response.raw = raw
+
+    return response
+
+
+class AbstractTransport(ABC):
+    """
+    Long-lived HTTP connection pool sending every synchronous API call.
+
+    A transport only has to implement `request()`, which receives the prepared
+    call (method, URL, auth, body, headers, query parameters and timeout) and
+    returns a `requests.Response`. Connection errors are raised as
+    `requests.ConnectionError` and timeouts as `requests.Timeout`, so the
+    request layer handles every backend the same way.
+
+    Use `Config.transport` to choose the backend.
+    """
+
+    def __init__(
+        self,
+        connections: int = 10,
+        maxsize: int = 10,
+        keep_alive: float | None = 60,
+    ) -> None:
+        """
+        Create a new pool.
+
+        Args:
+            connections: Number of hosts kept in the pool.
+            maxsize: Maximum number of connections kept open per host.
+            keep_alive: Number of seconds an idle pool is kept open,
+                `None` to never close it.
+        """
+        self._connections = connections
+        self._maxsize = maxsize
+        self._keep_alive = keep_alive
+
+        self._lock = Lock()
+        self._last_used: float | None = None
+
+        self._expired = 0
+        self._requests = 0
+
+        self.transfer = TransferStats()
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Close every opened connection, the pool must stay usable."""
+
+    def _expire_idle(self) -> None:
+        """Close idle connections and count the request about to be sent."""
+        now = monotonic()
+
+        with self._lock:
+            if (
+                self._keep_alive is not None
+                and self._last_used is not None
+                and now - self._last_used > self._keep_alive
+            ):
+                self._close()
+                self._expired += 1
+
+            self._last_used = now
+            self._requests += 1
+
+    @abstractmethod
+    def _managers(self) -> Iterable[Any]:
+        """Underlying `urllib3` pool managers, used for statistics."""
+
+    @property
+    def connections(self) -> int:
+        """
+        Number of hosts kept in the pool.
+
+        Returns:
+            Number of host pools.
+        """
+        return self._connections
+
+    @property
+    def keep_alive(self) -> float | None:
+        """
+        Idle time, in seconds, before connections are closed.
+
+        Returns:
+            Keep-alive idle timeout.
+        """
+        return self._keep_alive
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of connections kept open per host.
+
+        Returns:
+            Connections per host.
+        """
+        return self._maxsize
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Pool statistics.
+
+        `requests` is the number of requests sent through the pool,
+        `connections` the number of connections opened since the last idle
+        expiration, `reused` the number of requests sent on an already opened
+        connection, `hosts` the number of host pools currently opened and
+        `expired` the number of times the pool was closed for being idle.
+        Bytes exchanged and saved by compression are added, see `TransferStats`.
+
+        Returns:
+            Pool statistics.
+        """
+        connections = 0
+        hosts = 0
+        sent = 0
+
+        for manager in self._managers():
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+
+                if pool is None:
+                    continue
+
+                hosts += 1
+                connections += pool.num_connections
+                sent += pool.num_requests
+
+        return {
+            'connections': connections,
+            'expired': self._expired,
+            'hosts': hosts,
+            'requests': self._requests,
+            'reused': max(sent - connections, 0),
+            **self.transfer.stats,
+        }
+
+    def close(self) -> None:
+        """Close every opened connection."""
+        with self._lock:
+            self._close()
+            self._last_used = None
+
+    @abstractmethod
+    def request(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        *,
+        auth: tuple[str, str] | None = None,
+        data: str | bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, Any] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP request on a pooled connection.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            auth: Basic authentication user and password.
+            data: Request body.
+            headers: Request headers.
+            params: Query parameters.
+            timeout: Connect and read timeout in seconds, or split timeouts.
+
+        Returns:
+            API response.
+
+        Raises:
+            requests.ConnectionError: When the connection failed.
+            requests.Timeout: When the request timed out.
+        """
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.exceptions import HTTPError
+from urllib3.exceptions import NewConnectionError
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+
+from .timeout import Timeout
+from .transport import AbstractTransport
+from .transport import build_response
+
+
+class Urllib3ConnectionPool(AbstractTransport):
+    """
+    Long-lived HTTP connection pool, sending requests directly with `urllib3`.
+
+    It skips the session, adapter and hook layers of `requests`, which are not
+    used by the module, and only keeps the connection pool underneath.
+    Redirections are not followed and responses are fully read.
+
+    Use it with `Config.transport = Urllib3ConnectionPool`.
+    """
+
+    def __init__(
+        self,
+        connections: int = 10,
+        maxsize: int = 10,
+        keep_alive: float | None = 60,
+    ) -> None:
+        """
+        Create a new pool.
+
+        Args:
+            connections: Number of hosts kept in the pool.
+            maxsize: Maximum number of connections kept open per host.
+            keep_alive: Number of seconds an idle pool is kept open,
+                `None` to never close it.
+        """
+        super().__init__(
+            connections=connections,
+            maxsize=maxsize,
+            keep_alive=keep_alive,
+        )
+
+        self._default_headers = urllib3.util.make_headers(accept_encoding=True)
+        self._manager = urllib3.PoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            retries=False,
+        )
+
+    def _close(self) -> None:
+        """Close every opened connection, the pool must stay usable."""
+        self._manager.clear()
+
+    def _managers(self) -> Iterable[Any]:
+        """Underlying `urllib3` pool managers, used for statistics."""
+        return [self._manager]
+
+    @property
+    def manager(self) -> urllib3.PoolManager:
+        """
+        Underlying `urllib3` pool manager.
+
+        Returns:
+            Pool manager used to send requests.
+        """
+        return self._manager
+
+    def request(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        *,
+        auth: tuple[str, str] | None = None,
+        data: str | bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, Any] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP request on a pooled connection.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            auth: Basic authentication user and password.
+            data: Request body.
+            headers: Request headers.
+            params: Query parameters.
+            timeout: Connect and read timeout in seconds, or split timeouts.
+
+        Returns:
+            API response.
+
+        Raises:
+            requests.ConnectionError: When the connection failed.
+            requests.Timeout: When the request timed out.
+        """
+        self._expire_idle()
+
+        all_headers = {**self._default_headers, **(headers or {})}
+
+        if auth is not None:
+            all_headers.update(urllib3.util.make_headers(basic_auth=':'.join(auth)))
+
+        query = {
+            key: value for key, value in (params or {}).items() if value is not None
+        }
+
+        if query:
+            url += ('&' if '?' in url else '?') + urlencode(query, doseq=True)
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        timeouts: float | urllib3.Timeout | None
+
+        if isinstance(timeout, Timeout):
+            timeouts = urllib3.Timeout(connect=timeout.connect, read=timeout.read)
+        else:
+            timeouts = timeout
+
+        try:
+            response = self._manager.request(
+                method.upper(),
+                url,
+                body=data,
+                headers=all_headers,
+                redirect=False,
+                timeout=timeouts,
+            )
+        except NewConnectionError as err:
+            raise requests.ConnectionError(str(err)) from err
+        except ConnectTimeoutError as err:
+            raise requests.ConnectTimeout(str(err)) from err
+        except Urllib3TimeoutError as err:
+            raise requests.ReadTimeout(str(err)) from err
+        except HTTPError as err:
+            raise requests.ConnectionError(str(err)) from err
+
+        return build_response(
+            response.status,
+            response.reason,
+            response.headers,
+            url,
+            response.data,
+            raw=response,
+        )
@@ -3,7 +3,7 @@
 from .core import AbstractCountry
 from .core import AbstractName
 from .core import AbstractObject
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .core.decorators import validate_type
 from .core.helpers import coerce_uuid
 from .exceptions import InvalidCustomerEmailError
@@ -14,6 +14,8 @@ from .exceptions import InvalidCustomerMobileError
 class Customer(AbstractObject, AbstractName, AbstractCountry):
     """Representation of a customer."""
 
+    __slots__ = ()
+
     _ENDPOINT = 'customers'
 
     _allowed_attributes = [
@@ -22,8 +24,7 @@ class Customer(AbstractObject, AbstractName, AbstractCountry):
         'mobile',
     ]
 
-    @property
-    @populate_on_call
+    @field
     def email(self) -> str | None:
         """
         Customer's email.
@@ -44,8 +45,7 @@ class Customer(AbstractObject, AbstractName, AbstractCountry):
     def email(self, value: str) -> None:
         self._data['email'] = value
 
-    @property
-    @populate_on_call
+    @field
     def external_id(self) -> str | None:
         """
         Customer's external ID.
@@ -87,8 +87,7 @@ class Customer(AbstractObject, AbstractName, AbstractCountry):
 
         return True
 
-    @property
-    @populate_on_call
+    @field
     def mobile(self) -> str | None:
         """
         Customer's mobile phone number.
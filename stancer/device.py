@@ -5,7 +5,7 @@ import os
 from ipaddress import ip_address
 
 from .core import AbstractObject
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .core.decorators import validate_type
 from .exceptions import InvalidIpAddressError
 from .exceptions import InvalidPortError
@@ -38,6 +38,8 @@ def ip_validation(value):
 class Device(AbstractObject):
     """Representation of a device."""
 
+    __slots__ = ()
+
     _allowed_attributes = [
         'city',
         'country',
@@ -48,8 +50,7 @@ class Device(AbstractObject):
         'user_agent',
     ]
 
-    @property
-    @populate_on_call
+    @field
     def city(self) -> str | None:
         """
         Customer's city.
@@ -67,8 +68,7 @@ class Device(AbstractObject):
     def city(self, value: str) -> None:
         self._data['city'] = value
 
-    @property
-    @populate_on_call
+    @field
     def country(self) -> str | None:
         """
         Customer's country.
@@ -86,8 +86,7 @@ class Device(AbstractObject):
     def country(self, value: str) -> None:
         self._data['country'] = value
 
-    @property
-    @populate_on_call
+    @field
     def http_accept(self) -> str | None:
         """
         Customer's browser acceptance.
@@ -151,8 +150,7 @@ class Device(AbstractObject):
 
         return self
 
-    @property
-    @populate_on_call
+    @field
     def ip(self) -> str | None:
         """
         Customer's IP address.
@@ -176,8 +174,7 @@ class Device(AbstractObject):
     def ip(self, value: str) -> None:
         self._data['ip'] = value
 
-    @property
-    @populate_on_call
+    @field
     def languages(self) -> str | None:
         """
         Customer's browser accepted languages.
@@ -195,8 +192,7 @@ class Device(AbstractObject):
     def languages(self, value: str) -> None:
         self._data['languages'] = value
 
-    @property
-    @populate_on_call
+    @field
     def port(self) -> int | None:
         """
         Customer's port.
@@ -218,8 +214,7 @@ class Device(AbstractObject):
     def port(self, value: int) -> None:
         self._data['port'] = value
 
-    @property
-    @populate_on_call
+    @field
     def user_agent(self) -> str | None:
         """
         Customer's browser user agent.
@@ -2,21 +2,22 @@
 from .core import AbstractAmount
 from .core import AbstractObject
 from .core import AbstractSearch
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .payment import Payment
 
 
 class Dispute(AbstractObject, AbstractAmount, AbstractSearch):
     """Representation of a dispute."""
 
+    __slots__ = ()
+
     _ENDPOINT = 'disputes'
 
     @property
     def _init_payment(self) -> type[Payment]:
         return Payment
 
-    @property
-    @populate_on_call
+    @field
     def order_id(self) -> str | None:
         """
         External order id.
@@ -26,8 +27,7 @@ class Dispute(AbstractObject, AbstractAmount, AbstractSearch):
         """
         return self._data.get('order_id')
 
-    @property
-    @populate_on_call
+    @field
     def payment(self) -> Payment | None:
         """
         Original payment.
@@ -37,8 +37,7 @@ class Dispute(AbstractObject, AbstractAmount, AbstractSearch):
         """
         return self._data.get('payment')
 
-    @property
-    @populate_on_call
+    @field
     def response(self) -> str | None:
         """
         API response code.
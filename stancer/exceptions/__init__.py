@@ -4,7 +4,9 @@ from .base import StancerTypeError
 from .base import StancerValueError
 from .base import StancerWarning
 from .http import BadRequestError
+from .http import CircuitOpenError
 from .http import ConflictError
+from .http import DeadlineExceededError
 from .http import ForbiddenError
 from .http import GoneError
 from .http import HTTPError
@@ -18,6 +20,7 @@ from .http import RequestTimeoutError
 from .http import StancerHTTPClientError
 from .http import StancerHTTPError
 from .http import StancerHTTPServerError
+from .http import TooManyRequestsError
 from .http import UnauthorizedError
 from .invalid_value import InvalidAmountError
 from .invalid_value import InvalidAuthError
@@ -65,6 +68,8 @@ __all__ = (
     'StancerHTTPError',
     'StancerHTTPClientError',
     'StancerHTTPServerError',
+    'CircuitOpenError',
+    'DeadlineExceededError',
     'BadRequestError',
     'UnauthorizedError',
     'PaymentRequiredError',
@@ -76,6 +81,7 @@ __all__ = (
     'RequestTimeoutError',
     'ConflictError',
     'GoneError',
+    'TooManyRequestsError',
     'InternalServerError',
     'InvalidAmountError',
     'InvalidAuthError',
@@ -3,6 +3,7 @@
 
 from requests import HTTPError
 from requests import Response
+from requests import Timeout
 
 from .base import StancerException
 
@@ -111,6 +112,49 @@ class StancerHTTPError(StancerException, HTTPError):
         return (message, type_data)
 
 
+class CircuitOpenError(StancerHTTPError):
+    """
+    Raised without calling the API while the circuit breaker of a host is open.
+
+    See `CircuitBreaker`.
+    """
+
+    reason = 'Circuit open'
+    status_code = None
+
+    def __new__(cls, host: str, *args, **kwargs):
+        """
+        Called to create a new instance of `CircuitOpenError`.
+
+        Args:
+            host: Host rejected by the circuit breaker.
+
+        Returns:
+            A brand new instance waiting to get initialized with `__init__`.
+        """
+        return HTTPError.__new__(cls, host, *args, **kwargs)
+
+    # There is no response to read, the error is built like `requests.HTTPError`
+    # pylint: disable=super-init-not-called, non-parent-init-called
+    def __init__(self, host: str, retry_after: float | None = None) -> None:
+        message = f'Circuit open for "{host}", API calls are rejected.'
+
+        HTTPError.__init__(self, message)
+
+        self.host = host
+        self.message = message
+        self.retry_after = retry_after
+        self.type = None
+
+
+class DeadlineExceededError(StancerException, Timeout):
+    """
+    Raised without calling the API once the deadline of the context is passed.
+
+    It also inherits from `requests.Timeout`, see `deadline()`.
+    """
+
+
 class StancerHTTPClientError(StancerHTTPError):
     """Base exception for HTTP 4xx status."""
 
@@ -200,6 +244,26 @@ class GoneError(StancerHTTPClientError):
     reason = 'Gone'
 
 
+class TooManyRequestsError(StancerHTTPClientError):
+    """
+    HTTP 429 - Too Many Requests
+
+    `retry_after` is the number of seconds the API asked to wait before
+    sending another request, `None` if it did not tell.
+    """
+
+    status_code = 429
+    reason = 'Too Many Requests'
+
+    def __init__(self, response: Response, *args, **kwargs) -> None:
+        # pylint: disable=import-outside-toplevel
+        from ..core.rate_limit import parse_retry_after
+
+        super().__init__(response, *args, **kwargs)
+
+        self.retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+
 class InternalServerError(StancerHTTPServerError):
     """HTTP 500 - Internal Server Error"""
 
@@ -1,20 +1,35 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
+from time import monotonic
+from time import sleep
 from typing import Any
 
+import requests
+
 from .card import Card
+from .config import Config
 from .core import AbstractAmount
 from .core import AbstractCountry
 from .core import AbstractObject
 from .core import AbstractSearch
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .core.decorators import validate_type
 from .core.helpers import coerce_status
 from .core.helpers import coerce_uuid
 from .core.payment import PaymentAuth
 from .core.payment import PaymentPage
 from .core.payment import PaymentRefund
+from .core.payment import RefundLedger
+from .core.retry import RetryPolicy
 from .customer import Customer
 from .exceptions import InvalidAmountError
 from .exceptions import InvalidCardError
@@ -28,10 +43,18 @@ from .exceptions import InvalidSearchFilter
 from .exceptions import InvalidSepaError
 from .exceptions import InvalidStatusError
 from .exceptions import MissingPaymentMethodError
+from .exceptions import RequestTimeoutError
+from .exceptions import StancerException
+from .exceptions import StancerHTTPServerError
 from .exceptions import StancerNotImplementedError
 from .sepa import Sepa
 from .status.payment import PaymentStatus
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
 # This code is a Hack to let us use Self from typing if available, else we use TypeVar
 try:
     # Self is available in Python 3.11
@@ -45,6 +68,23 @@ ORDER_ID_MAX_LEN = 36
 
 UNIQUE_ID_MAX_LEN = 36
 
+# Called with every payment sent by `send_many()`, and its error if any
+SendCallback = Callable[['Payment', Exception | None], None]
+
+# Errors which do not tell if a payment was created or not
+IN_DOUBT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    RequestTimeoutError,
+    StancerHTTPServerError,
+)
+
+# Errors given with their payment by `send_many()`, any other error is raised
+SEND_ERRORS: tuple[type[Exception], ...] = (StancerException, requests.RequestException)
+
+if httpx is not None:
+    SEND_ERRORS += (httpx.HTTPError,)
+
 
 class Payment(
     AbstractObject,
@@ -54,10 +94,12 @@ class Payment(
     PaymentAuth,
     PaymentRefund,
     PaymentPage,
-):  # pylint: disable='too-many-ancestors'
-    # our way of building object imposes many ancestors
+):  # pylint: disable=too-many-ancestors, too-many-public-methods
+    # our way of building object imposes many ancestors, and many methods
     """Representation of a payment."""
 
+    __slots__ = ('_refund_ledger',)
+
     _ENDPOINT = 'checkout'
 
     _allowed_attributes = [
@@ -73,6 +115,31 @@ class Payment(
     _datetime_property = [
         'date_bank',
     ]
+    _refund_ledger: RefundLedger | None
+
+    def __init__(self, uid: str | None = None, **kwargs):
+        """
+        Create or get a Payment object.
+
+        You can optionaly pass an id uppon instanciation, it will be used to
+        get current object data on the API.
+
+        If you did not provide an id, the current object will be a new API
+        object.
+
+        You may also pass keywords arguments, we will use them hydrate the object.
+
+        Args:
+            uid: Object identifier.
+            **kwargs: Arbitrary keyword arguments, used to hydrate the object.
+
+        Returns:
+            An instance of the current object.
+        """
+        # Created with the first refund
+        self._refund_ledger = None
+
+        super().__init__(uid, **kwargs)
 
     @property
     def _init_card(self) -> type[Card]:
@@ -86,8 +153,7 @@ class Payment(
     def _init_sepa(self) -> type[Sepa]:
         return Sepa
 
-    @property
-    @populate_on_call
+    @field
     def capture(self) -> bool | None:
         """
         Do we need to capture the payment ?
@@ -111,8 +177,7 @@ class Payment(
     def capture(self, value: bool):
         self._data['capture'] = value
 
-    @property
-    @populate_on_call
+    @field
     def card(self) -> Card | None:
         """
         Source card for the payment.
@@ -134,8 +199,7 @@ class Payment(
         self._data['card'] = value
         self._data['method'] = 'card'
 
-    @property
-    @populate_on_call
+    @field
     def customer(self) -> Customer | None:
         """
         Customer handling the payment.
@@ -156,8 +220,7 @@ class Payment(
     def customer(self, value: Customer) -> None:
         self._data['customer'] = value
 
-    @property
-    @populate_on_call
+    @field
     def date_bank(self) -> datetime | None:
         """
         Value date.
@@ -167,6 +230,17 @@ class Payment(
         """
         return self._data.get('date_bank')
 
+    # We raise an error before return so no need for type checking here.
+    async def adelete(self: Self) -> Self:  # type: ignore # see above
+        """
+        Delete the current object.
+
+        Raises:
+            StancerNotImplementedError: In every case, payments can not be
+                delete, refund it.
+        """
+        return self.delete()
+
     # We raise an error before return so no need for type checking here.
     def delete(self: Self) -> Self:  # type: ignore # see above
         """
@@ -182,8 +256,7 @@ class Payment(
 
         raise StancerNotImplementedError(message)
 
-    @property
-    @populate_on_call
+    @field
     def description(self) -> str | None:
         """
         Open description for your uses.
@@ -204,8 +277,7 @@ class Payment(
     def description(self, value: str) -> None:
         self._data['description'] = value
 
-    @property
-    @populate_on_call
+    @field
     def fee(self) -> str | None:
         """
         Fee applied at checkout.
@@ -260,6 +332,26 @@ class Payment(
 
         return params
 
+    def hydrate(self: Self, **params) -> Self:
+        """
+        Hydrate current object.
+
+        Refunds given are counted in the payment refund totals.
+
+        Args:
+            **params: Elements used to hydrate the object.
+                Every key matching an object property will be used.
+
+        Returns:
+            Current instance.
+        """
+        super().hydrate(**params)
+
+        if params.get('refunds'):
+            self._count_refunds()
+
+        return self
+
     @property
     def is_error(self) -> bool:
         """
@@ -273,8 +365,7 @@ class Payment(
 
         return not self.is_success
 
-    @property
-    @populate_on_call
+    @field
     def is_not_error(self) -> bool:
         """
         Is the operation not an error ?
@@ -286,8 +377,7 @@ class Payment(
         """
         return not self.is_error
 
-    @property
-    @populate_on_call
+    @field
     def is_not_success(self) -> bool:
         """
         Is the operation not a success ?
@@ -299,8 +389,7 @@ class Payment(
         """
         return not self.is_success
 
-    @property
-    @populate_on_call
+    @field
     def is_success(self) -> bool:
         """
         Is the operation a success ?
@@ -316,8 +405,7 @@ class Payment(
 
         return self.status in (PaymentStatus.CAPTURED, PaymentStatus.TO_CAPTURE)
 
-    @property
-    @populate_on_call
+    @field
     def method(self) -> str | None:  # type: ignore
         """
         Payment method used.
@@ -327,8 +415,7 @@ class Payment(
         """
         return self._data.get('method')
 
-    @property
-    @populate_on_call
+    @field
     def order_id(self) -> str | None:
         """
         External order id.
@@ -358,8 +445,7 @@ class Payment(
     def order_id(self, value: str) -> None:
         self._data['order_id'] = value
 
-    @property
-    @populate_on_call
+    @field
     def response(self) -> str | None:
         """
         API response code.
@@ -372,8 +458,7 @@ class Payment(
         """
         return self._data.get('response')
 
-    @property
-    @populate_on_call
+    @field
     def response_message(self) -> str | None:
         """
         API response message.
@@ -392,12 +477,197 @@ class Payment(
             '51': 'Insufficient funds',
         }
 
+        if response is None:
+            return None
+
         return responses.get(response)
 
+    def _check_payment(self) -> None:
+        """Check the payment can be sent."""
+        if self.amount is None:
+            message = 'You must provide an amount before sending a payment.'
+            raise InvalidAmountError(message)
+
+        if self.currency is None:
+            message = 'You must provide a currency before sending a payment.'
+            raise InvalidCurrencyError(message)
+
+        if self.card is not None and self.card.is_not_complete:
+            message = 'Your card is incomplete.'
+            raise MissingPaymentMethodError(message)
+
+        if self.sepa is not None and self.sepa.is_not_complete:
+            message = 'Your SEPA account is incomplete.'
+            raise MissingPaymentMethodError(message)
+
+    def _check_send(self, callback: SendCallback | None) -> Exception | None:
+        """Check a new payment before sending it, returns its error."""
+        # Sent payments need their API data to be checked, done while sending
+        if self.id is not None:
+            return None
+
+        try:
+            self._check_payment()
+        except StancerException as err:
+            if callback is not None:
+                callback(self, err)
+
+            return err
+
+        return None
+
+    @classmethod
+    def _concurrency(cls, concurrency: int | None) -> int:
+        """Return how many payments can be sent at the same time."""
+        config = cls._client_config
+
+        if config is None:
+            config = Config()
+
+        return concurrency or config.pool_maxsize
+
+    def _in_doubt_policy(self) -> RetryPolicy | None:
+        """Return the retry policy if an ambiguous creation can be resolved."""
+        policy = self._config.retry
+
+        if policy is None or not policy.in_doubt:
+            return None
+
+        if self.id is not None or not self.unique_id:
+            return None
+
+        return policy
+
+    def _recover(self, found: 'Payment | None') -> bool:
+        """Use the payment created by an ambiguous call, if any."""
+        if found is None:
+            return False
+
+        self._id = found.id
+        self._populated = False
+
+        # It was created with our data, nothing is left to send
+        del self._modified
+
+        return True
+
+    async def asend(self: Self) -> Self:
+        """
+        Create or update the payment, asynchronously.
+
+        See `Payment.send()`.
+
+        Returns:
+            Current instance.
+
+        Raises:
+            InvalidAmountError: When called without any amount setted.
+            InvalidCurrencyError: When called without any currency.
+            StancerHTTPError: On error during with the API (may be child instance
+                of StancerHTTPError).
+            MissingPaymentMethodError: When called without any payment method
+                or if this method is uncomplete
+                (you may have forgotten the card number).
+        """
+        if self.id is not None:
+            await self.apopulate()
+
+        self._check_payment()
+        self._create_device()
+        policy = self._in_doubt_policy()
+
+        if policy is None:
+            return await super().asend()
+
+        started = monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                return await super().asend()
+            except IN_DOUBT_ERRORS:
+                delay = policy.next_delay(attempt, monotonic() - started)
+
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+
+            found = None
+
+            async for found in type(self).alist(unique_id=self.unique_id):
+                break
+
+            if self._recover(found):
+                return await self.apopulate()
+
+    @classmethod
+    async def asend_many(
+        cls,
+        payments: Iterable['Payment'],
+        concurrency: int | None = None,
+        callback: SendCallback | None = None,
+    ) -> AsyncIterator[tuple['Payment', Exception | None]]:
+        """
+        Create or update many payments concurrently, asynchronously.
+
+        See `Payment.send_many()`, payments are sent by tasks instead of threads.
+
+        Args:
+            payments: Payments to send.
+            concurrency: Maximum number of payments sent at the same time,
+                default to `Config.pool_maxsize`.
+            callback: Called with every payment once sent, and its error.
+
+        Yields:
+            Every payment with its error, `None` if it was sent, in input order.
+        """
+        batch = list(payments)
+        errors = [cls._check_send(payment, callback) for payment in batch]
+        slots = asyncio.Semaphore(cls._concurrency(concurrency))
+
+        async def send(payment: 'Payment') -> Exception | None:
+            error = None
+
+            async with slots:
+                try:
+                    await payment.asend()
+                except SEND_ERRORS as err:
+                    error = err
+
+            if callback is not None:
+                callback(payment, error)
+
+            return error
+
+        tasks = [
+            None if error is not None else asyncio.ensure_future(send(payment))
+            for payment, error in zip(batch, errors)
+        ]
+
+        try:
+            for payment, error, task in zip(batch, errors, tasks):
+                if task is not None:
+                    error = await task
+
+                yield (payment, error)
+        finally:
+            for task in tasks:
+                if task is not None:
+                    task.cancel()
+
     def send(self: Self) -> Self:
         """
         Create or update the payment.
 
+        When `Config.retry` is set with `in_doubt` enabled and the payment has
+        a `unique_id`, a creation failing without telling if the payment was
+        created (timeout, connection reset, server error) is not blindly sent
+        again. We first search a payment with the same `unique_id`, and only
+        send it again if none was found.
+
         Returns:
             Current instance.
 
@@ -410,28 +680,116 @@ class Payment(
                 or if this method is uncomplete
                 (you may have forgotten the card number).
         """
-        if self.amount is None:
-            message = 'You must provide an amount before sending a payment.'
-            raise InvalidAmountError(message)
+        self._check_payment()
+        self._create_device()
+        policy = self._in_doubt_policy()
 
-        if self.currency is None:
-            message = 'You must provide a currency before sending a payment.'
-            raise InvalidCurrencyError(message)
+        if policy is None:
+            return super().send()
 
-        if self.card is not None and self.card.is_not_complete:
-            message = 'Your card is incomplete.'
-            raise MissingPaymentMethodError(message)
+        started = monotonic()
+        attempt = 0
 
-        if self.sepa is not None and self.sepa.is_not_complete:
-            message = 'Your SEPA account is incomplete.'
-            raise MissingPaymentMethodError(message)
+        while True:
+            attempt += 1
 
-        self._create_device()
+            try:
+                return super().send()
+            except IN_DOUBT_ERRORS:
+                delay = policy.next_delay(attempt, monotonic() - started)
 
-        return super().send()
+                if delay is None:
+                    raise
 
-    @property
-    @populate_on_call
+            sleep(delay)
+
+            found = next(type(self).list(unique_id=self.unique_id), None)
+
+            if self._recover(found):
+                return self.populate()
+
+    @classmethod
+    def send_many(
+        cls,
+        payments: Iterable['Payment'],
+        concurrency: int | None = None,
+        callback: SendCallback | None = None,
+    ) -> Iterator[tuple['Payment', Exception | None]]:
+        """
+        Create or update many payments concurrently.
+
+        New payments are all checked first, like `Payment.send()` does, so a
+        payment missing its amount or its payment method is reported before
+        any API call. Payments are then sent by `concurrency` threads sharing
+        the connection pool, through the retry policy and the rate limiter.
+
+        A failing payment does not stop the others, its error is given with
+        it instead of being raised. Results are given in input order, while
+        `callback` is called as soon as a payment is sent, from the sending
+        thread, and can be used to report progress.
+
+        Sending starts right away. Closing the iterator before its end cancels
+        payments not sent yet.
+
+        Example:
+            for payment, error in Payment.send_many(payments, concurrency=8):
+                if error is not None:
+                    logger.warning('%s failed: %s', payment.unique_id, error)
+
+        Args:
+            payments: Payments to send.
+            concurrency: Maximum number of payments sent at the same time,
+                default to `Config.pool_maxsize`.
+            callback: Called with every payment once sent, and its error.
+
+        Returns:
+            Every payment with its error, `None` if it was sent, in input order.
+        """
+        batch = list(payments)
+        errors = [cls._check_send(payment, callback) for payment in batch]
+        executor = ThreadPoolExecutor(
+            max_workers=cls._concurrency(concurrency),
+            thread_name_prefix='stancer-send',
+        )
+
+        def send(payment: 'Payment') -> Exception | None:
+            error = None
+
+            try:
+                payment.send()
+            except SEND_ERRORS as err:
+                error = err
+
+            if callback is not None:
+                callback(payment, error)
+
+            return error
+
+        # Payments are sent with the client scope, deadline and priority of the caller
+        futures = [
+            None
+            if error is not None
+            else executor.submit(copy_context().run, send, payment)
+            for payment, error in zip(batch, errors)
+        ]
+
+        executor.shutdown(wait=False)
+
+        def results() -> Iterator[tuple['Payment', Exception | None]]:
+            try:
+                for payment, error, future in zip(batch, errors, futures):
+                    if future is not None:
+                        error = future.result()
+
+                    yield (payment, error)
+            finally:
+                for future in futures:
+                    if future is not None:
+                        future.cancel()
+
+        return results()
+
+    @field
     def sepa(self) -> Sepa | None:
         """
         Source SEPA account for the payment.
@@ -453,8 +811,7 @@ class Payment(
         self._data['sepa'] = value
         self._data['method'] = 'sepa'
 
-    @property
-    @populate_on_call
+    @field
     def status(self) -> str | None:
         """
         Payment status.
@@ -469,8 +826,7 @@ class Payment(
     def status(self, value: str) -> None:
         self._data['status'] = value
 
-    @property
-    @populate_on_call
+    @field
     def unique_id(self) -> str | None:
         """
         External unique ID.
@@ -7,15 +7,27 @@ from typing import Any
 
 from .core import AbstractAmount
 from .core import AbstractObject
-from .core.decorators import populate_on_call
+from .core.decorators import field
 
 if TYPE_CHECKING:
+    from .core.payment import RefundLedger
     from .payment import Payment
 
+# This code is a Hack to let us use Self from typing if available, else we use TypeVar
+try:
+    # Self is available in Python 3.11
+    from typing import Self  # type: ignore
+except ImportError:
+    from typing import TypeVar
+
+    Self = TypeVar('Self', bound='Refund')  # type: ignore
+
 
 class Refund(AbstractObject, AbstractAmount):
     """Representation of a refund."""
 
+    __slots__ = ('_ledger',)
+
     _ENDPOINT = 'refunds'
 
     _allowed_attributes = [
@@ -25,6 +37,7 @@ class Refund(AbstractObject, AbstractAmount):
         'date_bank',
         'date_refund',
     ]
+    _ledger: 'RefundLedger | None'
 
     def __init__(self, uid: str | None = None, **kwargs):
         """
@@ -45,6 +58,9 @@ class Refund(AbstractObject, AbstractAmount):
         Returns:
             An instance of the current object.
         """
+        # Ledger of the payment counting the refund
+        self._ledger = None
+
         super().__init__(uid, **kwargs)
         self._modified = 'payment'
 
@@ -54,8 +70,7 @@ class Refund(AbstractObject, AbstractAmount):
 
         return Payment
 
-    @property
-    @populate_on_call
+    @field
     def date_bank(self) -> datetime | None:
         """
         Value date.
@@ -65,8 +80,7 @@ class Refund(AbstractObject, AbstractAmount):
         """
         return self._data.get('date_bank')
 
-    @property
-    @populate_on_call
+    @field
     def date_refund(self) -> datetime | None:
         """
         Date when the refund is sent to the bank.
@@ -76,8 +90,27 @@ class Refund(AbstractObject, AbstractAmount):
         """
         return self._data.get('date_refund')
 
-    @property
-    @populate_on_call
+    def hydrate(self: Self, **params) -> Self:
+        """
+        Hydrate current object.
+
+        The refund is counted again by the ledger of its payment.
+
+        Args:
+            **params: Elements used to hydrate the object.
+                Every key matching an object property will be used.
+
+        Returns:
+            Current instance.
+        """
+        super().hydrate(**params)
+
+        if self._ledger is not None:
+            self._ledger.record(self)
+
+        return self
+
+    @field
     def payment(self) -> 'Payment | None':
         """
         Original payment.
@@ -87,8 +120,7 @@ class Refund(AbstractObject, AbstractAmount):
         """
         return self._data.get('payment')
 
-    @property
-    @populate_on_call
+    @field
     def status(self) -> str | None:
         """
         Refund status.
@@ -8,7 +8,7 @@ from .core import AbstractCountry
 from .core import AbstractLast4
 from .core import AbstractName
 from .core import AbstractObject
-from .core.decorators import populate_on_call
+from .core.decorators import field
 from .core.decorators import validate_type
 from .exceptions import InvalidBicError
 from .exceptions import InvalidDateMandateError
@@ -19,6 +19,8 @@ from .exceptions import InvalidMandateError
 class Sepa(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     """Representation of a SEPA account."""
 
+    __slots__ = ()
+
     _ENDPOINT = 'sepa'
 
     _allowed_attributes = [
@@ -30,8 +32,7 @@ class Sepa(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
     ]
     _repr_ignore = {'iban'}
 
-    @property
-    @populate_on_call
+    @field
     def bic(self) -> str | None:
         """
         Bank Identifier Code.
@@ -55,8 +56,7 @@ class Sepa(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
 
         self._data['bic'] = value
 
-    @property
-    @populate_on_call
+    @field
     def date_mandate(self) -> datetime | None:
         """
         Mandate signature date.
@@ -91,8 +91,7 @@ class Sepa(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
 
         return re.sub(r'(.{,4})', '\\1 ', iban).strip()
 
-    @property
-    @populate_on_call
+    @field
     def iban(self) -> str | None:
         """
         International Bank Account Number.
@@ -147,8 +146,7 @@ class Sepa(AbstractObject, AbstractName, AbstractCountry, AbstractLast4):
 
         return True
 
-    @property
-    @populate_on_call
+    @field
     def mandate(self) -> str | None:
         """
         Referring mandate.
@@ -9,7 +9,10 @@ from datetime import date
 from random import choice
 from random import randint
 
+import pytest
+
 from stancer import Config
+from stancer.core import AsyncConnectionPool
 from stancer.exceptions import BadRequestError
 from stancer.exceptions import ConflictError
 from stancer.exceptions import ForbiddenError
@@ -23,6 +26,7 @@ from stancer.exceptions import ProxyAuthenticationRequiredError
 from stancer.exceptions import RequestTimeoutError
 from stancer.exceptions import StancerHTTPClientError
 from stancer.exceptions import StancerHTTPServerError
+from stancer.exceptions import TooManyRequestsError
 from stancer.exceptions import UnauthorizedError
 
 
@@ -36,6 +40,36 @@ class TestHelper:
 
         del conf.default_timezone
 
+    def mock_async_api(self, monkeypatch, *replies):
+        # Route asynchronous calls to `(method, url, status, json)` replies,
+        # every reply is used once, returns the list of sent requests
+        httpx = pytest.importorskip('httpx')
+        calls = []
+        pending = list(replies)
+
+        def handler(request):
+            calls.append(request)
+            url = str(request.url).split('?')[0]
+
+            for idx, (method, location, status, body) in enumerate(pending):
+                if method == request.method and location == url:
+                    del pending[idx]
+
+                    if isinstance(body, Exception):
+                        raise body
+
+                    if body is None:
+                        return httpx.Response(status)
+
+                    return httpx.Response(status, json=body)
+
+            return httpx.Response(404, json={})
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(Config(), '_async_pool', pool)
+
+        return calls
+
     def random_integer(self, min, max=0):
         if max < min:
             (min, max) = (max, min)
@@ -209,6 +243,7 @@ class TestHelper:
             (408, RequestTimeoutError),
             (409, ConflictError),
             (410, GoneError),
+            (429, TooManyRequestsError),
             (500, InternalServerError),
             (499, StancerHTTPClientError),
             (599, StancerHTTPServerError),
@@ -1,8 +1,17 @@
 """Test abstract object object"""
 
+import copy
+import gc
+import weakref
+
 import pytest
+import responses
 
+from stancer import Client
 from stancer import Config
+from stancer import Customer
+from stancer import Payment
+from stancer import Refund
 from stancer.core import AbstractObject
 
 from ..TestHelper import TestHelper
@@ -65,6 +74,327 @@ class TestAbstractObject(TestHelper):
             == f'<AbstractObject("{uid}", {key1}="{value1}", {key2}={value2}) at 0x{id(obj):x}>'
         )
 
+    @responses.activate
+    def test_field(self):
+        uid = f'paym_{self.random_string(24)}'
+        obj = Payment(uid, capture=False)
+
+        responses.add(
+            responses.GET,
+            obj.uri,
+            json={'id': uid, 'amount': 500, 'description': 'Populated'},
+        )
+
+        assert type(Payment.amount).__name__ == 'field'
+        assert isinstance(Payment.amount, property)
+        assert Payment.amount.__doc__
+
+        # Falsy values already known do not populate the object
+        assert obj.capture is False
+        assert len(responses.calls) == 0
+
+        # Missing ones do, once
+        assert obj.description == 'Populated'
+        assert obj.fee is None
+        assert obj.amount == 500
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_hydrate(self):
+        # Hydrating an object with an id never populates it
+        obj = Payment().hydrate(
+            id=f'paym_{self.random_string(24)}',
+            amount=500,
+            created=1541586569,
+            customer={'id': f'cust_{self.random_string(24)}', 'name': 'Name'},
+            refunds=[{'id': f'refd_{self.random_string(24)}', 'amount': 100}],
+            unknown='value',
+        )
+
+        assert len(responses.calls) == 0
+        assert obj._data['amount'] == 500
+        assert obj._data['created'].year == 2018
+        assert obj._data['customer']._data['name'] == 'Name'
+        assert obj._data['refunds'][0]._data['amount'] == 100
+        assert obj._data['unknown'] == 'value'
+        assert obj.is_modified
+
+        # `to_json_repr` and `is_modified` do not populate either
+        assert obj.to_json_repr() == {'amount': 500, 'customer': {'name': 'Name'}}
+        assert len(responses.calls) == 0
+
+    def test_hydrate_list(self):
+        uids = ['refd_' + self.random_string(24) for _ in range(3)]
+        payment = Payment()
+
+        payment.hydrate(refunds=[{'id': uid, 'amount': 100} for uid in uids[:2]])
+
+        refunds = list(payment.refunds)
+
+        # Known objects are updated in place and keep their place
+        payment.hydrate(
+            refunds=[
+                {'id': uids[2], 'amount': 300},
+                {'id': uids[1], 'status': 'refunded'},
+                {'id': uids[2], 'status': 'refunded'},
+                {'amount': 50},
+                {'amount': 60},
+            ]
+        )
+
+        assert payment.refunds[:2] == refunds
+        assert [refund.id for refund in payment.refunds] == uids + [None, None]
+        assert 'status' not in refunds[0]._data
+        assert refunds[1].amount == 100
+        assert refunds[1].status == 'refunded'
+        assert payment.refunds[2].amount == 300
+        assert payment.refunds[2].status == 'refunded'
+
+        # Objects without id are never merged
+        assert payment.refunds[3].amount == 50
+        assert payment.refunds[4].amount == 60
+
+    def test_is_modified(self):
+        payment = Payment(
+            amount=500,
+            card={'id': 'card_' + self.random_string(24)},
+            customer={'id': 'cust_' + self.random_string(24)},
+        )
+        card = payment.card
+
+        del payment._modified
+        del card._modified
+
+        assert payment.is_not_modified
+        assert payment.to_json_repr() == {}
+
+        # Known states follow every change in the graph
+        card.name = 'John Doe'
+
+        assert payment.is_modified
+        assert payment.to_json_repr() == {'card': {'name': 'John Doe'}}
+
+        del card._modified
+
+        assert payment.is_not_modified
+
+        # Even with flags kept by someone else
+        flags = card._modified
+
+        assert payment.is_not_modified
+
+        flags.add('zip_code')
+
+        assert payment.is_modified
+
+        flags.clear()
+
+        assert payment.is_not_modified
+
+        # Or with a nested object replaced
+        other = Customer(name='Jane Doe')
+
+        payment.hydrate(customer=other)
+
+        assert payment.is_modified
+
+    def test_is_modified_graphs(self):
+        payments = [
+            Payment(card={'id': 'card_' + self.random_string(24)}) for _ in range(2)
+        ]
+        refund = Refund(payment=payments[0])
+
+        for obj in payments + [refund]:
+            del obj._modified
+
+        (first, second) = payments
+
+        assert first.is_not_modified
+        assert second.is_not_modified
+        assert refund.is_not_modified
+
+        # Changes are only told to the objects leading to them
+        first.card.name = 'John Doe'
+
+        assert first._AbstractObject__nested is None
+        assert second._AbstractObject__nested is False
+        assert refund.is_modified
+        assert second.is_not_modified
+
+        del first.card._modified
+
+        assert refund.is_not_modified
+        assert first.is_not_modified
+
+    def test_is_modified_lists(self):
+        class Basket(AbstractObject):
+            _allowed_attributes = ('items',)
+
+        basket = Basket(items=[Customer(name='Name')])
+        items = basket._data['items']
+
+        del basket._modified
+        del items[0]._modified
+
+        assert basket.is_not_modified
+
+        # Lists are watched once checked, even when changed in place
+        items = basket._data['items']
+        customer = Customer(name='Other')
+
+        items.append(customer)
+
+        assert basket.is_modified
+
+        items.remove(customer)
+
+        assert basket.is_not_modified
+
+        items[0].name = 'Changed'
+
+        assert basket.is_modified
+
+        del items[0]._modified
+
+        # Even with objects leading back to the ones being checked
+        other = Basket(items=[basket])
+
+        del other._modified
+        items.append(other)
+
+        assert basket.is_not_modified
+        assert other.is_not_modified
+
+        items[0].email = 'john.doe@example.com'
+
+        assert other.is_modified
+        assert basket.is_modified
+
+        del items[0]._modified
+
+        assert other.is_not_modified
+        assert basket.is_not_modified
+
+        # Copies are plain lists
+        assert type(list(items)) is list
+        assert type(copy.copy(items)) is list
+
+    @responses.activate
+    def test_populated(self):
+        uid = f'paym_{self.random_string(24)}'
+        card = {'id': f'card_{self.random_string(24)}', 'name': 'John Doe'}
+        payment = Payment(uid)
+
+        responses.add(
+            responses.GET,
+            payment.uri,
+            json={'id': uid, 'amount': 500, 'card': card, 'currency': 'eur'},
+        )
+
+        # Objects given by the API response are populated with the payment
+        payment.populate()
+
+        assert payment.is_populated
+        assert payment.card.is_populated
+        assert payment.card.name == 'John Doe'
+        assert len(responses.calls) == 1
+
+        # Objects given afterwards keep their own state
+        customer = Customer(f'cust_{self.random_string(24)}')
+        payment.customer = customer
+
+        payment.populate()
+
+        assert customer.is_not_populated
+
+        # States are only given when they change
+        payment.card._populated = False
+        payment._populated = True
+
+        assert payment.card.is_not_populated
+
+        payment._populated = False
+
+        assert customer.is_not_populated
+        assert payment.card.is_not_populated
+
+        # Errors are bypassed for the objects hydrated with the payment only
+        payment._bypass = True
+
+        assert payment.card._bypass is False
+
+        payment._bypass = False
+
+    def test_schema(self):
+        schema = Payment._schema
+
+        assert {'amount', 'card', 'customer', 'description'} <= schema.allowed
+        assert 'created' in schema.datetimes
+        assert {'card', 'customer', 'refunds', 'sepa'} == set(schema.factories)
+        assert 'description' in schema.setters
+        assert 'created' not in schema.setters
+        assert schema.factory(Payment(), 'customer') is Customer
+        assert schema.factory(Payment(), 'amount') is None
+
+        # Computed once per class
+        assert AbstractObject._schema is not Payment._schema
+        assert Payment._get_allowed_attributes() is schema.allowed
+
+        # Bound classes hydrate like the class they bind
+        bound = Client('stest_' + self.random_string(24)).bind(Payment)
+
+        assert bound._schema is schema
+        assert 'description' not in vars(bound)
+
+    def test_slots(self):
+        for cls in (
+            Payment,
+            Customer,
+            Client('stest_' + self.random_string(24)).bind(Payment),
+        ):
+            obj = cls(amount=500) if cls is not Customer else cls(name='Name')
+
+            # Attributes are in slots, the only dictionary is the data
+            dicts = [ref for ref in gc.get_referents(obj) if isinstance(ref, dict)]
+
+            assert dicts == [obj._data]
+            assert obj.__dict__ == obj._data
+            assert weakref.ref(obj)() is obj
+
+            with pytest.raises(AttributeError):
+                obj.unknown = 'value'
+
+        # Classes without slots keep the representation of their objects
+        class Unslotted(Payment):
+            pass
+
+        uid = 'paym_' + self.random_string(24)
+        obj = Unslotted(uid, amount=500, currency='eur')
+
+        assert obj.__dict__ == {'id': uid, 'amount': 500, 'currency': 'eur'}
+        assert vars(obj) == obj.__dict__
+        assert obj.amount == 500
+
+        with pytest.raises(ValueError):
+            obj.__dict__ = {}
+
+        # Objects modified the same way share their flags
+        first = Payment(amount=500, description='Description')
+        second = Payment(amount=800, description='Other')
+
+        assert first._AbstractObject__modified is second._AbstractObject__modified
+
+        # Until they are given to someone who could change them
+        first._modified.add('currency')
+
+        assert first._modified == {'amount', 'currency', 'description'}
+        assert second._modified == {'amount', 'description'}
+
+        del first._modified
+
+        assert first._AbstractObject__modified is None
+        assert first.is_not_modified
+
     def test_uri(self):
         obj = AbstractObject()
         conf = Config()
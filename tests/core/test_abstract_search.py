@@ -46,6 +46,19 @@ class TestAbstractSearch(TestHelper):
             date = datetime.now() + timedelta(days=1)
             AbstractSearch.list(created=date)
 
+    def test_invalid_exhaustive(self):
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Limit can not be used on an exhaustive list.',
+        ):
+            AbstractSearch.list(limit=10, exhaustive=True)
+
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Limit can not be used on an exhaustive list.',
+        ):
+            AbstractSearch.alist(limit=10, exhaustive=True)
+
     def test_invalid_filters(self):
         with pytest.raises(
             InvalidSearchFilter,
@@ -84,6 +97,19 @@ class TestAbstractSearch(TestHelper):
         ):
             AbstractSearch.list(limit=AbstractObject())
 
+    def test_invalid_read_ahead(self):
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Read ahead must be a positive integer.',
+        ):
+            AbstractSearch.list(limit=10, read_ahead=-1)
+
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Read ahead must be a positive integer.',
+        ):
+            AbstractSearch.list(limit=10, read_ahead=self.random_string(10))
+
     def test_invalid_start(self):
         with pytest.raises(
             InvalidSearchFilter,
@@ -102,3 +128,22 @@ class TestAbstractSearch(TestHelper):
             match='Start must be a positive integer.',
         ):
             AbstractSearch.list(start=AbstractObject())
+
+    def test_invalid_alist_read_ahead(self):
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Read ahead must be a positive integer.',
+        ):
+            AbstractSearch.alist(limit=10, read_ahead=-1)
+
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Read ahead must be a positive integer.',
+        ):
+            AbstractSearch.alist(limit=10, read_ahead=self.random_string(10))
+
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='Invalid search filters.',
+        ):
+            AbstractSearch.alist()
@@ -0,0 +1,145 @@
+"""Test asynchronous connection pool"""
+
+import asyncio
+
+import pytest
+
+from stancer import Config
+from stancer.core import AsyncConnectionPool
+
+from ..TestHelper import TestHelper
+
+httpx = pytest.importorskip('httpx')
+
+
+class TestAsyncConnectionPool(TestHelper):
+    def test_init(self):
+        connections = self.random_integer(1, 20)
+        maxsize = self.random_integer(1, 20)
+        keep_alive = self.random_integer(1, 120)
+
+        pool = AsyncConnectionPool(
+            connections=connections,
+            maxsize=maxsize,
+            keep_alive=keep_alive,
+        )
+
+        assert pool.connections == connections
+        assert pool.maxsize == maxsize
+        assert pool.keep_alive == keep_alive
+        assert pool.stats == {
+            'clients': 0,
+            'requests': 0,
+            'compressed': 0,
+            'received_bytes': 0,
+            'received_saved': 0,
+            'sent_bytes': 0,
+            'sent_saved': 0,
+        }
+
+    def test_config(self):
+        conf = Config()
+        pool = conf.async_pool
+
+        assert isinstance(pool, AsyncConnectionPool)
+        assert conf.async_pool is pool
+        assert pool.connections == conf.pool_connections
+        assert pool.maxsize == conf.pool_maxsize
+        assert pool.keep_alive == conf.keep_alive
+
+        del conf.pool
+
+        assert conf.async_pool is not pool
+
+        pool = conf.async_pool
+        del conf.async_pool
+
+        assert conf.async_pool is not pool
+
+    def test_request(self):
+        body = {self.random_string(5): self.random_string(10)}
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+
+            return httpx.Response(201, json=body)
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        url = f'https://{self.random_string(10).lower()}.com/'
+
+        async def run():
+            response = await pool.request(
+                'post',
+                url,
+                data='{"a":1}',
+                params={'foo': 'bar'},
+                headers={'Content-Type': 'application/json'},
+            )
+            client = pool._client
+
+            await pool.request('get', url)
+
+            assert pool._client is client
+
+            await pool.close()
+
+            return response
+
+        response = asyncio.run(run())
+
+        assert response.ok
+        assert response.status_code == 201
+        assert response.reason == 'Created'
+        assert response.json() == body
+        assert response.headers['content-type'] == 'application/json'
+
+        assert seen[0].method == 'POST'
+        assert str(seen[0].url) == f'{url}?foo=bar'
+        assert seen[0].content == b'{"a":1}'
+        assert seen[1].method == 'GET'
+
+        assert pool.stats['clients'] == 1
+        assert pool.stats['requests'] == 2
+
+        # A new event loop needs a new client
+        asyncio.run(pool.request('get', url))
+
+        assert pool.stats['clients'] == 2
+        assert pool.stats['requests'] == 3
+
+    def test_close_replaced(self, monkeypatch):
+        conf = Config()
+        url = f'https://{self.random_string(10).lower()}.com/'
+        pool = AsyncConnectionPool(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+
+        async def request():
+            await pool.request('get', url)
+
+            return pool._client
+
+        # A client is closed when its event loop shuts down
+        client = asyncio.run(request())
+
+        assert client.is_closed
+
+        # Or on its loop when the pool is dropped
+        async def drop():
+            client = await request()
+
+            monkeypatch.setattr(conf, '_async_pool', pool)
+            del conf.pool
+
+            assert pool._client is None
+            assert not client.is_closed
+
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+            assert client.is_closed
+
+        asyncio.run(drop())
+
+        assert pool.stats['clients'] == 2
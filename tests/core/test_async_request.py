@@ -0,0 +1,432 @@
+"""Test asynchronous request object"""
+
+import asyncio
+import base64
+import gzip
+
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from stancer import Config
+from stancer.core import AsyncConnectionPool
+from stancer.core import AsyncRequest
+from stancer.core import CircuitBreaker
+from stancer.core import HedgingPolicy
+from stancer.core import RateLimiter
+from stancer.core import Request
+from stancer.core import RetryPolicy
+from stancer.core import Timeout
+from stancer.core import deadline
+from stancer.exceptions import CircuitOpenError
+from stancer.exceptions import DeadlineExceededError
+from stancer.exceptions import InternalServerError
+from stancer.exceptions import NotFoundError
+from stancer.exceptions import StancerHTTPError
+from stancer.exceptions import StancerValueError
+from stancer.exceptions import TooManyRequestsError
+
+from ..stub.stub_object import StubObject
+from ..TestHelper import TestHelper
+
+
+class TestAsyncRequest(TestHelper):
+    def test_class(self):
+        assert issubclass(AsyncRequest, Request)
+
+    def test_unknown_method(self, monkeypatch):
+        obj = StubObject()
+        calls = self.mock_async_api(monkeypatch)
+
+        with pytest.raises(
+            StancerValueError,
+            match='Invalid HTTP method.',
+        ):
+            asyncio.run(AsyncRequest()._request(self.random_string(10), obj))
+
+        assert len(calls) == 0
+
+    def test_api_key_validation(self, monkeypatch):
+        obj = StubObject(self.random_string(29))
+        calls = self.mock_async_api(monkeypatch)
+        conf = Config()
+
+        previous_keys = conf.keys
+        del conf.keys
+
+        with pytest.raises(
+            AttributeError,
+            match='No API key found.',
+        ):
+            asyncio.run(AsyncRequest().get(obj))
+
+        assert len(calls) == 0
+
+        del conf.keys
+        conf.keys = previous_keys
+
+    @pytest.mark.parametrize(
+        'status_code, cls',
+        TestHelper.http_code_provider(),
+    )
+    def test_exceptions(self, monkeypatch, status_code, cls):
+        obj = StubObject(self.random_string(29))
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, status_code, None),
+        )
+
+        with pytest.raises(cls) as error:
+            asyncio.run(AsyncRequest().get(obj))
+
+        assert error.value.status_code == status_code
+        assert len(calls) == 1
+
+    def test_circuit_breaker(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        obj = StubObject()
+        conf = Config()
+        conf.circuit_breaker = CircuitBreaker(threshold=2)
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 503, None),
+            ('GET', obj.uri, 0, httpx.ReadTimeout('timeout')),
+            ('GET', obj.uri, 200, {'string1': 'foo'}),
+        )
+
+        with pytest.raises(StancerHTTPError):
+            asyncio.run(AsyncRequest().get(obj))
+
+        with pytest.raises(requests.Timeout):
+            asyncio.run(AsyncRequest().get(obj))
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(AsyncRequest().get(obj))
+
+        assert len(calls) == 2
+
+        del conf.circuit_breaker
+
+    def test_circuit_breaker_cancelled(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        obj = StubObject()
+        conf = Config()
+        host = urlsplit(obj.uri).netloc
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+
+            return httpx.Response(200, json={'string1': 'foo'})
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(conf, '_async_pool', pool)
+
+        conf.circuit_breaker = CircuitBreaker(threshold=1, recovery=0)
+        conf.circuit_breaker.acquire(host)
+        conf.circuit_breaker.record(host, True)
+
+        # A cancelled probe gives its slot back, the next call probes again
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(AsyncRequest().get(obj), 0.05))
+
+        assert conf.circuit_breaker.state(host) == CircuitBreaker.HALF_OPEN
+
+        asyncio.run(AsyncRequest().get(obj))
+
+        assert len(calls) == 2
+        assert conf.circuit_breaker.state(host) == CircuitBreaker.CLOSED
+
+        del conf.circuit_breaker
+
+    def test_coalesce(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        conf = Config()
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+
+            return httpx.Response(200, json={'string1': 'shared'})
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(conf, '_async_pool', pool)
+
+        objs = [StubObject() for _ in range(4)]
+
+        async def run():
+            await asyncio.gather(*(AsyncRequest().get(obj) for obj in objs))
+
+        asyncio.run(run())
+
+        assert len(calls) == 1
+        assert [obj.string1 for obj in objs] == ['shared'] * 4
+
+        # Can be disabled
+        conf.coalesce = False
+
+        asyncio.run(run())
+
+        assert len(calls) == 5
+
+        del conf.coalesce
+
+    def test_compression(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        obj = StubObject()
+        conf = Config()
+        content = ('{"string1":"' + 'a' * 500 + '"}').encode()
+        compressed = gzip.compress(content)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+
+            return httpx.Response(
+                200, content=compressed, headers={'Content-Encoding': 'gzip'}
+            )
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(conf, '_async_pool', pool)
+
+        asyncio.run(AsyncRequest().get(obj))
+
+        assert obj.string1 == 'a' * 500
+        assert calls[0].headers['Accept-Encoding'].startswith('gzip, deflate')
+        assert pool.stats['received_bytes'] == len(compressed)
+        assert pool.stats['received_saved'] == len(content) - len(compressed)
+
+    def test_deadline(self, monkeypatch):
+        obj = StubObject()
+        conf = Config()
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 200, {'string1': 'foo'}),
+            ('GET', obj.uri, 200, {'string1': 'foo'}),
+        )
+
+        async def run(seconds):
+            with deadline(seconds):
+                await AsyncRequest().get(obj)
+
+        conf.timeout = Timeout(connect=2, read=10, pool=1)
+
+        asyncio.run(run(5))
+
+        timeout = calls[0].extensions['timeout']
+
+        assert timeout['connect'] == 2
+        assert 4 < timeout['read'] <= 5
+        assert 4 < timeout['write'] <= 5
+        assert timeout['pool'] == 1
+
+        # Not sent once the deadline is passed
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(run(0))
+
+        assert len(calls) == 1
+
+        del conf.timeout
+
+    def test_delete(self, monkeypatch):
+        obj = StubObject(self.random_string(29))
+        req = AsyncRequest()
+        conf = Config()
+        conf.mode = Config.TEST_MODE
+        location = obj.uri
+
+        calls = self.mock_async_api(monkeypatch, ('DELETE', location, 204, None))
+
+        assert asyncio.run(req.delete(obj)) == req
+        assert len(calls) == 1
+        assert obj.id is None
+
+        tmp = base64.b64encode((conf.stest + ':').encode())
+
+        assert calls[0].method == 'DELETE'
+        assert str(calls[0].url) == location
+        assert calls[0].content == b''
+        assert calls[0].headers['Authorization'] == f'Basic {tmp.decode()}'
+        assert calls[0].headers['Content-Type'] == 'application/json'
+
+    def test_get(self, monkeypatch):
+        obj = StubObject()
+        req = AsyncRequest()
+        string1 = self.random_string(10)
+        key = self.random_string(5)
+        value = self.random_string(5)
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 200, {'string1': string1}),
+            ('GET', obj.uri, 200, {'foo': 'bar'}),
+        )
+
+        assert asyncio.run(req.get(obj)) == req
+        assert obj.string1 == string1
+        assert len(calls) == 1
+        assert calls[0].method == 'GET'
+
+        # Call without update and query params
+        resp = asyncio.run(req.get(obj, update=False, **{key: value}))
+
+        assert resp == '{"foo":"bar"}'
+        assert str(calls[1].url) == f'{obj.uri}?{key}={value}'
+
+    def test_get_content(self, monkeypatch):
+        obj = StubObject()
+        string1 = self.random_string(10)
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 200, {'string1': string1}),
+        )
+
+        resp = asyncio.run(AsyncRequest().get_content(obj, foo='bar'))
+
+        assert resp == f'{{"string1":"{string1}"}}'.encode()
+        assert obj.string1 is None
+        assert str(calls[0].url) == f'{obj.uri}?foo=bar'
+
+        with pytest.raises(NotFoundError):
+            asyncio.run(AsyncRequest().get_content(obj))
+
+    def test_hedging(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        obj = StubObject()
+        conf = Config()
+        policy = HedgingPolicy(initial_delay=0.05, budget=1)
+        calls = []
+        cancelled = []
+
+        async def handler(request):
+            calls.append(request)
+
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(request)
+                    raise
+
+            return httpx.Response(200, json={'string1': f'reply {len(calls)}'})
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(conf, '_async_pool', pool)
+
+        conf.hedging = policy
+
+        asyncio.run(AsyncRequest().get(obj))
+
+        assert obj.string1 == 'reply 2'
+        assert len(calls) == 2
+        assert len(cancelled) == 1
+        assert policy.stats == {'hedged': 1, 'requests': 1, 'wins': 1}
+
+        del conf.hedging
+
+    @pytest.mark.parametrize('method', ['patch', 'post'])
+    def test_send(self, monkeypatch, method):
+        obj = StubObject()
+        req = AsyncRequest()
+
+        obj.hydrate(
+            string1=self.random_string(10, 20),
+            integer1=self.random_integer(10, 999999),
+        )
+
+        ret = {
+            'id': self.random_string(29),
+        }
+
+        location = obj.uri
+        body = obj.to_json()
+
+        calls = self.mock_async_api(monkeypatch, (method.upper(), location, 200, ret))
+
+        assert asyncio.run(getattr(req, method)(obj)) == req
+        assert obj.id == ret['id']
+        assert len(calls) == 1
+        assert calls[0].method == method.upper()
+        assert calls[0].content == body.encode()
+
+    def test_rate_limiter(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        obj = StubObject()
+        conf = Config()
+        limiter = RateLimiter(max_in_flight=2)
+        replies = [httpx.Response(429, headers={'Retry-After': '0'})]
+        peak = []
+
+        async def handler(request):
+            peak.append(limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+            if replies:
+                return replies.pop()
+
+            return httpx.Response(200, json={'string1': 'foo'})
+
+        pool = AsyncConnectionPool(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(conf, '_async_pool', pool)
+
+        conf.rate_limiter = limiter
+        conf.retry = RetryPolicy(attempts=3, backoff=0)
+        conf.coalesce = False
+
+        async def run():
+            await asyncio.gather(*(AsyncRequest().get(StubObject()) for _ in range(5)))
+
+        asyncio.run(run())
+
+        assert len(peak) == 6
+        assert max(peak) == 2
+        assert limiter.in_flight == 0
+        assert limiter.stats['requests'] == 6
+        assert limiter.stats['throttled'] == 1
+
+        # Without retry, the error tells how long to wait
+        del conf.retry
+        replies.append(httpx.Response(429, headers={'Retry-After': '7'}))
+
+        with pytest.raises(TooManyRequestsError) as error:
+            asyncio.run(AsyncRequest().get(obj))
+
+        assert error.value.retry_after == 7
+
+        del conf.coalesce
+        del conf.rate_limiter
+
+    def test_retry(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+        obj = StubObject()
+        conf = Config()
+        conf.retry = RetryPolicy(attempts=3, backoff=0)
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 503, None),
+            ('GET', obj.uri, 0, httpx.ConnectError('reset')),
+            ('GET', obj.uri, 200, {'string1': 'foo'}),
+        )
+
+        asyncio.run(AsyncRequest().get(obj))
+
+        assert obj.string1 == 'foo'
+        assert len(calls) == 3
+
+        calls = self.mock_async_api(monkeypatch, *[('GET', obj.uri, 500, None)] * 5)
+
+        with pytest.raises(InternalServerError):
+            asyncio.run(AsyncRequest().get(obj))
+
+        assert len(calls) == 3
+
+        del conf.retry
@@ -0,0 +1,147 @@
+"""Test circuit breaker"""
+
+import pytest
+
+from stancer.core import CircuitBreaker
+from stancer.exceptions import CircuitOpenError
+from stancer.exceptions import StancerHTTPError
+
+from ..TestHelper import TestHelper
+
+
+class TestCircuitBreaker(TestHelper):
+    def test_init(self):
+        breaker = CircuitBreaker()
+
+        assert breaker.threshold == 5
+        assert breaker.recovery == 30
+        assert breaker.probes == 1
+        assert breaker.listeners == []
+        assert breaker.state(self.random_string(10)) == CircuitBreaker.CLOSED
+
+    def test_open(self):
+        host = self.random_string(10)
+        other = self.random_string(10)
+        changes = []
+        breaker = CircuitBreaker(
+            threshold=3, listeners=[lambda *args: changes.append(args)]
+        )
+
+        for _ in range(2):
+            breaker.acquire(host)
+            breaker.record(host, True)
+
+        # A success resets the counter
+        breaker.acquire(host)
+        breaker.record(host, False)
+
+        for _ in range(2):
+            breaker.acquire(host)
+            breaker.record(host, True)
+
+        assert breaker.state(host) == CircuitBreaker.CLOSED
+        assert changes == []
+
+        breaker.acquire(host)
+        breaker.record(host, True)
+
+        assert breaker.state(host) == CircuitBreaker.OPEN
+        assert changes == [(host, CircuitBreaker.CLOSED, CircuitBreaker.OPEN)]
+
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.acquire(host)
+
+        assert isinstance(error.value, StancerHTTPError)
+        assert error.value.host == host
+        assert 0 < error.value.retry_after <= 30
+        assert str(error.value) == f'Circuit open for "{host}", API calls are rejected.'
+
+        # Other hosts are not impacted
+        breaker.acquire(other)
+
+        assert breaker.state(other) == CircuitBreaker.CLOSED
+
+    @pytest.mark.parametrize('failed, state', [(False, 'closed'), (True, 'open')])
+    def test_half_open(self, monkeypatch, failed, state):
+        host = self.random_string(10)
+        changes = []
+        now = [1000.0]
+        breaker = CircuitBreaker(
+            threshold=1, recovery=10, listeners=[lambda *args: changes.append(args)]
+        )
+
+        monkeypatch.setattr('stancer.core.circuit_breaker.monotonic', lambda: now[0])
+
+        breaker.acquire(host)
+        breaker.record(host, True)
+
+        now[0] += 9
+
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire(host)
+
+        now[0] += 1
+
+        # One probe at a time
+        breaker.acquire(host)
+
+        assert breaker.state(host) == CircuitBreaker.HALF_OPEN
+
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.acquire(host)
+
+        assert error.value.retry_after is None
+
+        breaker.record(host, failed)
+
+        assert breaker.state(host) == state
+        assert changes == [
+            (host, 'closed', 'open'),
+            (host, 'open', 'half_open'),
+            (host, 'half_open', state),
+        ]
+
+    def test_release(self):
+        host = self.random_string(10)
+        breaker = CircuitBreaker(threshold=1, recovery=0)
+
+        breaker.acquire(host)
+        breaker.release(host)
+
+        assert breaker.state(host) == CircuitBreaker.CLOSED
+
+        breaker.acquire(host)
+        breaker.record(host, True)
+        breaker.acquire(host)
+
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire(host)
+
+        # A probe ended without outcome frees its slot, the state is kept
+        breaker.release(host)
+
+        assert breaker.state(host) == CircuitBreaker.HALF_OPEN
+
+        breaker.acquire(host)
+        breaker.record(host, False)
+
+        assert breaker.state(host) == CircuitBreaker.CLOSED
+
+    def test_reset(self):
+        host = self.random_string(10)
+        breaker = CircuitBreaker(threshold=1)
+
+        breaker.acquire(host)
+        breaker.record(host, True)
+
+        assert breaker.state(host) == CircuitBreaker.OPEN
+
+        breaker.reset(host)
+
+        assert breaker.state(host) == CircuitBreaker.CLOSED
+
+        breaker.acquire(host)
+        breaker.record(host, True)
+        breaker.reset()
+
+        assert breaker.state(host) == CircuitBreaker.CLOSED
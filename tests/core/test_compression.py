@@ -0,0 +1,81 @@
+"""Test compression helpers"""
+
+import gzip
+
+from requests import Response
+
+from stancer.core.compression import ACCEPT_ENCODING
+from stancer.core.compression import TransferStats
+from stancer.core.compression import body_size
+from stancer.core.compression import compress
+from stancer.core.compression import wire_size
+
+from ..TestHelper import TestHelper
+
+
+class TestCompression(TestHelper):
+    def test_accept_encoding(self):
+        assert ACCEPT_ENCODING.startswith('gzip, deflate')
+
+    def test_body_size(self):
+        data = self.random_string(100).encode()
+
+        assert body_size(data.decode(), None) == (100, 100)
+        assert body_size(data, None) == (100, 100)
+        assert body_size(compress(data, 1), 'gzip') == (len(compress(data, 1)), 100)
+
+    def test_compress(self):
+        data = self.random_string(100).encode()
+
+        assert compress(data, None) is None
+        assert compress(data, 101) is None
+
+        compressed = compress(data, 100)
+
+        assert gzip.decompress(compressed) == data
+        assert compress(data, 100) == compressed
+
+    def test_wire_size(self):
+        content = self.random_string(100).encode()
+
+        class Raw:
+            def tell(self):
+                return 42
+
+        response = Response()
+        response._content = content
+
+        assert wire_size(response) == 100
+
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Content-Length'] = '30'
+
+        assert wire_size(response) == 30
+
+        response.raw = Raw()
+
+        assert wire_size(response) == 42
+
+    def test_transfer_stats(self):
+        stats = TransferStats()
+
+        assert stats.stats == {
+            'compressed': 0,
+            'received_bytes': 0,
+            'received_saved': 0,
+            'sent_bytes': 0,
+            'sent_saved': 0,
+        }
+
+        stats.sent(100, 100)
+        stats.sent(40, 200)
+        stats.received(50, 50)
+        stats.received(20, 80)
+
+        assert stats.stats == {
+            'compressed': 1,
+            'received_bytes': 70,
+            'received_saved': 60,
+            'sent_bytes': 140,
+            'sent_saved': 160,
+        }
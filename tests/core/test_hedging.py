@@ -0,0 +1,75 @@
+"""Test hedging policy"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from stancer.core import HedgingPolicy
+
+from ..TestHelper import TestHelper
+
+
+class TestHedgingPolicy(TestHelper):
+    def test_init(self):
+        policy = HedgingPolicy()
+
+        assert policy.percentile == 95
+        assert policy.initial_delay == 0.1
+        assert policy.min_samples == 20
+        assert policy.budget == 0.1
+        assert policy.max_tokens == 10
+        assert policy.workers == 32
+        assert policy.stats == {'hedged': 0, 'requests': 0, 'wins': 0}
+
+    def test_delay(self):
+        policy = HedgingPolicy(
+            percentile=90, initial_delay=1, min_samples=10, window=100
+        )
+
+        for latency in range(9):
+            policy.record(latency / 100)
+
+        assert policy.delay == 1
+
+        policy.record(0.09)
+
+        assert policy.delay == 0.08
+
+        # Old latencies are dropped
+        for _ in range(100):
+            policy.record(0.5)
+
+        assert policy.delay == 0.5
+
+    def test_budget(self):
+        policy = HedgingPolicy(budget=0.5, max_tokens=2)
+
+        policy.track()
+
+        assert policy.acquire() is False
+
+        policy.track()
+
+        assert policy.acquire() is True
+        assert policy.acquire() is False
+
+        for _ in range(10):
+            policy.track()
+
+        assert policy.acquire() is True
+        assert policy.acquire() is True
+        assert policy.acquire() is False
+
+        policy.won()
+
+        assert policy.stats == {'hedged': 3, 'requests': 12, 'wins': 1}
+
+    def test_executor(self):
+        policy = HedgingPolicy(workers=3)
+        executor = policy.executor
+
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert executor._max_workers == 3
+        assert policy.executor is executor
+
+        policy.close()
+
+        assert policy.executor is not executor
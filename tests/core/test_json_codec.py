@@ -0,0 +1,66 @@
+"""Test JSON codecs"""
+
+from importlib.util import find_spec
+
+import pytest
+
+from stancer.core import JsonCodec
+from stancer.core import MsgspecCodec
+from stancer.core import OrjsonCodec
+from stancer.core import default_codec
+
+from ..TestHelper import TestHelper
+
+
+def installed(module):
+    return pytest.mark.skipif(
+        find_spec(module) is None, reason=f'"{module}" is not installed'
+    )
+
+
+CODECS = [
+    JsonCodec,
+    pytest.param(MsgspecCodec, marks=installed('msgspec')),
+    pytest.param(OrjsonCodec, marks=installed('orjson')),
+]
+
+
+class TestJsonCodec(TestHelper):
+    @pytest.mark.parametrize('cls', CODECS)
+    def test_codec(self, cls):
+        codec = cls()
+        value = {
+            'amount': self.random_integer(50, 9999),
+            'description': self.random_string(10),
+            'capture': True,
+            'customer': None,
+            'refunds': [{'id': self.random_string(29)}],
+        }
+
+        assert isinstance(codec, JsonCodec)
+        assert codec.dumps(value) == JsonCodec().dumps(value)
+        assert ' ' not in codec.dumps({'a': [1, 2]})
+
+        encoded = codec.dumps(value)
+
+        assert codec.loads(encoded) == value
+        assert codec.loads(encoded.encode()) == value
+
+        with pytest.raises(ValueError):
+            codec.loads(b'{"foo":')
+
+    def test_default_codec(self, monkeypatch):
+        monkeypatch.setattr('stancer.core.json_codec.orjson', None)
+        monkeypatch.setattr('stancer.core.json_codec.msgspec', None)
+
+        assert type(default_codec()) is JsonCodec
+
+        with pytest.raises(ImportError, match='"orjson" is not installed.'):
+            OrjsonCodec()
+
+        with pytest.raises(ImportError, match='"msgspec" is not installed.'):
+            MsgspecCodec()
+
+    @installed('orjson')
+    def test_default_codec_orjson(self):
+        assert isinstance(default_codec(), OrjsonCodec)
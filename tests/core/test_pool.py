@@ -0,0 +1,166 @@
+"""Test connection pool"""
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+import requests
+import responses
+
+from stancer import Config
+from stancer.core import ConnectionPool
+from stancer.core import Request
+from stancer.core import Timeout
+
+from ..stub.stub_object import StubObject
+from ..TestHelper import TestHelper
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{}'
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{httpd.server_address[1]}/'
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestConnectionPool(TestHelper):
+    def test_init(self):
+        connections = self.random_integer(1, 20)
+        maxsize = self.random_integer(1, 20)
+        keep_alive = self.random_integer(1, 120)
+
+        pool = ConnectionPool(
+            connections=connections,
+            maxsize=maxsize,
+            keep_alive=keep_alive,
+        )
+
+        assert pool.connections == connections
+        assert pool.maxsize == maxsize
+        assert pool.keep_alive == keep_alive
+        assert isinstance(pool.session, requests.Session)
+
+        adapter = pool.session.get_adapter('https://api.stancer.com')
+
+        assert adapter._pool_connections == connections
+        assert adapter._pool_maxsize == maxsize
+
+        assert pool.stats == {
+            'connections': 0,
+            'expired': 0,
+            'hosts': 0,
+            'requests': 0,
+            'reused': 0,
+            'compressed': 0,
+            'received_bytes': 0,
+            'received_saved': 0,
+            'sent_bytes': 0,
+            'sent_saved': 0,
+        }
+
+    def test_reuse(self, server):
+        pool = ConnectionPool()
+        count = self.random_integer(2, 10)
+
+        for _ in range(count):
+            assert pool.request('get', server).json() == {}
+
+        stats = pool.stats
+
+        assert stats['requests'] == count
+        assert stats['connections'] == 1
+        assert stats['hosts'] == 1
+        assert stats['reused'] == count - 1
+        assert stats['expired'] == 0
+
+        pool.close()
+
+        assert pool.stats['hosts'] == 0
+
+    def test_keep_alive(self, server, monkeypatch):
+        pool = ConnectionPool(keep_alive=30)
+        now = [1000.0]
+
+        monkeypatch.setattr('stancer.core.transport.monotonic', lambda: now[0])
+
+        pool.request('get', server)
+        now[0] += 10
+        pool.request('get', server)
+
+        assert pool.stats['expired'] == 0
+        assert pool.stats['reused'] == 1
+
+        now[0] += 31
+        pool.request('get', server)
+
+        stats = pool.stats
+
+        assert stats['expired'] == 1
+        assert stats['connections'] == 1
+        assert stats['reused'] == 0
+        assert stats['requests'] == 3
+
+        pool = ConnectionPool(keep_alive=None)
+
+        pool.request('get', server)
+        now[0] += 100_000
+        pool.request('get', server)
+
+        assert pool.stats['expired'] == 0
+        assert pool.stats['reused'] == 1
+
+    @responses.activate
+    def test_shared_by_requests(self):
+        conf = Config()
+        pool = conf.pool
+        obj1 = StubObject(self.random_string(29))
+        obj2 = StubObject(self.random_string(29))
+
+        responses.add(responses.GET, obj1.uri, json={})
+        responses.add(responses.GET, obj2.uri, json={})
+
+        Request().get(obj1)
+        Request().get(obj2)
+
+        assert conf.pool is pool
+        assert pool.stats['requests'] >= 2
+        assert len(responses.calls) == 2
+
+    def test_split_timeout(self, server, monkeypatch):
+        pool = ConnectionPool()
+        timeouts = []
+        request = pool.session.request
+
+        def spy(*args, **kwargs):
+            timeouts.append(kwargs['timeout'])
+
+            return request(*args, **kwargs)
+
+        monkeypatch.setattr(pool.session, 'request', spy)
+
+        assert pool.request('get', server, timeout=Timeout(connect=1, read=2)).ok
+        assert pool.request('get', server, timeout=3).ok
+
+        assert timeouts == [(1, 2), 3]
@@ -0,0 +1,156 @@
+"""Test nested objects prefetching"""
+
+import asyncio
+import threading
+import time
+
+import responses
+
+from stancer import Customer
+from stancer import Payment
+from stancer.core import aprefetch
+from stancer.core import prefetch
+
+from ..TestHelper import TestHelper
+
+
+class TestPrefetch(TestHelper):
+    def _payments(self):
+        shared = f'cust_{self.random_string(24)}'
+        other = f'cust_{self.random_string(24)}'
+        missing = f'cust_{self.random_string(24)}'
+        populated = Customer(f'cust_{self.random_string(24)}')
+
+        payments = [
+            Payment(f'paym_{self.random_string(24)}', customer=shared),
+            Payment(f'paym_{self.random_string(24)}', customer=other),
+            Payment(f'paym_{self.random_string(24)}', customer=shared),
+            Payment(f'paym_{self.random_string(24)}', customer=missing),
+            Payment(f'paym_{self.random_string(24)}', customer=populated),
+            Payment(f'paym_{self.random_string(24)}'),
+        ]
+
+        populated._populated = True
+
+        return (payments, [shared, other, missing])
+
+    @responses.activate
+    def test_prefetch(self):
+        (payments, (shared, other, missing)) = self._payments()
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def reply(uid):
+            def callback(request):
+                with lock:
+                    running.append(None)
+                    peak.append(len(running))
+
+                time.sleep(0.02)
+
+                with lock:
+                    running.pop()
+
+                return (200, {}, f'{{"id": "{uid}", "email": "{uid}@example.org"}}')
+
+            return callback
+
+        for uid in (shared, other):
+            responses.add_callback(
+                responses.GET, Customer(uid).uri, callback=reply(uid)
+            )
+
+        responses.add(responses.GET, Customer(missing).uri, status=404)
+
+        prefetch(payments, 'customer', 'card', concurrency=2)
+
+        # One call per customer, even when shared
+        assert len(responses.calls) == 3
+        assert max(peak) <= 2
+
+        for idx in (0, 1, 2):
+            customer = payments[idx]._data['customer']
+
+            assert customer.is_populated
+            assert customer.is_not_modified
+            assert customer.email == f'{customer.id}@example.org'
+
+        assert payments[0]._data['customer'] is not payments[2]._data['customer']
+
+        # Failures are left to lazy loading
+        assert payments[3]._data['customer'].is_not_populated
+        assert len(responses.calls) == 3
+
+        # Only failures are fetched again
+        prefetch(payments, 'customer')
+        prefetch([], 'customer')
+
+        assert len(responses.calls) == 4
+        assert responses.calls[3].request.url == Customer(missing).uri
+
+    @responses.activate
+    def test_prefetch_changes(self):
+        uid = f'cust_{self.random_string(24)}'
+        payment = Payment(f'paym_{self.random_string(24)}', customer=uid)
+        customer = payment._data['customer']
+        name = self.random_string(10)
+
+        responses.add(
+            responses.GET,
+            customer.uri,
+            json={'id': uid, 'email': f'{uid}@example.org', 'name': 'API'},
+        )
+
+        customer.name = name
+
+        prefetch([payment], 'customer')
+
+        # Local changes are kept over the API data, they are still to be sent
+        assert customer.is_populated
+        assert customer.email == f'{uid}@example.org'
+        assert customer.name == name
+        assert customer.is_modified
+
+    def test_aprefetch(self, monkeypatch):
+        (payments, (shared, other, missing)) = self._payments()
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', Customer(shared).uri, 200, {'id': shared, 'name': 'Shared'}),
+            ('GET', Customer(other).uri, 200, {'id': other, 'name': 'Other'}),
+            ('GET', Customer(missing).uri, 404, None),
+        )
+
+        asyncio.run(aprefetch(payments, 'customer', concurrency=1))
+
+        assert len(calls) == 3
+        assert payments[0]._data['customer'].name == 'Shared'
+        assert payments[1]._data['customer'].name == 'Other'
+        assert payments[2]._data['customer'].name == 'Shared'
+        assert payments[3]._data['customer'].is_not_populated
+
+    @responses.activate
+    def test_list(self):
+        customer = f'cust_{self.random_string(24)}'
+        page = {
+            'live_mode': False,
+            'payments': [
+                {'customer': customer, 'id': f'paym_{self.random_string(24)}'},
+                {'customer': customer, 'id': f'paym_{self.random_string(24)}'},
+            ],
+            'range': {'has_more': False, 'limit': 10, 'start': 0},
+        }
+
+        responses.add(responses.GET, Payment().uri, json=page)
+        responses.add(
+            responses.GET,
+            Customer(customer).uri,
+            json={'id': customer, 'name': 'Listed'},
+        )
+
+        payments = list(Payment.list(limit=10, prefetch=['customer']))
+
+        assert len(responses.calls) == 2
+        assert [payment.customer.name for payment in payments] == ['Listed'] * 2
+        assert len(responses.calls) == 2
@@ -0,0 +1,282 @@
+"""Test rate limiter"""
+
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+
+from stancer.core import RateLimiter
+from stancer.core.rate_limit import get_priority
+from stancer.core.rate_limit import parse_retry_after
+from stancer.core.rate_limit import priority
+from stancer.exceptions import StancerValueError
+
+from ..TestHelper import TestHelper
+
+
+class TestRateLimiter(TestHelper):
+    def test_init(self):
+        obj = RateLimiter()
+
+        assert obj.rate == 25
+        assert obj.burst == 25
+        assert obj.max_in_flight is None
+        assert obj.cooldown == 1
+        assert obj.per_endpoint is True
+        assert obj.batch_share == 0.2
+        assert obj.in_flight == 0
+        assert obj.stats == {'delayed': 0, 'requests': 0, 'throttled': 0}
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (None, None),
+            ('', None),
+            ('0', 0),
+            ('12', 12),
+            (' 3 ', 3),
+            ('-1', None),
+            ('soon', None),
+            ('Wed, 21 Oct 2015 07:28:00 GMT', 0),
+        ],
+    )
+    def test_parse_retry_after(self, value, expected):
+        assert parse_retry_after(value) == expected
+
+    def test_priority(self):
+        assert get_priority() == 'interactive'
+
+        with priority('batch') as value:
+            assert value == 'batch'
+            assert get_priority() == 'batch'
+
+            with priority('interactive'):
+                assert get_priority() == 'interactive'
+
+            assert get_priority() == 'batch'
+
+        assert get_priority() == 'interactive'
+
+        with pytest.raises(StancerValueError), priority('urgent'):
+            pass
+
+    def test_parse_retry_after_date(self):
+        value = formatdate(time.time() + 30, usegmt=True)
+
+        assert 28 <= parse_retry_after(value) <= 30
+
+    def test_key(self):
+        key = self.random_string(10)
+
+        assert RateLimiter().key(key, '/v1/checkout/paym_xxx') == (key, 'checkout')
+        assert RateLimiter().key(key, '/v1/customers') == (key, 'customers')
+        assert RateLimiter().key(key, '/') == (key, '')
+        assert RateLimiter(per_endpoint=False).key(key, '/v1/checkout') == key
+
+    def test_reserve(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr('stancer.core.rate_limit.monotonic', lambda: now[0])
+
+        obj = RateLimiter(rate=10, burst=2)
+
+        assert obj.reserve('key') == (True, 0)
+        assert obj.reserve('key') == (True, 0)
+        assert obj.reserve('key') == (True, pytest.approx(0.1))
+        assert obj.reserve('key') == (True, pytest.approx(0.2))
+
+        # Other keys have their own bucket
+        assert obj.reserve('other') == (True, 0)
+
+        # Refilled over time, never over the burst size
+        now[0] += 10
+
+        assert obj.reserve('key') == (True, 0)
+        assert obj.reserve('key') == (True, 0)
+        assert obj.reserve('key') == (True, pytest.approx(0.1))
+
+        assert obj.stats['delayed'] == 3
+
+    def test_reserve_batch(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr('stancer.core.rate_limit.monotonic', lambda: now[0])
+
+        obj = RateLimiter(rate=10, burst=1, batch_share=0.25)
+
+        # Batch calls use available tokens
+        assert obj.reserve('key', batch=True) == (True, 0)
+
+        # But leave next ones to interactive calls
+        assert obj.reserve('key', batch=True) == (False, pytest.approx(0.1))
+        assert obj.reserve('key') == (True, pytest.approx(0.1))
+
+        # Until their share is reached, one in four tokens here
+        granted = []
+
+        for _ in range(20):
+            obj.reserve('key')
+
+            if obj.reserve('key', batch=True)[0]:
+                granted.append(None)
+
+        assert len(granted) == 7
+
+    def test_release_throttled(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr('stancer.core.rate_limit.monotonic', lambda: now[0])
+
+        obj = RateLimiter(rate=10, burst=10, cooldown=2)
+
+        obj.acquire('key')
+        obj.release('key', 429, 5)
+
+        assert obj.stats['throttled'] == 1
+        assert obj.reserve('key') == (True, 5)
+
+        obj.acquire('other')
+        obj.release('other', 429)
+
+        assert obj.reserve('other') == (True, 2)
+
+        # Other statuses do not block
+        obj.acquire('last')
+        obj.release('last', 500)
+
+        assert obj.reserve('last') == (True, 0)
+        assert obj.in_flight == 0
+
+    def test_acquire(self):
+        obj = RateLimiter(rate=1000, burst=1000, max_in_flight=2)
+        release = threading.Event()
+        running = []
+        peak = []
+
+        def call():
+            obj.acquire('key')
+            running.append(None)
+            peak.append(obj.in_flight)
+            release.wait(5)
+            running.pop()
+            obj.release('key')
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(call) for _ in range(5)]
+
+            while len(running) < 2:
+                time.sleep(0.01)
+
+            time.sleep(0.05)
+
+            assert len(running) == 2
+
+            release.set()
+
+            for future in futures:
+                future.result()
+
+        assert max(peak) == 2
+        assert obj.in_flight == 0
+        assert obj.stats == {'delayed': 3, 'requests': 5, 'throttled': 0}
+
+    def test_acquire_priority(self):
+        obj = RateLimiter(rate=1000, burst=1000, max_in_flight=1, batch_share=0.25)
+        order = []
+
+        obj.acquire('key')
+
+        def call(rank):
+            with priority(rank):
+                obj.acquire('key')
+
+            order.append(rank)
+            obj.release('key')
+
+        threads = []
+
+        for rank in ['batch'] * 4 + ['interactive'] * 8:
+            threads.append(threading.Thread(target=call, args=(rank,)))
+            threads[-1].start()
+
+            while obj.stats['delayed'] < len(threads):
+                time.sleep(0.001)
+
+        obj.release('key')
+
+        for thread in threads:
+            thread.join(5)
+
+        # Interactive calls first, but one in four slots for batch calls
+        assert order[:5] == ['interactive'] * 3 + ['batch', 'interactive']
+        assert order[-2:] == ['batch', 'batch']
+        assert obj.in_flight == 0
+
+    def test_aacquire(self):
+        obj = RateLimiter(rate=1000, burst=1000, max_in_flight=1)
+        order = []
+
+        async def call(idx):
+            await obj.aacquire('key')
+            order.append(idx)
+            await asyncio.sleep(0.01)
+            obj.release('key')
+
+        async def run():
+            await asyncio.gather(*(call(idx) for idx in range(4)))
+
+        asyncio.run(run())
+
+        assert order == [0, 1, 2, 3]
+        assert obj.in_flight == 0
+
+    def test_aacquire_cancelled(self):
+        obj = RateLimiter(max_in_flight=1)
+
+        async def run():
+            await obj.aacquire('key')
+
+            waiter = asyncio.create_task(obj.aacquire('key'))
+            await asyncio.sleep(0)
+
+            waiter.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+            obj.release('key')
+
+        asyncio.run(run())
+
+        # The cancelled waiter did not keep a slot
+        assert obj.in_flight == 0
+
+        obj.acquire('key')
+
+        assert obj.in_flight == 1
+
+    def test_shared_between_threads_and_tasks(self):
+        obj = RateLimiter(max_in_flight=1)
+        order = []
+
+        obj.acquire('key')
+
+        async def run():
+            task = asyncio.create_task(obj.aacquire('key'))
+            await asyncio.sleep(0.01)
+
+            assert not task.done()
+
+            threading.Timer(
+                0.05, lambda: (order.append('thread'), obj.release('key'))
+            ).start()
+
+            await task
+            order.append('task')
+            obj.release('key')
+
+        asyncio.run(run())
+
+        assert order == ['thread', 'task']
+        assert obj.in_flight == 0
@@ -1,13 +1,32 @@
 """Test request object"""
 
 import base64
+import gzip
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 import pytest
+import requests
 import responses
 
 from stancer import Config
+from stancer.core import CircuitBreaker
+from stancer.core import HedgingPolicy
+from stancer.core import RateLimiter
 from stancer.core import Request
+from stancer.core import RetryPolicy
+from stancer.core import Timeout
+from stancer.core import deadline
+from stancer.exceptions import CircuitOpenError
+from stancer.exceptions import DeadlineExceededError
+from stancer.exceptions import InternalServerError
+from stancer.exceptions import NotFoundError
+from stancer.exceptions import StancerHTTPServerError
 from stancer.exceptions import StancerValueError
+from stancer.exceptions import TooManyRequestsError
 from stancer.exceptions import UnauthorizedError
 
 from ..stub.stub_object import StubObject
@@ -132,6 +151,279 @@ class TestRequest(TestHelper):
 
         assert len(responses.calls) == 1
 
+    @responses.activate
+    def test_circuit_breaker(self, monkeypatch):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        changes = []
+        delays = []
+
+        monkeypatch.setattr('stancer.core.request.sleep', delays.append)
+
+        conf.circuit_breaker = CircuitBreaker(
+            threshold=2,
+            listeners=[lambda *args: changes.append(args[1:])],
+        )
+        conf.retry = RetryPolicy(attempts=5)
+
+        responses.add(responses.GET, obj.uri, status=502)
+        responses.add(responses.GET, obj.uri, body=requests.Timeout())
+
+        # Retries stop as soon as the circuit opens
+        with pytest.raises(CircuitOpenError):
+            req.get(obj)
+
+        assert len(responses.calls) == 2
+        assert changes == [('closed', 'open')]
+
+        with pytest.raises(CircuitOpenError):
+            req.get(obj)
+
+        assert len(responses.calls) == 2
+
+        # 4xx are not failures
+        conf.circuit_breaker.reset()
+        responses.reset()
+        responses.add(responses.GET, obj.uri, status=404)
+
+        for _ in range(3):
+            with pytest.raises(NotFoundError):
+                req.get(obj)
+
+        assert conf.circuit_breaker.state(urlsplit(obj.uri).netloc) == 'closed'
+
+        # An interrupted probe gives its slot back
+        host = urlsplit(obj.uri).netloc
+        conf.circuit_breaker = CircuitBreaker(threshold=1, recovery=0)
+        conf.circuit_breaker.acquire(host)
+        conf.circuit_breaker.record(host, True)
+
+        def interrupt(**kwargs):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(conf.pool, 'request', interrupt)
+
+        with pytest.raises(KeyboardInterrupt):
+            req.get(obj)
+
+        monkeypatch.undo()
+
+        assert conf.circuit_breaker.state(host) == 'half_open'
+
+        responses.add(responses.GET, obj.uri, json={'string1': 'foo'})
+        req.get(obj)
+
+        assert conf.circuit_breaker.state(host) == 'closed'
+
+        del conf.circuit_breaker
+        del conf.retry
+
+    @responses.activate
+    def test_coalesce(self):
+        obj = StubObject()
+        conf = Config()
+        release = threading.Event()
+        calls = []
+
+        def reply(request):
+            calls.append(request)
+            release.wait(5)
+
+            return (200, {}, '{"string1": "shared"}')
+
+        responses.add_callback(responses.GET, obj.uri, callback=reply)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(Request().get, StubObject()) for _ in range(4)]
+
+            while len(calls) < 1:
+                time.sleep(0.01)
+
+            time.sleep(0.1)
+            release.set()
+
+            results = [future.result() for future in futures]
+
+        assert len(results) == 4
+        assert len(calls) == 1
+
+        # Different query parameters are different requests
+        Request().get(StubObject(), limit=10)
+        Request().get(StubObject(), limit=20)
+
+        assert len(calls) == 3
+
+        # Can be disabled
+        release.clear()
+        conf.coalesce = False
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(Request().get, StubObject()) for _ in range(2)]
+
+            while len(calls) < 5:
+                time.sleep(0.01)
+
+            release.set()
+
+            for future in futures:
+                future.result()
+
+        assert len(calls) == 5
+
+        del conf.coalesce
+
+    @responses.activate
+    def test_compression(self):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        pool = conf.pool
+        stats = pool.stats
+        content = ('{"string1":"' + 'a' * 500 + '"}').encode()
+
+        responses.add(
+            responses.GET,
+            obj.uri,
+            body=gzip.compress(content),
+            headers={'Content-Encoding': 'gzip'},
+        )
+
+        req.get(obj)
+
+        assert obj.string1 == 'a' * 500
+        assert (
+            responses.calls[0]
+            .request.headers['Accept-Encoding']
+            .startswith('gzip, deflate')
+        )
+        assert pool.stats['received_bytes'] - stats['received_bytes'] == len(
+            gzip.compress(content)
+        )
+        assert pool.stats['received_saved'] - stats['received_saved'] == len(
+            content
+        ) - len(gzip.compress(content))
+
+        # Request bodies are compressed over the threshold only
+        obj = StubObject()
+        obj.hydrate(string1='b' * 500)
+        body = obj.to_json()
+
+        responses.add(responses.POST, obj.uri, json={'id': self.random_string(29)})
+
+        req.post(obj)
+
+        assert responses.calls[1].request.body == body
+        assert 'Content-Encoding' not in responses.calls[1].request.headers
+
+        conf.compression_threshold = 100
+        obj = StubObject()
+        obj.hydrate(string1='b' * 500)
+
+        stats = pool.stats
+        req.post(obj)
+
+        api_call = responses.calls[2]
+
+        assert api_call.request.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(api_call.request.body) == body.encode()
+        assert pool.stats['compressed'] == stats['compressed'] + 1
+        assert pool.stats['sent_bytes'] - stats['sent_bytes'] == len(
+            api_call.request.body
+        )
+        assert pool.stats['sent_saved'] - stats['sent_saved'] == len(body) - len(
+            api_call.request.body
+        )
+
+        del conf.compression_threshold
+
+    @responses.activate
+    def test_compression_retried(self, monkeypatch):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        pool = conf.pool
+
+        monkeypatch.setattr('stancer.core.request.sleep', lambda delay: None)
+
+        conf.compression_threshold = 100
+        conf.retry = RetryPolicy(attempts=2, statuses={'post': (503,)})
+        obj.hydrate(string1='b' * 500)
+
+        responses.add(responses.POST, obj.uri, status=503)
+        responses.add(responses.POST, obj.uri, json={'id': self.random_string(29)})
+
+        stats = pool.stats
+        req.post(obj)
+
+        # Every attempt sends the body again
+        body = responses.calls[0].request.body
+
+        assert len(responses.calls) == 2
+        assert pool.stats['compressed'] == stats['compressed'] + 2
+        assert pool.stats['sent_bytes'] - stats['sent_bytes'] == 2 * len(body)
+        assert pool.stats['sent_saved'] - stats['sent_saved'] == 2 * (
+            len(obj.to_json()) - len(body)
+        )
+
+        del conf.compression_threshold
+        del conf.retry
+
+    @responses.activate
+    def test_deadline(self, monkeypatch):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        delays = []
+
+        monkeypatch.setattr('stancer.core.request.sleep', delays.append)
+
+        responses.add(responses.GET, obj.uri, json={'string1': 'foo'})
+
+        # Calls use the time left as timeout
+        timeouts = []
+        request = conf.pool.request
+
+        def spy(*args, **kwargs):
+            timeouts.append(kwargs['timeout'])
+
+            return request(*args, **kwargs)
+
+        monkeypatch.setattr(conf.pool, 'request', spy)
+
+        with deadline(5):
+            req.get(obj)
+
+        assert 4 < timeouts[0].connect <= 5
+        assert 4 < timeouts[0].read <= 5
+
+        # Not sent once the deadline is passed
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            req.get(obj)
+
+        assert len(responses.calls) == 1
+
+        # Retries ending after the deadline are not done
+        conf.retry = RetryPolicy(attempts=3)
+
+        responses.replace(
+            responses.GET, obj.uri, status=503, headers={'Retry-After': '2'}
+        )
+
+        with deadline(0.5), pytest.raises(StancerHTTPServerError):
+            req.get(obj)
+
+        assert len(responses.calls) == 2
+        assert delays == []
+
+        with deadline(5), pytest.raises(StancerHTTPServerError):
+            req.get(obj)
+
+        assert len(responses.calls) == 5
+        assert delays == [2, 2]
+
+        del conf.retry
+
     @responses.activate
     def test_delete(self):
         obj = StubObject()
@@ -212,6 +504,73 @@ class TestRequest(TestHelper):
         assert api_call.request.url == f'{obj.uri}?{key}={value}'
         assert api_call.request.body is None
 
+    @responses.activate
+    def test_get_content(self):
+        obj = StubObject()
+        req = Request()
+        body = '{"string1":"' + self.random_string(10) + '"}'
+        key = self.random_string(5)
+        value = self.random_string(5)
+
+        responses.add(responses.GET, obj.uri, body=body)
+
+        resp = req.get_content(obj, **{key: value})
+
+        assert resp == body.encode()
+        assert obj.string1 is None
+        assert responses.calls[0].request.url == f'{obj.uri}?{key}={value}'
+
+        responses.reset()
+        responses.add(responses.GET, obj.uri, status=404)
+
+        with pytest.raises(NotFoundError):
+            req.get_content(obj)
+
+    @responses.activate
+    def test_hedging(self):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        policy = HedgingPolicy(initial_delay=0.05, budget=1)
+        calls = []
+
+        def reply(request):
+            calls.append(request)
+
+            if len(calls) == 1:
+                time.sleep(0.5)
+                return (200, {}, '{"string1": "slow"}')
+
+            return (200, {}, '{"string1": "fast"}')
+
+        responses.add_callback(responses.GET, obj.uri, callback=reply)
+
+        conf.hedging = policy
+
+        assert req.get(obj) == req
+        assert obj.string1 == 'fast'
+        assert len(calls) == 2
+        assert policy.stats == {'hedged': 1, 'requests': 1, 'wins': 1}
+
+        # Fast responses are not hedged
+        calls.clear()
+        calls.append(None)
+
+        req.get(obj, update=False)
+
+        assert len(calls) == 2
+        assert policy.stats['hedged'] == 1
+
+        # Only GET requests are hedged
+        responses.add(responses.POST, obj.uri, json={'id': self.random_string(29)})
+
+        req.post(StubObject())
+
+        assert policy.stats['requests'] == 2
+
+        del conf.hedging
+        policy.close()
+
     @responses.activate
     def test_patch(self):
         obj = StubObject()
@@ -295,3 +654,157 @@ class TestRequest(TestHelper):
 
         assert 'Content-Type' in api_call.request.headers
         assert api_call.request.headers['Content-Type'] == 'application/json'
+
+    @responses.activate
+    def test_rate_limiter(self, monkeypatch):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        limiter = RateLimiter()
+        delays = []
+
+        monkeypatch.setattr('stancer.core.request.sleep', delays.append)
+
+        responses.add(responses.GET, obj.uri, status=429, headers={'Retry-After': '3'})
+        responses.add(responses.GET, obj.uri, json={'string1': 'foo'})
+
+        conf.rate_limiter = limiter
+
+        # No retry policy, the error tells how long to wait
+        with pytest.raises(TooManyRequestsError) as error:
+            req.get(obj)
+
+        assert error.value.retry_after == 3
+        assert limiter.stats == {'delayed': 0, 'requests': 1, 'throttled': 1}
+        assert limiter.in_flight == 0
+
+        # Retried after the delay asked by the API
+        waits = []
+        monkeypatch.setattr('stancer.core.rate_limit.sleep', waits.append)
+
+        responses.calls.reset()
+        responses.replace(
+            responses.GET, obj.uri, status=429, headers={'Retry-After': '2'}
+        )
+        responses.add(responses.GET, obj.uri, json={'string1': 'foo'})
+
+        conf.rate_limiter = limiter = RateLimiter()
+        conf.retry = RetryPolicy(attempts=3, backoff=0)
+
+        assert req.get(obj) == req
+        assert obj.string1 == 'foo'
+        assert len(responses.calls) == 2
+        assert delays == [2]
+        assert len(waits) == 1  # The bucket was blocked too
+        assert 0 < waits[0] <= 2
+        assert limiter.stats == {'delayed': 1, 'requests': 2, 'throttled': 1}
+        assert limiter.in_flight == 0
+
+        del conf.rate_limiter
+        del conf.retry
+
+    def test_timeout(self, monkeypatch):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        timeouts = []
+
+        def request(*args, **kwargs):
+            timeouts.append(kwargs['timeout'])
+
+            raise requests.ConnectTimeout()
+
+        monkeypatch.setattr(conf.pool, 'request', request)
+
+        for value in [None, 5]:
+            conf.timeout = value
+
+            with pytest.raises(requests.ConnectTimeout):
+                req.get(obj)
+
+        conf.timeout = Timeout(connect=2, read=10, endpoints={'stub': Timeout(read=30)})
+
+        with pytest.raises(requests.ConnectTimeout):
+            req.get(obj)
+
+        assert timeouts == [None, 5, Timeout(connect=2, read=30)]
+
+        del conf.timeout
+
+    @responses.activate
+    def test_retry(self, monkeypatch):
+        obj = StubObject()
+        req = Request()
+        conf = Config()
+        delays = []
+
+        monkeypatch.setattr('stancer.core.request.sleep', delays.append)
+
+        responses.add(responses.GET, obj.uri, status=503)
+        responses.add(responses.GET, obj.uri, body=requests.ConnectionError())
+        responses.add(responses.GET, obj.uri, json={'string1': 'foo'})
+
+        # No policy, no retry
+        with pytest.raises(StancerHTTPServerError):
+            req.get(obj)
+
+        assert len(responses.calls) == 1
+
+        conf.retry = RetryPolicy(attempts=3)
+
+        responses.calls.reset()
+
+        assert req.get(obj) == req
+        assert obj.string1 == 'foo'
+        assert len(responses.calls) == 2
+        assert len(delays) == 1
+
+        del conf.retry
+
+    @responses.activate
+    def test_retry_exhausted(self, monkeypatch):
+        obj = StubObject(self.random_string(29))
+        req = Request()
+        conf = Config()
+        delays = []
+
+        monkeypatch.setattr('stancer.core.request.sleep', delays.append)
+
+        conf.retry = RetryPolicy(attempts=3)
+
+        responses.add(responses.GET, obj.uri, status=500)
+
+        with pytest.raises(InternalServerError):
+            req.get(obj)
+
+        assert len(responses.calls) == 3
+        assert len(delays) == 2
+
+        responses.reset()
+        responses.add(responses.GET, obj.uri, body=requests.Timeout())
+
+        with pytest.raises(requests.Timeout):
+            req.get(obj)
+
+        assert len(responses.calls) == 3
+
+        # Not retryable
+        responses.reset()
+        responses.add(responses.GET, obj.uri, status=404)
+
+        with pytest.raises(NotFoundError):
+            req.get(obj)
+
+        assert len(responses.calls) == 1
+
+        # POST are never retried by default
+        responses.reset()
+        responses.add(responses.POST, obj.uri, body=requests.ConnectionError())
+        obj = StubObject()
+
+        with pytest.raises(requests.ConnectionError):
+            req.post(obj)
+
+        assert len(responses.calls) == 1
+
+        del conf.retry
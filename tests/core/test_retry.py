@@ -0,0 +1,90 @@
+"""Test retry policy"""
+
+import pytest
+
+from stancer.core import RetryPolicy
+
+from ..TestHelper import TestHelper
+
+
+class TestRetryPolicy(TestHelper):
+    def test_init(self):
+        obj = RetryPolicy()
+
+        assert obj.attempts == 3
+        assert obj.backoff == 0.1
+        assert obj.max_backoff == 2
+        assert obj.total == 10
+        assert obj.in_doubt is True
+        assert obj.statuses == RetryPolicy.DEFAULT_STATUSES
+
+        obj = RetryPolicy(statuses={'GET': (503,)}, in_doubt=False)
+
+        assert obj.statuses == {'get': (503,)}
+        assert obj.in_doubt is False
+
+    @pytest.mark.parametrize(
+        'method, status, expected',
+        [
+            ('get', None, True),
+            ('GET', 408, True),
+            ('get', 500, True),
+            ('get', 503, True),
+            ('get', 599, True),
+            ('get', 400, False),
+            ('get', 404, False),
+            ('get', 409, False),
+            ('get', 429, True),
+            ('delete', None, True),
+            ('delete', 502, True),
+            ('delete', 404, False),
+            ('post', None, False),
+            ('post', 429, False),
+            ('post', 500, False),
+            ('patch', None, False),
+            ('patch', 503, False),
+        ],
+    )
+    def test_can_retry(self, method, status, expected):
+        assert RetryPolicy().can_retry(method, status) is expected
+
+    def test_can_retry_custom(self):
+        obj = RetryPolicy(statuses={'post': (503, '4xx')})
+
+        assert obj.can_retry('post')
+        assert obj.can_retry('post', 503)
+        assert obj.can_retry('post', 409)
+        assert not obj.can_retry('post', 500)
+        assert not obj.can_retry('get')
+
+    def test_next_delay(self):
+        obj = RetryPolicy(attempts=5, backoff=0.5, max_backoff=1.5, total=None)
+
+        for _ in range(50):
+            assert 0 <= obj.next_delay(1, 0) <= 0.5
+            assert 0 <= obj.next_delay(2, 0) <= 1
+            assert 0 <= obj.next_delay(3, 0) <= 1.5
+            assert 0 <= obj.next_delay(4, 1000) <= 1.5
+
+        assert obj.next_delay(5, 0) is None
+
+    def test_next_delay_total(self):
+        obj = RetryPolicy(attempts=10, backoff=10, max_backoff=10, total=5)
+
+        for _ in range(50):
+            assert 0 <= obj.next_delay(1, 4) <= 1
+
+        assert obj.next_delay(1, 5) is None
+        assert obj.next_delay(1, 6) is None
+
+    def test_next_delay_retry_after(self):
+        obj = RetryPolicy(attempts=3, backoff=0.1, max_backoff=0.1, total=10)
+
+        assert obj.next_delay(1, 0, 3) == 3
+        assert obj.next_delay(1, 6, 4) == 4
+
+        # Does not fit in the time budget
+        assert obj.next_delay(1, 7, 4) is None
+
+        # Still limited by attempts
+        assert obj.next_delay(3, 0, 1) is None
@@ -0,0 +1,126 @@
+"""Test single flight call groups"""
+
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stancer.core import AsyncSingleFlight
+from stancer.core import SingleFlight
+
+from ..TestHelper import TestHelper
+
+
+class TestSingleFlight(TestHelper):
+    def test_do(self):
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def call():
+            calls.append(None)
+            release.wait(5)
+
+            return len(calls)
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(group.do, 'key', call) for _ in range(5)]
+
+            while group.shared < 4:
+                threading.Event().wait(0.01)
+
+            release.set()
+
+        assert [future.result() for future in futures] == [1] * 5
+        assert len(calls) == 1
+        assert group.shared == 4
+
+        # Results are not kept
+        assert group.do('key', call) == 2
+
+    def test_do_error(self):
+        group = SingleFlight()
+        error = ValueError(self.random_string(10))
+
+        def call():
+            raise error
+
+        with pytest.raises(ValueError) as exc:
+            group.do('key', call)
+
+        assert exc.value is error
+
+        # Key is released after an error
+        assert group.do('key', lambda: 'ok') == 'ok'
+
+    def test_do_keys(self):
+        group = SingleFlight()
+
+        assert group.do('first', lambda: 1) == 1
+        assert group.do('second', lambda: 2) == 2
+        assert group.shared == 0
+
+
+class TestAsyncSingleFlight(TestHelper):
+    def test_do(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+
+            return len(calls)
+
+        async def run():
+            return await asyncio.gather(*(group.do('key', call) for _ in range(5)))
+
+        assert asyncio.run(run()) == [1] * 5
+        assert len(calls) == 1
+        assert group.shared == 4
+
+    def test_do_error(self):
+        group = AsyncSingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+
+            raise ValueError('failed')
+
+        async def run():
+            return await asyncio.gather(
+                *(group.do('key', call) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert group.shared == 2
+
+    def test_do_cancelled(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+
+            return len(calls)
+
+        async def run():
+            owner = asyncio.create_task(group.do('key', call))
+            await asyncio.sleep(0)
+
+            waiter = asyncio.create_task(group.do('key', call))
+            await asyncio.sleep(0)
+
+            owner.cancel()
+
+            return await waiter
+
+        # The waiter makes the call itself when the owner is cancelled
+        assert asyncio.run(run()) == 2
+        assert len(calls) == 2
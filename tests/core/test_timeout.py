@@ -0,0 +1,103 @@
+"""Test timeouts and deadlines"""
+
+import asyncio
+
+import pytest
+
+from stancer.core import Timeout
+from stancer.core import deadline
+from stancer.core.timeout import endpoint
+from stancer.core.timeout import expires_within
+from stancer.core.timeout import remaining
+
+from ..TestHelper import TestHelper
+
+
+class TestTimeout(TestHelper):
+    def test_init(self):
+        obj = Timeout()
+
+        assert obj.connect is None
+        assert obj.read is None
+        assert obj.pool is None
+        assert obj.endpoints == {}
+
+        override = Timeout(read=30)
+        obj = Timeout(1, 2, 3, endpoints={'checkout': override})
+
+        assert obj.connect == 1
+        assert obj.read == 2
+        assert obj.pool == 3
+        assert obj.endpoints == {'checkout': override}
+        assert obj == Timeout(1, 2, 3, endpoints={'checkout': Timeout(read=30)})
+        assert obj != Timeout(1, 2, 3)
+        assert repr(override) == 'Timeout(connect=None, read=30, pool=None)'
+
+    @pytest.mark.parametrize(
+        'path, expected',
+        [
+            ('/v1/checkout/paym_xxx', 'checkout'),
+            ('/v1/customers', 'customers'),
+            ('/v1/', ''),
+            ('/', ''),
+        ],
+    )
+    def test_endpoint(self, path, expected):
+        assert endpoint(path) == expected
+
+    def test_deadline(self):
+        assert remaining() is None
+        assert expires_within(1000) is False
+
+        with deadline(10):
+            assert 9 < remaining() <= 10
+            assert expires_within(20) is True
+            assert expires_within(1) is False
+
+            # Nested deadlines can only shorten the budget
+            with deadline(100):
+                assert remaining() <= 10
+
+            with deadline(1):
+                assert remaining() <= 1
+
+            assert remaining() > 1
+
+        assert remaining() is None
+
+    def test_deadline_tasks(self):
+        async def task(seconds):
+            with deadline(seconds):
+                await asyncio.sleep(0.01)
+
+                return remaining()
+
+        async def run():
+            return await asyncio.gather(task(1), task(10))
+
+        (short, long) = asyncio.run(run())
+
+        # Each task has its own deadline
+        assert short < 1
+        assert 1 < long < 10
+        assert remaining() is None
+
+    def test_resolve(self):
+        path = '/v1/checkout/paym_xxx'
+
+        # Numbers are used as they are
+        assert Timeout.resolve(None, path) is None
+        assert Timeout.resolve(5, path) == 5
+
+        # Per endpoint overrides
+        obj = Timeout(2, 10, 1, endpoints={'checkout': Timeout(read=30)})
+
+        assert Timeout.resolve(obj, path) == Timeout(2, 30, 1)
+        assert Timeout.resolve(obj, '/v1/customers') is obj
+
+        # Shortened to the deadline
+        assert Timeout.resolve(None, path, 3) == Timeout(3, 3, 3)
+        assert Timeout.resolve(5, path, 3) == Timeout(3, 3, 3)
+        assert Timeout.resolve(5, path, 8) == Timeout(5, 5, 5)
+        assert Timeout.resolve(obj, path, 5) == Timeout(2, 5, 1)
+        assert Timeout.resolve(Timeout(read=4), path, 5) == Timeout(5, 4, 5)
@@ -0,0 +1,187 @@
+"""Test urllib3 connection pool"""
+
+import base64
+import json
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+import requests
+
+from stancer import Config
+from stancer.core import AbstractTransport
+from stancer.core import ConnectionPool
+from stancer.core import Request
+from stancer.core import Timeout
+from stancer.core import Urllib3ConnectionPool
+from stancer.exceptions import NotFoundError
+
+from ..stub.stub_object import StubObject
+from ..TestHelper import TestHelper
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        status = 404 if self.path.startswith('/missing') else 200
+        body = json.dumps(
+            {
+                'authorization': self.headers.get('Authorization'),
+                'body': self.rfile.read(length).decode(),
+                'content_type': self.headers.get('Content-Type'),
+                'method': self.command,
+                'path': self.path,
+            }
+        ).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_DELETE = do_GET = do_PATCH = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestUrllib3ConnectionPool(TestHelper):
+    def test_class(self):
+        assert issubclass(Urllib3ConnectionPool, AbstractTransport)
+        assert issubclass(ConnectionPool, AbstractTransport)
+
+    def test_init(self):
+        connections = self.random_integer(1, 20)
+        maxsize = self.random_integer(1, 20)
+        keep_alive = self.random_integer(1, 120)
+
+        pool = Urllib3ConnectionPool(
+            connections=connections,
+            maxsize=maxsize,
+            keep_alive=keep_alive,
+        )
+
+        assert pool.connections == connections
+        assert pool.maxsize == maxsize
+        assert pool.keep_alive == keep_alive
+        assert pool.stats == {
+            'connections': 0,
+            'expired': 0,
+            'hosts': 0,
+            'requests': 0,
+            'reused': 0,
+            'compressed': 0,
+            'received_bytes': 0,
+            'received_saved': 0,
+            'sent_bytes': 0,
+            'sent_saved': 0,
+        }
+
+    def test_request(self, server):
+        pool = Urllib3ConnectionPool()
+        key = self.random_string(10)
+        body = json.dumps({'foo': self.random_string(10)})
+
+        response = pool.request(
+            'post',
+            f'{server}/path',
+            auth=(key, ''),
+            data=body,
+            headers={'Content-Type': 'application/json'},
+            params={'a': 1, 'b': None},
+            timeout=5,
+        )
+
+        assert isinstance(response, requests.Response)
+        assert response.ok
+        assert response.status_code == 200
+        assert response.reason == 'OK'
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json() == {
+            'authorization': 'Basic ' + base64.b64encode(f'{key}:'.encode()).decode(),
+            'body': body,
+            'content_type': 'application/json',
+            'method': 'POST',
+            'path': '/path?a=1',
+        }
+
+        response = pool.request('get', f'{server}/missing?a=1', params={'b': 2})
+
+        assert not response.ok
+        assert response.status_code == 404
+        assert response.json()['path'] == '/missing?a=1&b=2'
+
+        stats = pool.stats
+
+        assert stats['requests'] == 2
+        assert stats['connections'] == 1
+        assert stats['reused'] == 1
+
+        pool.close()
+
+        assert pool.stats['hosts'] == 0
+
+    def test_errors(self):
+        pool = Urllib3ConnectionPool()
+
+        with pytest.raises(requests.ConnectionError):
+            pool.request('get', 'http://127.0.0.1:1/')
+
+    def test_config(self, server, monkeypatch):
+        conf = Config()
+        obj = StubObject()
+
+        monkeypatch.setattr(
+            StubObject, 'uri', property(lambda self: f'{server}/missing')
+        )
+
+        assert conf.transport is ConnectionPool
+        assert isinstance(conf.pool, ConnectionPool)
+
+        conf.transport = Urllib3ConnectionPool
+
+        assert isinstance(conf.pool, Urllib3ConnectionPool)
+
+        with pytest.raises(NotFoundError):
+            Request().get(obj)
+
+        assert conf.pool.stats['requests'] == 1
+
+        del conf.transport
+
+        assert conf.transport is ConnectionPool
+        assert isinstance(conf.pool, ConnectionPool)
+
+    def test_split_timeout(self, server, monkeypatch):
+        pool = Urllib3ConnectionPool()
+        timeouts = []
+        request = pool.manager.request
+
+        def spy(*args, **kwargs):
+            timeouts.append(kwargs['timeout'])
+
+            return request(*args, **kwargs)
+
+        monkeypatch.setattr(pool.manager, 'request', spy)
+
+        assert pool.request('get', server, timeout=Timeout(connect=1, read=2)).ok
+
+        assert timeouts[0].connect_timeout == 1
+        assert timeouts[0].read_timeout == 2
@@ -0,0 +1,164 @@
+"""Test client object"""
+
+import asyncio
+import base64
+
+import pytest
+import responses
+
+from stancer import Client
+from stancer import Config
+from stancer.exceptions import StancerValueError
+
+from .stub.stub_object import StubObject
+from .stub.stub_search import StubSearch
+from .TestHelper import TestHelper
+
+
+class TestClient(TestHelper):
+    def test_init(self):
+        key = f'stest_{self.random_string(24)}'
+        host = f'{self.random_string(10)}.example.com'
+        timeout = self.random_integer(1, 100)
+
+        client = Client(key, host=host, timeout=timeout)
+        conf = Config()
+
+        assert client.config is not conf
+        assert client.config.stest == key
+        assert client.config.host == host
+        assert client.config.timeout == timeout
+        assert client.config.mode == conf.mode
+
+        # Global configuration is not modified
+        assert conf.stest != key
+        assert conf.host != host
+
+        # Keys are not inherited
+        assert Client().config.stest is None
+
+    def test_init_errors(self):
+        with pytest.raises(StancerValueError):
+            Client('foo')
+
+        with pytest.raises(TypeError, match='"foo" is not a configuration setting.'):
+            Client(foo='bar')
+
+        with pytest.raises(TypeError, match='"pprod" is not a configuration setting.'):
+            Client(pprod='bar')
+
+    def test_pool(self):
+        client = Client()
+        pool = client.config.pool
+
+        assert pool is not Config().pool
+        assert client.config.pool is pool
+
+        client.close()
+
+        assert client.config.pool is not pool
+
+    def test_aclose(self):
+        pytest.importorskip('httpx')
+
+        client = Client()
+        pool = client.config.pool
+        async_pool = client.config.async_pool
+
+        asyncio.run(client.aclose())
+
+        assert client.config.pool is not pool
+        assert client.config.async_pool is not async_pool
+
+    def test_bind(self):
+        host = f'{self.random_string(10)}.example.com'
+        client = Client(host=host)
+        cls = client.bind(StubObject)
+
+        assert issubclass(cls, StubObject)
+        assert cls.__name__ == 'StubObject'
+        assert client.bind(StubObject) is cls
+
+        obj = cls()
+
+        assert obj.uri.startswith(f'https://{host}/')
+        assert StubObject().uri != obj.uri
+
+        # Setters still work on hydration
+        obj.hydrate(string2='foo')
+
+        assert obj.string2 == 'foo'
+        assert obj.is_modified
+
+        # Inner objects use the client too
+        obj.hydrate(card1={'id': self.random_string(29)})
+
+        assert obj.card1.uri.startswith(f'https://{host}/')
+
+    @responses.activate
+    def test_bind_request(self):
+        key = f'stest_{self.random_string(24)}'
+        client = Client(key, host='api.example.com')
+        obj = client.bind(StubObject)(self.random_string(29))
+
+        responses.add(responses.GET, obj.uri, json={'string1': 'bar'})
+
+        sent = Config().pool.stats['requests']
+
+        obj.populate()
+
+        auth = 'Basic ' + base64.b64encode((key + ':').encode()).decode()
+
+        assert obj.string1 == 'bar'
+        assert responses.calls[-1].request.headers['Authorization'] == auth
+        assert client.config.pool.stats['requests'] == 1
+        assert Config().pool.stats['requests'] == sent
+
+    @responses.activate
+    def test_bind_list(self):
+        client = Client(f'stest_{self.random_string(24)}', host='api.example.com')
+        cls = client.bind(StubSearch)
+
+        with open('./tests/fixtures/stub/list.json') as opened_file:
+            responses.add(responses.GET, cls().uri, body=opened_file.read())
+
+        item = next(cls.list(limit=2))
+
+        assert isinstance(item, StubSearch)
+        assert item.uri.startswith('https://api.example.com/')
+
+    @responses.activate
+    def test_use(self):
+        key = f'stest_{self.random_string(24)}'
+        client = Client(key)
+        obj = StubObject()
+
+        with client.use() as current:
+            assert current is client
+            assert Config() is client.config
+
+            responses.add(responses.POST, obj.uri, json={'id': self.random_string(29)})
+
+            obj.string2 = self.random_string(10)
+            obj.send()
+
+        assert Config() is not client.config
+
+        auth = 'Basic ' + base64.b64encode((key + ':').encode()).decode()
+
+        assert responses.calls[0].request.headers['Authorization'] == auth
+
+    def test_use_tasks(self):
+        clients = [Client(host=f'host{idx}.example.com') for idx in range(3)]
+
+        async def task(client):
+            with client.use():
+                await asyncio.sleep(0.01)
+
+                return Config().host
+
+        async def run():
+            return await asyncio.gather(*(task(client) for client in clients))
+
+        assert asyncio.run(run()) == [client.config.host for client in clients]
+        assert Config().host == 'api.stancer.com'
@@ -6,7 +6,14 @@ import pytest
 
 from pytz import timezone
 
+from stancer import CircuitBreaker
 from stancer import Config
+from stancer import HedgingPolicy
+from stancer import RateLimiter
+from stancer import RetryPolicy
+from stancer.core import ConnectionPool
+from stancer.core import JsonCodec
+from stancer.core import Urllib3ConnectionPool
 from stancer.exceptions import StancerValueError
 
 from .TestHelper import TestHelper
@@ -16,6 +23,70 @@ class TestConfig(TestHelper):
     def test_class(self):
         assert Config() == Config()
 
+    def test_circuit_breaker(self):
+        obj = Config()
+        breaker = CircuitBreaker()
+
+        assert obj.circuit_breaker is None
+
+        obj.circuit_breaker = breaker
+
+        assert obj.circuit_breaker is breaker
+
+        # Delete will put it on default
+        del obj.circuit_breaker
+
+        assert obj.circuit_breaker is None
+
+    def test_coalesce(self):
+        obj = Config()
+
+        assert obj.coalesce is True
+
+        obj.coalesce = False
+
+        assert obj.coalesce is False
+
+        # Delete will put it on default
+        del obj.coalesce
+
+        assert obj.coalesce is True
+
+    def test_compression_threshold(self):
+        obj = Config()
+        threshold = self.random_integer(1, 10000)
+
+        assert obj.compression_threshold is None
+
+        obj.compression_threshold = threshold
+
+        assert obj.compression_threshold == threshold
+
+        # Delete will put it on default
+        del obj.compression_threshold
+
+        assert obj.compression_threshold is None
+
+    def test_copy(self):
+        obj = Config()
+        obj.timeout = self.random_integer(1, 100)
+        pool = obj.pool
+
+        copy = obj.copy()
+
+        assert isinstance(copy, Config)
+        assert copy is not obj
+        assert copy.timeout == obj.timeout
+        assert copy.stest is None
+        assert obj.stest is not None
+        assert copy.pool is not pool
+
+        copy.timeout = obj.timeout + 1
+
+        assert copy.timeout != obj.timeout
+
+        del obj.timeout
+
     def test_default_timezone(self):
         obj = Config()
         tz = timezone('Europe/Paris')
@@ -32,6 +103,21 @@ class TestConfig(TestHelper):
         assert isinstance(obj.default_timezone, datetime.tzinfo)
         assert obj.default_timezone == datetime.timezone.utc
 
+    def test_hedging(self):
+        obj = Config()
+        policy = HedgingPolicy()
+
+        assert obj.hedging is None
+
+        obj.hedging = policy
+
+        assert obj.hedging is policy
+
+        # Delete will put it on default
+        del obj.hedging
+
+        assert obj.hedging is None
+
     def test_host(self):
         obj = Config()
         host = f'{self.random_string(15)}.{self.random_string(2)}'
@@ -47,6 +133,46 @@ class TestConfig(TestHelper):
 
         assert obj.host == 'api.stancer.com'
 
+    def test_json_codec(self):
+        obj = Config()
+        codec = JsonCodec()
+        default = type(obj.json_codec)
+
+        assert isinstance(obj.json_codec, JsonCodec)
+
+        obj.json_codec = codec
+
+        assert obj.json_codec is codec
+
+        # Delete will put it on default
+        del obj.json_codec
+
+        assert type(obj.json_codec) is default
+
+    def test_keep_alive(self):
+        obj = Config()
+        keep_alive = self.random_integer(1, 1000)
+        pool = obj.pool
+
+        assert obj.keep_alive == 60
+        assert pool.keep_alive == 60
+
+        obj.keep_alive = keep_alive
+
+        assert obj.keep_alive == keep_alive
+        assert obj.pool is not pool
+        assert obj.pool.keep_alive == keep_alive
+
+        obj.keep_alive = None
+
+        assert obj.keep_alive is None
+        assert obj.pool.keep_alive is None
+
+        # Delete will put it on default
+        del obj.keep_alive
+
+        assert obj.keep_alive == 60
+
     def test_keys(self):
         obj = Config()
         pprod = f'pprod_{self.random_string(24)}'
@@ -187,6 +313,58 @@ class TestConfig(TestHelper):
 
         assert obj.mode == Config.TEST_MODE
 
+    def test_pool(self):
+        obj = Config()
+        pool = obj.pool
+
+        assert isinstance(pool, ConnectionPool)
+        assert obj.pool is pool
+        assert pool.connections == obj.pool_connections
+        assert pool.maxsize == obj.pool_maxsize
+        assert pool.keep_alive == obj.keep_alive
+
+        del obj.pool
+
+        assert obj.pool is not pool
+
+    def test_pool_connections(self):
+        obj = Config()
+        connections = self.random_integer(1, 100)
+        pool = obj.pool
+
+        assert obj.pool_connections == 10
+
+        obj.pool_connections = connections
+
+        assert obj.pool_connections == connections
+        assert obj.pool is not pool
+        assert obj.pool.connections == connections
+
+        # Delete will put it on default
+        del obj.pool_connections
+
+        assert obj.pool_connections == 10
+        assert obj.pool.connections == 10
+
+    def test_pool_maxsize(self):
+        obj = Config()
+        maxsize = self.random_integer(1, 100)
+        pool = obj.pool
+
+        assert obj.pool_maxsize == 10
+
+        obj.pool_maxsize = maxsize
+
+        assert obj.pool_maxsize == maxsize
+        assert obj.pool is not pool
+        assert obj.pool.maxsize == maxsize
+
+        # Delete will put it on default
+        del obj.pool_maxsize
+
+        assert obj.pool_maxsize == 10
+        assert obj.pool.maxsize == 10
+
     def test_port(self):
         obj = Config()
         port = self.random_integer(100, 65535)
@@ -227,6 +405,21 @@ class TestConfig(TestHelper):
         del obj.keys
         obj.keys = previous_keys
 
+    def test_rate_limiter(self):
+        obj = Config()
+        limiter = RateLimiter()
+
+        assert obj.rate_limiter is None
+
+        obj.rate_limiter = limiter
+
+        assert obj.rate_limiter is limiter
+
+        # Delete will put it on default
+        del obj.rate_limiter
+
+        assert obj.rate_limiter is None
+
     @pytest.mark.parametrize(
         'key, mode, prefix',
         TestHelper.api_key_provider(),
@@ -259,6 +452,21 @@ class TestConfig(TestHelper):
         del obj.keys
         obj.keys = previous_keys
 
+    def test_retry(self):
+        obj = Config()
+        policy = RetryPolicy()
+
+        assert obj.retry is None
+
+        obj.retry = policy
+
+        assert obj.retry is policy
+
+        # Delete will put it on default
+        del obj.retry
+
+        assert obj.retry is None
+
     def test_secret_key(self):
         obj = Config()
         pprod = f'pprod_{self.random_string(24)}'
@@ -285,6 +493,21 @@ class TestConfig(TestHelper):
         del obj.keys
         obj.keys = previous_keys
 
+    def test_scope(self):
+        obj = Config()
+        copy = obj.copy()
+
+        with copy.scope() as scoped:
+            assert scoped is copy
+            assert Config() is copy
+
+            with obj.scope():
+                assert Config() is obj
+
+            assert Config() is copy
+
+        assert Config() is obj
+
     def test_timeout(self):
         obj = Config()
         timeout = self.random_integer(1, 1000)
@@ -300,6 +523,24 @@ class TestConfig(TestHelper):
 
         assert obj.timeout is None
 
+    def test_transport(self):
+        obj = Config()
+        pool = obj.pool
+
+        assert obj.transport is ConnectionPool
+
+        obj.transport = Urllib3ConnectionPool
+
+        assert obj.transport is Urllib3ConnectionPool
+        assert isinstance(obj.pool, Urllib3ConnectionPool)
+        assert obj.pool is not pool
+
+        # Delete will put it on default
+        del obj.transport
+
+        assert obj.transport is ConnectionPool
+        assert isinstance(obj.pool, ConnectionPool)
+
     def test_version(self):
         obj = Config()
         version = self.random_integer(1, 20)
@@ -3,9 +3,12 @@
 import pytest
 
 from requests import Response
+from requests import Timeout
 
 from stancer.exceptions import BadRequestError
+from stancer.exceptions import CircuitOpenError
 from stancer.exceptions import ConflictError
+from stancer.exceptions import DeadlineExceededError
 from stancer.exceptions import ForbiddenError
 from stancer.exceptions import GoneError
 from stancer.exceptions import HTTPError
@@ -55,6 +58,7 @@ from stancer.exceptions import StancerNotImplementedError
 from stancer.exceptions import StancerTypeError
 from stancer.exceptions import StancerValueError
 from stancer.exceptions import StancerWarning
+from stancer.exceptions import TooManyRequestsError
 from stancer.exceptions import UnauthorizedError
 
 from .TestHelper import TestHelper
@@ -183,6 +187,21 @@ class TestExceptions(TestHelper):
     def test_stancer_http_server_error(self):
         assert issubclass(StancerHTTPServerError, StancerHTTPError)
 
+    def test_circuit_open_error(self):
+        assert issubclass(CircuitOpenError, StancerHTTPError)
+
+        host = self.random_string(10)
+        obj = CircuitOpenError(host, 5)
+
+        assert obj.host == host
+        assert obj.retry_after == 5
+        assert obj.response is None
+        assert str(obj) == f'Circuit open for "{host}", API calls are rejected.'
+
+    def test_deadline_exceeded_error(self):
+        assert issubclass(DeadlineExceededError, StancerException)
+        assert issubclass(DeadlineExceededError, Timeout)
+
     def test_bad_request_error(self):
         assert issubclass(BadRequestError, StancerHTTPClientError)
         assert BadRequestError.status_code == 400
@@ -240,6 +259,25 @@ class TestExceptions(TestHelper):
         assert GoneError.status_code == 410
         assert GoneError.reason == 'Gone'
 
+    def test_too_many_requests_error(self):
+        assert issubclass(TooManyRequestsError, StancerHTTPClientError)
+        assert TooManyRequestsError.status_code == 429
+        assert TooManyRequestsError.reason == 'Too Many Requests'
+
+        res = Response()
+        res.status_code = 429
+        res.headers['Retry-After'] = '12'
+        res.json = dict
+
+        obj = StancerHTTPError(res)
+
+        assert isinstance(obj, TooManyRequestsError)
+        assert obj.retry_after == 12
+
+        del res.headers['Retry-After']
+
+        assert StancerHTTPError(res).retry_after is None
+
     def test_internal_server_error(self):
         assert issubclass(InternalServerError, StancerHTTPServerError)
         assert InternalServerError.status_code == 500
@@ -1,6 +1,9 @@
 """Test payment object"""
 
+import asyncio
 import json
+import threading
+import time
 import uuid
 
 from datetime import date
@@ -9,6 +12,7 @@ from datetime import timezone
 from datetime import tzinfo
 
 import pytest
+import requests
 import responses
 
 from pytz import timezone as tz
@@ -22,6 +26,7 @@ from stancer import Device
 from stancer import Payment
 from stancer import PaymentStatus
 from stancer import Refund
+from stancer import RetryPolicy
 from stancer import Sepa
 from stancer.core import AbstractAmount
 from stancer.core import AbstractCountry
@@ -30,6 +35,8 @@ from stancer.core import AbstractSearch
 from stancer.core.payment import PaymentPage
 from stancer.core.payment import PaymentRefund
 from stancer.core.payment.auth import PaymentAuth
+from stancer.exceptions import BadRequestError
+from stancer.exceptions import ConflictError
 from stancer.exceptions import InvalidAmountError
 from stancer.exceptions import InvalidAuthError
 from stancer.exceptions import InvalidCardError
@@ -347,6 +354,50 @@ class TestPayment(TestHelper):
         assert obj.is_populated
         assert len(responses.calls) == 1
 
+    def test_alist(self, monkeypatch):
+        obj = Payment()
+        order_id = self.random_string(10)
+
+        with open('./tests/fixtures/payment/read.json') as opened_file:
+            payment_content = json.load(opened_file)
+
+        page = {
+            'live_mode': False,
+            'payments': [payment_content],
+            'range': {'has_more': False, 'limit': 10, 'start': 0},
+        }
+
+        calls = self.mock_async_api(monkeypatch, ('GET', obj.uri, 200, page))
+
+        with pytest.raises(
+            InvalidSearchFilter,
+            match='A valid order ID must be between 1 and 36 characters.',
+        ):
+            Payment.alist(order_id='')
+
+        async def consume():
+            return [item async for item in Payment.alist(order_id=order_id)]
+
+        items = asyncio.run(consume())
+
+        assert len(items) == 1
+        assert isinstance(items[0], Payment)
+        assert items[0].id == payment_content['id']
+        assert items[0].amount == payment_content['amount']
+        assert calls[0].url.params['order_id'] == order_id
+
+    def test_adelete(self):
+        obj = Payment(self.random_string(29))
+
+        with pytest.raises(
+            StancerNotImplementedError,
+            match=(
+                'You are not allowed to delete a payment, '
+                'you need to refund it instead.'
+            ),
+        ):
+            asyncio.run(obj.adelete())
+
     def test_delete(self):
         obj = Payment(self.random_string(29))
 
@@ -449,6 +500,61 @@ class TestPayment(TestHelper):
         ):
             Payment.filter_list_params(unique_id=self.random_integer(10))
 
+    @responses.activate
+    def test_list_lazy(self):
+        with open('./tests/fixtures/payment/read.json') as opened_file:
+            item = json.load(opened_file)
+
+        with open('./tests/fixtures/refund/read.json') as opened_file:
+            refund = json.load(opened_file)
+
+        item['created'] = int(item['created'])
+        item['customer'] = {'id': f'cust_{self.random_string(24)}', 'name': 'Name'}
+        item['refunds'] = [refund]
+
+        responses.add(
+            responses.GET,
+            Payment().uri,
+            json={
+                'live_mode': False,
+                'payments': [item],
+                'range': {'has_more': False, 'limit': 10, 'start': 0},
+            },
+        )
+
+        [eager] = Payment.list(limit=10)
+        [lazy] = Payment.list(limit=10, lazy=True)
+
+        assert len(responses.calls) == 2
+        assert lazy.id == item['id']
+
+        # Only read fields are hydrated
+        assert lazy.amount == 3406
+        assert lazy._data == {'amount': 3406}
+        assert lazy.created == eager.created
+        assert lazy.card.last4 == '4242'
+        assert lazy.card.is_populated is False
+        assert lazy.refunds[0].amount == refund['amount']
+        assert lazy.live_mode is False
+        assert 'customer' not in lazy._data
+
+        # Everything else behaves like an eager object
+        assert lazy.__dict__.keys() == eager.__dict__.keys()
+        assert repr(lazy).split(' at ')[0] == repr(eager).split(' at ')[0]
+        assert lazy.is_modified == eager.is_modified
+        assert lazy.to_json_repr() == eager.to_json_repr()
+        assert lazy._raw is None
+        assert len(responses.calls) == 2
+
+        # Modifying an object hydrates it first
+        [lazy] = Payment.list(limit=10, lazy=True)
+
+        lazy.description = 'Modified'
+
+        assert lazy._raw is None
+        assert lazy.customer.name == 'Name'
+        assert lazy.description == 'Modified'
+
     def test_hydrate(self):
         obj = Payment()
 
@@ -713,6 +819,68 @@ class TestPayment(TestHelper):
 
         config.keys = keys
 
+    def test_arefund(self, monkeypatch):
+        with open('./tests/fixtures/payment/read-no-card.json') as opened_file:
+            payment_content = json.load(opened_file)
+
+        with open('./tests/fixtures/refund/read.json') as opened_file:
+            refund1_content = json.load(opened_file)
+
+        with open('./tests/fixtures/refund/read.json') as opened_file:
+            refund2_content = json.load(opened_file)
+
+        obj = Payment(payment_content['id'])
+
+        paid = payment_content['amount']
+
+        refund1_amount = self.random_integer(50, paid - 50)
+        refund1_content['amount'] = refund1_amount
+        ref = Refund()
+
+        refund2_amount = paid - refund1_amount
+        refund2_content['amount'] = refund2_amount
+        refund2_content['id'] = f'refd_{self.random_string(24)}'
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 200, payment_content),
+            ('POST', ref.uri, 200, refund1_content),
+            ('POST', ref.uri, 200, refund2_content),
+        )
+
+        refund1 = asyncio.run(obj.arefund(refund1_amount))
+
+        assert isinstance(refund1, Refund)
+        assert len(calls) == 2
+        assert calls[0].method == 'GET'
+        assert calls[1].method == 'POST'
+        assert json.loads(calls[1].content) == {
+            'amount': refund1_amount,
+            'payment': obj.id,
+        }
+
+        assert len(obj.refunds) == 1
+        assert refund1.id == refund1_content['id']
+        assert refund1.amount == refund1_amount
+        assert obj.refunds[0] == refund1
+
+        with pytest.raises(InvalidAmountError):
+            asyncio.run(obj.arefund(paid))
+
+        with pytest.raises(InvalidAmountError):
+            asyncio.run(obj.arefund(self.random_integer(1, 49)))
+
+        assert len(calls) == 2
+
+        refund2 = asyncio.run(obj.arefund())
+
+        assert isinstance(refund2, Refund)
+        assert len(calls) == 3
+        assert len(obj.refunds) == 2
+        assert refund2.amount == refund2_amount
+        assert obj.refunds[1] == refund2
+        assert obj.is_not_modified
+
     @responses.activate
     def test_refund(self):
         with open('./tests/fixtures/payment/read-no-card.json') as opened_file:
@@ -779,6 +947,66 @@ class TestPayment(TestHelper):
 
         assert obj.is_not_modified
 
+    @responses.activate
+    def test_refund_totals(self):
+        uids = [f'refd_{self.random_string(24)}' for _ in range(3)]
+        obj = Payment(f'paym_{self.random_string(24)}')
+
+        obj.hydrate(
+            amount=1000,
+            refunds=[
+                {'id': uids[0], 'amount': 100, 'status': 'refunded'},
+                {'id': uids[1], 'amount': 200, 'status': 'to_refund'},
+                {'id': uids[2], 'amount': 300, 'status': 'to_refund'},
+            ],
+        )
+
+        assert obj.refund_totals == {'refunded': 100, 'to_refund': 500}
+        assert obj.refunded_amount == 600
+        assert obj.refundable_amount == 400
+
+        # Merged refunds only move their own amount
+        obj.hydrate(refunds=[{'id': uids[1], 'status': 'refunded'}])
+
+        assert obj.refund_totals == {'refunded': 300, 'to_refund': 300}
+        assert obj.refunded_amount == 600
+
+        # Refunds changed in place are counted again
+        refund = obj.refunds[2]
+
+        refund.hydrate(status='refunded')
+
+        assert obj.refund_totals == {'refunded': 600}
+        assert obj.refunded_amount == 600
+
+        responses.add(
+            responses.GET,
+            refund.uri,
+            json={'id': uids[2], 'amount': 300, 'status': 'failed'},
+        )
+
+        refund.populate()
+
+        assert obj.refund_totals == {'failed': 300, 'refunded': 300}
+        assert len(responses.calls) == 1
+
+        # Refunds without amount are populated once
+        uid = f'refd_{self.random_string(24)}'
+        refund = Refund(uid)
+
+        responses.add(
+            responses.GET,
+            refund.uri,
+            json={'id': uid, 'amount': 150, 'status': 'not_honored'},
+        )
+
+        obj.hydrate(refunds=[uid])
+
+        assert obj.refunded_amount == 750
+        assert obj.refund_totals['not_honored'] == 150
+        assert obj.refunded_amount == 750
+        assert len(responses.calls) == 2
+
     @responses.activate
     def test_refundable_amount(self):
         with open('./tests/fixtures/payment/read.json') as opened_file:
@@ -903,6 +1131,366 @@ class TestPayment(TestHelper):
         assert obj.is_populated
         assert len(responses.calls) == 1
 
+    def test_asend_with_card(self, monkeypatch):
+        obj = Payment()
+
+        card = Card()
+        card.cvc = self.random_string(3)
+        card.exp_month = self.random_integer(1, 12)
+        card.exp_year = self.random_year()
+        card.number = '4111111111111111'
+
+        with open('./tests/fixtures/payment/create-card.json') as opened_file:
+            content = json.load(opened_file)
+
+        calls = self.mock_async_api(monkeypatch, ('POST', obj.uri, 200, content))
+
+        with pytest.raises(
+            InvalidAmountError,
+            match='You must provide an amount before sending a payment.',
+        ):
+            asyncio.run(obj.asend())
+
+        obj.amount = self.random_integer(50, 999999)
+
+        with pytest.raises(
+            InvalidCurrencyError,
+            match='You must provide a currency before sending a payment.',
+        ):
+            asyncio.run(obj.asend())
+
+        assert len(calls) == 0
+
+        obj.currency = 'eur'
+        obj.card = card
+
+        assert asyncio.run(obj.asend()) == obj
+        assert len(calls) == 1
+        assert calls[0].method == 'POST'
+
+        # Data from fixture
+        assert obj.id == 'paym_KIVaaHi7G8QAYMQpQOYBrUQE'
+        assert obj.amount == 100
+        assert obj.card == card
+        assert card.id == 'card_xognFbZs935LMKJYeHyCAYUd'
+        assert obj.is_not_modified
+
+    def _in_doubt_payment(self):
+        card = Card()
+        card.cvc = self.random_string(3)
+        card.exp_month = self.random_integer(1, 12)
+        card.exp_year = self.random_year()
+        card.number = '4111111111111111'
+
+        obj = Payment()
+        obj.amount = self.random_integer(50, 999999)
+        obj.currency = 'eur'
+        obj.card = card
+        obj.unique_id = self.random_string(36)
+
+        return obj
+
+    @responses.activate
+    def test_send_in_doubt(self, monkeypatch):
+        with open('./tests/fixtures/payment/read.json') as opened_file:
+            content = json.load(opened_file)
+
+        conf = Config()
+        conf.retry = RetryPolicy()
+        delays = []
+
+        monkeypatch.setattr('stancer.payment.sleep', delays.append)
+        monkeypatch.setattr('stancer.core.request.sleep', delays.append)
+
+        obj = self._in_doubt_payment()
+        location = obj.uri
+        page = {
+            'live_mode': False,
+            'payments': [content],
+            'range': {'has_more': False, 'limit': 10, 'start': 0},
+        }
+
+        # The payment was created but we did not get the response
+        responses.add(responses.POST, location, body=requests.ConnectionError())
+        responses.add(responses.GET, location, json=page)
+        responses.add(responses.GET, f'{location}/{content["id"]}', json=content)
+
+        assert obj.send() == obj
+        assert obj.id == content['id']
+        assert obj.status == content['status']
+        assert obj.is_not_modified
+
+        methods = [call.request.method for call in responses.calls]
+
+        assert methods == ['POST', 'GET', 'GET']
+        assert f'unique_id={obj.unique_id}' in responses.calls[1].request.url
+        assert len(delays) == 1
+
+        # The payment was not created, we send it again
+        responses.reset()
+
+        with open('./tests/fixtures/payment/create-card.json') as opened_file:
+            created = json.load(opened_file)
+
+        obj = self._in_doubt_payment()
+
+        responses.add(responses.POST, location, status=502)
+        responses.add(responses.GET, location, status=404)
+        responses.add(responses.POST, location, json=created)
+
+        assert obj.send() == obj
+        assert obj.id == created['id']
+
+        methods = [call.request.method for call in responses.calls]
+
+        assert methods == ['POST', 'GET', 'POST']
+        assert responses.calls[0].request.body == responses.calls[2].request.body
+
+        # Without unique ID, no resolution
+        responses.reset()
+
+        obj = self._in_doubt_payment()
+        del obj._data['unique_id']
+
+        responses.add(responses.POST, location, body=requests.Timeout())
+
+        with pytest.raises(requests.Timeout):
+            obj.send()
+
+        assert len(responses.calls) == 1
+
+        # Definitive errors are not resolved
+        responses.reset()
+
+        obj = self._in_doubt_payment()
+
+        responses.add(responses.POST, location, status=409)
+
+        with pytest.raises(ConflictError):
+            obj.send()
+
+        assert len(responses.calls) == 1
+
+        del conf.retry
+
+    def test_asend_in_doubt(self, monkeypatch):
+        httpx = pytest.importorskip('httpx')
+
+        with open('./tests/fixtures/payment/read.json') as opened_file:
+            content = json.load(opened_file)
+
+        conf = Config()
+        conf.retry = RetryPolicy(backoff=0)
+
+        obj = self._in_doubt_payment()
+        location = obj.uri
+        page = {
+            'live_mode': False,
+            'payments': [content],
+            'range': {'has_more': False, 'limit': 10, 'start': 0},
+        }
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('POST', location, 0, httpx.ReadTimeout('timeout')),
+            ('GET', location, 200, page),
+            ('GET', f'{location}/{content["id"]}', 200, content),
+        )
+
+        assert asyncio.run(obj.asend()) == obj
+        assert obj.id == content['id']
+        assert [call.method for call in calls] == ['POST', 'GET', 'GET']
+        assert calls[1].url.params['unique_id'] == obj.unique_id
+
+        del conf.retry
+
+    def _bulk_payments(self, count):
+        payments = []
+
+        for _ in range(count):
+            obj = Payment()
+            obj.amount = self.random_integer(50, 999999)
+            obj.currency = 'eur'
+            obj.description = self.random_string(10)
+
+            payments.append(obj)
+
+        return payments
+
+    @responses.activate
+    def test_send_many(self):
+        payments = self._bulk_payments(6)
+        location = payments[0].uri
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        # Missing its amount, it is never sent
+        del payments[2]._data['amount']
+
+        # Rejected by the API
+        payments[4].description = 'rejected'
+
+        def reply(request):
+            body = json.loads(request.body)
+
+            with lock:
+                running.append(None)
+                peak.append(len(running))
+
+            time.sleep(0.02)
+
+            with lock:
+                running.pop()
+
+            if body['description'] == 'rejected':
+                return (400, {}, json.dumps({'error': {'message': 'Rejected'}}))
+
+            created = {'id': f'paym_{self.random_string(24)}', **body}
+
+            return (200, {}, json.dumps(created))
+
+        responses.add_callback(responses.POST, location, callback=reply)
+
+        reported = []
+        results = Payment.send_many(
+            iter(payments),
+            concurrency=2,
+            callback=lambda payment, error: reported.append((payment, error)),
+        )
+
+        results = list(results)
+
+        assert [payment for payment, _ in results] == payments
+        assert len(responses.calls) == 5
+        assert max(peak) == 2
+
+        for idx, (payment, error) in enumerate(results):
+            if idx == 2:
+                assert isinstance(error, InvalidAmountError)
+                assert payment.id is None
+            elif idx == 4:
+                assert isinstance(error, BadRequestError)
+                assert payment.id is None
+            else:
+                assert error is None
+                assert payment.id.startswith('paym_')
+                assert payment.is_not_modified
+
+        # The invalid payment is reported first, before anything is sent
+        assert reported[0] == results[2]
+        assert sorted(reported, key=lambda item: id(item[0])) == sorted(
+            results, key=lambda item: id(item[0])
+        )
+        assert list(Payment.send_many([])) == []
+
+    @responses.activate
+    def test_send_many_errors(self, monkeypatch):
+        payments = self._bulk_payments(2)
+        devices = []
+
+        def create_device(payment):
+            devices.append(payment)
+
+            return payment
+
+        monkeypatch.setattr(Payment, '_create_device', create_device)
+
+        responses.add(
+            responses.POST,
+            payments[0].uri,
+            json={'id': f'paym_{self.random_string(24)}'},
+        )
+        responses.add(responses.POST, payments[0].uri, body=RuntimeError('Bug'))
+
+        results = Payment.send_many(payments, concurrency=1)
+
+        assert next(results) == (payments[0], None)
+
+        # Only API and connection errors are given with their payment
+        with pytest.raises(RuntimeError, match='Bug'):
+            next(results)
+
+        # Device data is only added when sending, once per payment
+        assert devices == payments
+
+    def test_asend_many(self, monkeypatch):
+        payments = self._bulk_payments(3)
+        location = payments[0].uri
+        reported = []
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('POST', location, 200, {'id': f'paym_{self.random_string(24)}'}),
+            ('POST', location, 400, {'error': {'message': 'Rejected'}}),
+            ('POST', location, 200, {'id': f'paym_{self.random_string(24)}'}),
+        )
+
+        async def run():
+            results = Payment.asend_many(
+                payments,
+                concurrency=1,
+                callback=lambda payment, error: reported.append(payment),
+            )
+
+            return [result async for result in results]
+
+        results = asyncio.run(run())
+
+        assert [payment for payment, _ in results] == payments
+        assert results[0][1] is None
+        assert isinstance(results[1][1], BadRequestError)
+        assert results[2][1] is None
+        assert payments[0].id is not None
+        assert payments[2].id is not None
+        assert reported == payments
+        assert len(calls) == 3
+
+    def test_asend_update(self, monkeypatch):
+        with open('./tests/fixtures/payment/read.json') as opened_file:
+            content = json.load(opened_file)
+
+        obj = Payment(content['id'])
+        description = self.random_string(20)
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 200, content),
+            ('PATCH', obj.uri, 200, {**content, 'description': description}),
+        )
+
+        # Not populated yet, the change is kept over the API data
+        obj.description = description
+
+        assert asyncio.run(obj.asend()) == obj
+        assert [call.method for call in calls] == ['GET', 'PATCH']
+        assert json.loads(calls[1].content) == {'description': description}
+        assert obj.description == description
+        assert obj.is_not_modified
+
+    @responses.activate
+    def test_send_update(self):
+        with open('./tests/fixtures/payment/read.json') as opened_file:
+            content = json.load(opened_file)
+
+        obj = Payment(content['id'])
+        description = self.random_string(20)
+
+        responses.add(responses.GET, obj.uri, json=content)
+        responses.add(
+            responses.PATCH, obj.uri, json={**content, 'description': description}
+        )
+
+        obj.description = description
+
+        assert obj.send() == obj
+        assert [call.request.method for call in responses.calls] == ['GET', 'PATCH']
+        assert json.loads(responses.calls[1].request.body) == {
+            'description': description
+        }
+        assert obj.description == description
+        assert obj.is_not_modified
+
     @responses.activate
     def test_send_with_card(self):
         obj = Payment()
@@ -1,8 +1,12 @@
 """Test abstract object"""
 
+import asyncio
 import base64
 import json
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timezone
 from datetime import tzinfo
@@ -21,6 +25,100 @@ from .TestHelper import TestHelper
 
 
 class TestStubObject(TestHelper):
+    def test_adelete(self, monkeypatch):
+        obj = StubObject(self.random_string(29))
+        calls = self.mock_async_api(monkeypatch, ('DELETE', obj.uri, 204, None))
+
+        assert asyncio.run(obj.adelete()) == obj
+        assert len(calls) == 1
+        assert obj.id is None
+        assert obj.is_modified
+
+    def test_apopulate(self, monkeypatch):
+        obj = StubObject(self.random_string(29))
+
+        params = {
+            'string1': self.random_string(10),
+            'integer1': self.random_integer(10, 100),
+            'card1': {
+                'number': '4242424242424242',
+            },
+            'created': 1546867615,
+        }
+
+        calls = self.mock_async_api(monkeypatch, ('GET', obj.uri, 200, params))
+
+        obj.force_modified('id')
+
+        assert asyncio.run(obj.apopulate()) == obj
+        assert obj.is_populated
+        assert obj.is_not_modified
+        assert len(calls) == 1
+
+        assert obj.string1 == params['string1']
+        assert obj.integer1 == params['integer1']
+        assert isinstance(obj.card1, Card)
+        assert obj.card1.number == params['card1']['number']
+        assert obj.created.timestamp() == params['created']
+
+        # Already populated, no more calls
+        asyncio.run(obj.apopulate())
+
+        assert len(calls) == 1
+
+    def test_apopulate_concurrent(self, monkeypatch):
+        obj = StubObject(self.random_string(29))
+        calls = self.mock_async_api(
+            monkeypatch, ('GET', obj.uri, 200, {'string1': 'ok'})
+        )
+
+        async def run():
+            await asyncio.gather(*(obj.apopulate() for _ in range(5)))
+
+        asyncio.run(run())
+
+        assert len(calls) == 1
+        assert obj.is_populated
+        assert obj.string1 == 'ok'
+
+    def test_asend(self, monkeypatch):
+        obj = StubObject()
+        uid = self.random_string(29)
+
+        obj.hydrate(string1=self.random_string(10))
+        obj.string2 = self.random_string(20)
+
+        location = obj.uri
+        obj_repr = obj.to_json()
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('POST', location, 200, {'id': uid}),
+            ('PATCH', f'{location}/{uid}', 200, {'id': uid}),
+        )
+
+        assert asyncio.run(obj.asend()) == obj
+        assert obj.id == uid
+        assert obj.is_not_modified
+        assert len(calls) == 1
+        assert calls[0].method == 'POST'
+        assert calls[0].content == obj_repr.encode()
+
+        # Multiple send will not trigger multiple call
+        asyncio.run(obj.asend())
+
+        assert len(calls) == 1
+
+        # Modified object allows new calls
+        obj.string2 = self.random_string(20)
+        obj_repr = obj.to_json()
+
+        asyncio.run(obj.asend())
+
+        assert len(calls) == 2
+        assert calls[1].method == 'PATCH'
+        assert calls[1].content == obj_repr.encode()
+
     def test__dict__(self):
         obj = StubObject()
 
@@ -386,6 +484,38 @@ class TestStubObject(TestHelper):
 
         assert len(responses.calls) == 1
 
+    @responses.activate
+    def test_populate_concurrent(self):
+        obj = StubObject(self.random_string(29))
+        release = threading.Event()
+        calls = []
+
+        def reply(request):
+            calls.append(request)
+            release.wait(5)
+
+            return (200, {}, '{"string1": "ok"}')
+
+        responses.add_callback(responses.GET, obj.uri, callback=reply)
+
+        Config().coalesce = False  # Only the object lock prevents a second call
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(lambda: obj.string1) for _ in range(5)]
+
+            while len(calls) < 1:
+                time.sleep(0.01)
+
+            time.sleep(0.1)
+            release.set()
+
+            # Every thread waited for the data
+            assert [future.result() for future in futures] == ['ok'] * 5
+
+        assert len(calls) == 1
+
+        del Config().coalesce
+
     @responses.activate
     def test_populate_auto(self):
         obj = StubObject(self.random_string(29))
@@ -1,11 +1,20 @@
 """Test abstract object with search"""
 
+import asyncio
+import json
+import threading
+
+from inspect import isasyncgen
 from inspect import isgenerator
+from time import sleep
 from time import time
 
 import pytest
 import responses
 
+from stancer.core import Request
+from stancer.core.async_request import AsyncRequest
+from stancer.core.rate_limit import get_priority
 from stancer.exceptions import InvalidSearchResponse
 
 from .stub.stub_search import StubSearch
@@ -13,6 +22,129 @@ from .TestHelper import TestHelper
 
 
 class TestStubSearch(TestHelper):
+    def test_alist(self, monkeypatch):
+        obj = StubSearch()
+
+        created = int(time()) - self.random_integer(1_000, 2_000)
+        limit = self.random_integer(1, 100)
+        foo = self.random_string(10)
+
+        with open('./tests/fixtures/stub/list.json') as opened_file:
+            page1 = json.load(opened_file)
+
+        page2 = {
+            **page1,
+            'range': {**page1['range'], 'has_more': False, 'start': 2},
+        }
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            ('GET', obj.uri, 200, page1),
+            ('GET', obj.uri, 200, page2),
+        )
+
+        results = StubSearch.alist(created=created, limit=limit, foo=foo)
+
+        assert isasyncgen(results)
+        assert len(calls) == 0
+
+        async def consume():
+            return [item async for item in results]
+
+        items = asyncio.run(consume())
+
+        assert len(items) == 4
+        assert all(isinstance(item, StubSearch) for item in items)
+        assert [item.id for item in items] == [
+            'stub_JnU7xyTGJvxRWZuxvj78qz7e',
+            'stub_p5tjCrXHy93xtVtVqvEJoC1c',
+        ] * 2
+
+        assert len(calls) == 2
+
+        assert calls[0].method == 'GET'
+        assert calls[0].url.params['created'] == str(created)
+        assert calls[0].url.params['limit'] == str(limit)
+        assert calls[0].url.params['foo'] == foo
+        assert 'start' not in calls[0].url.params
+        assert calls[1].url.params['start'] == '2'
+
+    @pytest.mark.parametrize('read_ahead, expected', [(0, 1), (1, 2), (2, 3)])
+    def test_alist_read_ahead(self, monkeypatch, read_ahead, expected):
+        obj = StubSearch()
+
+        with open('./tests/fixtures/stub/list.json') as opened_file:
+            page = json.load(opened_file)
+
+        calls = self.mock_async_api(
+            monkeypatch,
+            *[('GET', obj.uri, 200, page)] * 5,
+        )
+
+        async def consume():
+            results = StubSearch.alist(
+                foo=self.random_string(10), read_ahead=read_ahead
+            )
+
+            item = await anext(results)
+
+            # Let background tasks work
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+            await results.aclose()
+
+            return item
+
+        item = asyncio.run(consume())
+
+        assert item.id == 'stub_JnU7xyTGJvxRWZuxvj78qz7e'
+        assert len(calls) == expected
+
+    def test_alist_empty(self, monkeypatch):
+        obj = StubSearch()
+        calls = self.mock_async_api(monkeypatch, ('GET', obj.uri, 404, {}))
+
+        async def consume():
+            return [item async for item in StubSearch.alist(foo='bar')]
+
+        assert asyncio.run(consume()) == []
+        assert len(calls) == 1
+
+    def test_alist_bad_response(self, monkeypatch):
+        obj = StubSearch()
+        self.mock_async_api(
+            monkeypatch,
+            (
+                'GET',
+                obj.uri,
+                200,
+                {self.random_string(2): {}, self.random_string(3): {}},
+            ),
+        )
+
+        async def consume():
+            return [item async for item in StubSearch.alist(foo='bar')]
+
+        with pytest.raises(
+            InvalidSearchResponse,
+            match='Results not found.',
+        ):
+            asyncio.run(consume())
+
+    def test_alist_read_ahead_error(self, monkeypatch):
+        async def get_content(*args, **kwargs):
+            raise RuntimeError('Lost page.')
+
+        monkeypatch.setattr(AsyncRequest, 'get_content', get_content)
+
+        async def consume():
+            # Pages are read ahead by default, the error ends them
+            return [item async for item in StubSearch.alist(foo='bar')]
+
+        with pytest.raises(RuntimeError, match='Lost page.'):
+            asyncio.run(consume())
+
     @responses.activate
     def test_bad_response(self):
         obj = StubSearch()
@@ -159,3 +291,127 @@ class TestStubSearch(TestHelper):
         assert f'start={2}' in api_call.request.url  # 2 => start + limit in response
         assert f'foo={foo}' in api_call.request.url
         assert 'foobar' not in api_call.request.url
+
+    @responses.activate
+    def test_list_exhaustive(self):
+        obj = StubSearch()
+
+        responses.add(responses.GET, obj.uri, status=404)
+
+        list(StubSearch.list(exhaustive=True))
+
+        assert len(responses.calls) == 1
+        assert 'limit=100' in responses.calls[0].request.url
+
+        foo = self.random_string(10)
+
+        list(StubSearch.list(exhaustive=True, foo=foo))
+
+        assert len(responses.calls) == 2
+        assert 'limit=100' in responses.calls[1].request.url
+        assert f'foo={foo}' in responses.calls[1].request.url
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        'params, expected',
+        [({'exhaustive': True}, 'batch'), ({'limit': 10}, 'interactive')],
+    )
+    def test_list_priority(self, monkeypatch, params, expected):
+        get_content = Request.get_content
+        ranks = []
+
+        def spy(request, obj, **kwargs):
+            ranks.append(get_priority())
+
+            return get_content(request, obj, **kwargs)
+
+        monkeypatch.setattr(Request, 'get_content', spy)
+        responses.add(responses.GET, StubSearch().uri, status=404)
+
+        list(StubSearch.list(read_ahead=1, **params))
+
+        assert ranks == [expected]
+        assert get_priority() == 'interactive'
+
+    @responses.activate
+    @pytest.mark.parametrize('read_ahead', [1, 2])
+    def test_list_read_ahead(self, read_ahead):
+        obj = StubSearch()
+
+        with open('./tests/fixtures/stub/list.json') as opened_file:
+            page = json.load(opened_file)
+
+        last = {
+            **page,
+            'range': {**page['range'], 'has_more': False},
+        }
+
+        for _ in range(4):
+            responses.add(responses.GET, obj.uri, json=page)
+
+        responses.add(responses.GET, obj.uri, json=last)
+
+        results = StubSearch.list(foo=self.random_string(10), read_ahead=read_ahead)
+
+        assert isgenerator(results)
+        assert len(responses.calls) == 0
+
+        item = next(results)
+
+        assert item.id == 'stub_JnU7xyTGJvxRWZuxvj78qz7e'
+
+        # Wait for the worker, it must stop after `read_ahead` pages
+        for _ in range(100):
+            if len(responses.calls) > read_ahead:
+                break
+
+            sleep(0.01)
+
+        sleep(0.05)
+
+        assert len(responses.calls) == read_ahead + 1
+
+        items = [item, *results]
+
+        assert len(items) == 10
+        assert len(responses.calls) == 5
+
+        starts = [call.request.url.split('start=')[-1] for call in responses.calls[1:]]
+
+        assert starts == ['2', '2', '2', '2']
+
+    @responses.activate
+    def test_list_read_ahead_error(self):
+        obj = StubSearch()
+
+        responses.add(responses.GET, obj.uri, body='[')
+
+        results = StubSearch.list(foo=self.random_string(10), read_ahead=1)
+
+        with pytest.raises(
+            InvalidSearchResponse,
+            match='Invalid results.',
+        ):
+            next(results)
+
+        responses.reset()
+        responses.add(responses.GET, obj.uri, status=404)
+
+        assert list(StubSearch.list(foo=self.random_string(10), read_ahead=1)) == []
+
+    @pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+    def test_list_read_ahead_interrupted(self, monkeypatch):
+        def get_content(*args, **kwargs):
+            raise SystemExit(1)
+
+        monkeypatch.setattr(Request, 'get_content', get_content)
+
+        results = StubSearch.list(foo=self.random_string(10), read_ahead=1)
+
+        # The worker is stopped, the consumer is not left waiting for a page
+        with pytest.raises(SystemExit):
+            next(results)
+
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread():
+                thread.join(1)